@@ -0,0 +1,414 @@
+"""
+Offline batch processing of recorded session videos.
+
+Splits each video into fixed-size frame chunks and processes them
+across a process pool. Every worker owns its own FaceDetector,
+HandDetector, HeadPoseEstimator and BlinkDetector (EAR only, no
+clicks). Per-frame face landmarks, hand landmarks, head pose and the
+EAR of each eye are written as one columnar file per chunk: Parquet if pyarrow is
+installed, otherwise compressed .npz.
+
+Finished chunks are recorded in <output>/manifest.json, so an
+interrupted run resumes where it stopped. A video whose size or
+modification time changed is processed again. A chunk that raises is
+logged and listed as failed in the manifest, the other chunks carry on,
+and the next run retries it.
+
+Usage:
+    python batch_process.py sessions/*.mp4 --output batch_output
+    python batch_process.py sessions/ --workers 8 --chunk-frames 600 --format npz
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import cv2
+import numpy as np
+
+VIDEO_EXTENSIONS = (".mp4", ".avi", ".mov", ".mkv", ".webm")
+MANIFEST = "manifest.json"
+HAND_POINTS = 21
+
+
+# ---------------------------------------------------------
+# Planning
+# ---------------------------------------------------------
+def find_videos(inputs):
+    """Expand files, directories and glob patterns into a sorted list of videos."""
+    videos = []
+    for item in inputs:
+        if os.path.isdir(item):
+            for root, _, files in os.walk(item):
+                videos.extend(os.path.join(root, f) for f in files
+                              if f.lower().endswith(VIDEO_EXTENSIONS))
+        else:
+            videos.extend(glob.glob(item) or [item])
+    return sorted(set(os.path.abspath(v) for v in videos))
+
+
+def video_id(path):
+    """Stable id for a video file: name plus a hash of path, size and mtime."""
+    stat = os.stat(path)
+    digest = hashlib.sha1(f"{path}|{stat.st_size}|{stat.st_mtime_ns}".encode()).hexdigest()[:10]
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return f"{stem}-{digest}"
+
+
+def plan_chunks(path, chunk_frames):
+    """
+    Returns:
+        List of chunk dicts (video, video_id, start, end, fps)
+    """
+    cap = cv2.VideoCapture(path)
+    if not cap.isOpened():
+        raise RuntimeError(f"Could not open video {path}")
+    frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    cap.release()
+
+    vid = video_id(path)
+    return [
+        dict(video=path, video_id=vid, start=start,
+             end=min(start + chunk_frames, frames), fps=fps)
+        for start in range(0, frames, chunk_frames)
+    ]
+
+
+def chunk_key(chunk):
+    return f"{chunk['video_id']}/{chunk['start']:08d}"
+
+
+class Manifest:
+    """Completed and failed chunks, rewritten atomically after every chunk."""
+
+    def __init__(self, output_dir):
+        self.path = os.path.join(output_dir, MANIFEST)
+        self.entries = {}
+        self.failed = {}
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self.entries = data.get("chunks", {})
+            self.failed = data.get("failed", {})
+
+    def is_done(self, chunk, output_dir):
+        entry = self.entries.get(chunk_key(chunk))
+        return (entry is not None
+                and os.path.exists(os.path.join(output_dir, entry["file"])))
+
+    def mark_done(self, chunk, file, frames, seconds):
+        self.entries[chunk_key(chunk)] = {
+            "video": chunk["video"], "start": chunk["start"], "end": chunk["end"],
+            "file": file, "frames": frames, "seconds": round(seconds, 3),
+        }
+        self.failed.pop(chunk_key(chunk), None)
+        self._save()
+
+    def mark_failed(self, chunk, error):
+        self.failed[chunk_key(chunk)] = {
+            "video": chunk["video"], "start": chunk["start"], "end": chunk["end"],
+            "error": error,
+        }
+        self._save()
+
+    def _save(self):
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"chunks": self.entries, "failed": self.failed}, f, indent=1)
+        os.replace(tmp, self.path)
+
+
+# ---------------------------------------------------------
+# Output formats
+# ---------------------------------------------------------
+def have_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def write_columns(base_path, columns, fmt):
+    """
+    Write equal-length columns to <base_path>.parquet or .npz.
+    2-D/3-D array columns become fixed-size float lists in Parquet.
+
+    Returns:
+        The path written
+    """
+    if fmt == "parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        arrays, names = [], []
+        for name, values in columns.items():
+            if values.ndim == 1:
+                arrays.append(pa.array(values))
+            else:
+                flat = np.ascontiguousarray(values.reshape(len(values), -1))
+                arrays.append(pa.FixedSizeListArray.from_arrays(
+                    pa.array(flat.ravel()), flat.shape[1]))
+            names.append(name)
+        path = base_path + ".parquet"
+        pq.write_table(pa.Table.from_arrays(arrays, names=names), path, compression="zstd")
+    else:
+        path = base_path + ".npz"
+        np.savez_compressed(path, **columns)
+    return path
+
+
+def load_results(output_dir, video=None):
+    """
+    Concatenate the chunks of one video (or of all videos) in frame order.
+
+    Returns:
+        dict of column name -> numpy array
+    """
+    with open(os.path.join(output_dir, MANIFEST), "r", encoding="utf-8") as f:
+        entries = json.load(f)["chunks"]
+    keys = sorted(k for k, e in entries.items()
+                  if video is None or e["video"] == os.path.abspath(video))
+
+    parts = []
+    for key in keys:
+        path = os.path.join(output_dir, entries[key]["file"])
+        if path.endswith(".npz"):
+            with np.load(path) as data:
+                parts.append({k: data[k] for k in data.files})
+        else:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pq.read_table(path)
+            part = {}
+            for name in table.column_names:
+                column = table.column(name).combine_chunks()
+                if pa.types.is_fixed_size_list(column.type):
+                    # (frames, points * 3) -> (frames, points, 3)
+                    values = column.flatten().to_numpy()
+                    part[name] = values.reshape(len(column), -1, 3)
+                else:
+                    part[name] = column.to_numpy(zero_copy_only=False)
+            parts.append(part)
+    if not parts:
+        return {}
+    return {name: np.concatenate([p[name] for p in parts]) for name in parts[0]}
+
+
+# ---------------------------------------------------------
+# Worker
+# ---------------------------------------------------------
+_worker = None
+
+
+def _init_worker(profile_name, mirror):
+    """Build this process's own MediaPipe graphs once."""
+    global _worker
+    # One OpenCV thread per process; the pool provides the parallelism
+    cv2.setNumThreads(1)
+
+    from core.blink_detector import BlinkDetector
+    from core.face_detector import FaceDetector
+    from core.head_pose import HeadPoseEstimator
+    from core.model_profiles import get_profile
+    from hand_gestures.hand_detector import HandDetector
+    from utils.input_backend import RecordingBackend
+
+    profile = get_profile(profile_name)
+    _worker = dict(
+        face=FaceDetector(refine_landmarks=profile.refine_landmarks,
+                          input_scale=profile.input_scale),
+        hands=HandDetector(max_hands=2, model_complexity=profile.model_complexity,
+                           input_scale=profile.input_scale),
+        head_pose=HeadPoseEstimator(),
+        # EAR only: the recording backend swallows any click
+        blink=BlinkDetector(input_backend=RecordingBackend()),
+        face_points=478 if profile.refine_landmarks else 468,
+        mirror=mirror,
+    )
+
+
+def process_chunk(chunk, output_dir, fmt):
+    """
+    Process one chunk in a worker and write its columns.
+
+    Returns:
+        (chunk, file relative to output_dir, frames processed, seconds)
+    """
+    from utils.landmarks import landmarks_to_array
+
+    w_ = _worker
+    w_["face"].reset()
+    w_["hands"].reset()
+
+    started = time.perf_counter()
+    cap = cv2.VideoCapture(chunk["video"])
+    cap.set(cv2.CAP_PROP_POS_FRAMES, chunk["start"])
+
+    n = chunk["end"] - chunk["start"]
+    nan = np.float32("nan")
+    frame_index = np.arange(chunk["start"], chunk["end"], dtype=np.int64)
+    face_detected = np.zeros(n, dtype=bool)
+    pitch = np.full(n, nan, dtype=np.float32)
+    yaw = np.full(n, nan, dtype=np.float32)
+    # Both eyes: winks are one eye closing while the other stays open
+    ear_left = np.full(n, nan, dtype=np.float32)
+    ear_right = np.full(n, nan, dtype=np.float32)
+    face_landmarks = np.full((n, w_["face_points"], 3), nan, dtype=np.float32)
+    right_hand = np.full((n, HAND_POINTS, 3), nan, dtype=np.float32)
+    left_hand = np.full((n, HAND_POINTS, 3), nan, dtype=np.float32)
+
+    count = 0
+    for i in range(n):
+        ok, frame = cap.read()
+        if not ok:
+            break
+        if w_["mirror"]:
+            # Same orientation as the live pipeline
+            frame = cv2.flip(frame, 1)
+        h, w = frame.shape[:2]
+
+        result = w_["face"].process(frame)
+        if result.multi_face_landmarks:
+            landmarks = result.multi_face_landmarks[0].landmark
+            face_detected[i] = True
+            landmarks_to_array(landmarks, out=face_landmarks[i])
+            pitch[i], yaw[i], _ = w_["head_pose"].estimate(landmarks, w, h)
+            ear_left[i], ear_right[i] = w_["blink"].eye_aspect_ratios(landmarks, w, h)
+
+        hands = w_["hands"].detect_hands(frame)
+        if hands.multi_hand_landmarks:
+            for k, hand_landmarks in enumerate(hands.multi_hand_landmarks):
+                label = None
+                if hands.multi_handedness:
+                    label = hands.multi_handedness[k].classification[0].label
+                target = right_hand if label == "Right" else left_hand if label == "Left" else None
+                if target is not None and np.isnan(target[i, 0, 0]):
+                    landmarks_to_array(hand_landmarks.landmark, out=target[i])
+        count += 1
+    cap.release()
+
+    columns = {
+        "frame": frame_index[:count],
+        "timestamp": (frame_index[:count] / chunk["fps"]).astype(np.float64),
+        "face_detected": face_detected[:count],
+        "pitch": pitch[:count],
+        "yaw": yaw[:count],
+        "ear_left": ear_left[:count],
+        "ear_right": ear_right[:count],
+        "face_landmarks": face_landmarks[:count],
+        "right_hand": right_hand[:count],
+        "left_hand": left_hand[:count],
+    }
+    directory = os.path.join(output_dir, chunk["video_id"])
+    os.makedirs(directory, exist_ok=True)
+    path = write_columns(os.path.join(directory, f"chunk_{chunk['start']:08d}"), columns, fmt)
+    return chunk, os.path.relpath(path, output_dir), count, time.perf_counter() - started
+
+
+# ---------------------------------------------------------
+# Driver
+# ---------------------------------------------------------
+def run(videos, output_dir, workers=None, chunk_frames=900, fmt="auto",
+        profile="accurate", mirror=True, force=False, log=print):
+    """
+    Process videos into per-chunk datasets under output_dir.
+
+    Returns:
+        dict with frames, chunks, skipped, failed, seconds and fps
+    """
+    if fmt == "auto":
+        fmt = "parquet" if have_pyarrow() else "npz"
+    elif fmt == "parquet" and not have_pyarrow():
+        raise RuntimeError("--format parquet needs pyarrow (pip install pyarrow)")
+    workers = workers or os.cpu_count() or 1
+    os.makedirs(output_dir, exist_ok=True)
+
+    manifest = Manifest(output_dir)
+    chunks = [c for video in videos for c in plan_chunks(video, chunk_frames)]
+    pending = [c for c in chunks if force or not manifest.is_done(c, output_dir)]
+    log(f"[batch] {len(videos)} videos, {len(chunks)} chunks "
+        f"({len(chunks) - len(pending)} already done), {workers} workers, {fmt}")
+
+    started = time.perf_counter()
+    frames = 0
+    done = 0
+    failed = 0
+    if pending:
+        # spawn: MediaPipe graphs and their threads do not survive fork
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=min(workers, len(pending)), mp_context=context,
+                                 initializer=_init_worker, initargs=(profile, mirror)) as pool:
+            futures = {pool.submit(process_chunk, c, output_dir, fmt): c for c in pending}
+            for future in as_completed(futures):
+                try:
+                    chunk, file, count, seconds = future.result()
+                except Exception as e:
+                    # One bad chunk (corrupt frames, a crashed worker) must not
+                    # lose the rest of the run; it is retried next time
+                    chunk = futures[future]
+                    error = f"{type(e).__name__}: {e}"
+                    manifest.mark_failed(chunk, error)
+                    failed += 1
+                    log(f"[batch] FAILED {chunk_key(chunk)} ({chunk['video']}): {error}")
+                    continue
+                manifest.mark_done(chunk, file, count, seconds)
+                frames += count
+                done += 1
+                elapsed = time.perf_counter() - started
+                log(f"[batch] {done + failed}/{len(pending)} {chunk_key(chunk)}: {count} frames "
+                    f"in {seconds:.1f}s (total {frames / elapsed:.0f} fps)")
+
+    elapsed = time.perf_counter() - started
+    return {
+        "frames": frames,
+        "chunks": done,
+        "skipped": len(chunks) - len(pending),
+        "failed": failed,
+        "seconds": elapsed,
+        "fps": frames / elapsed if elapsed > 0 else 0.0,
+        "format": fmt,
+    }
+
+
+def parse_args(argv=None):
+    from core.model_profiles import PROFILES
+
+    parser = argparse.ArgumentParser(description="Batch landmark/pose/EAR extraction from videos")
+    parser.add_argument("inputs", nargs="+", help="Video files, directories or glob patterns")
+    parser.add_argument("--output", default="batch_output", help="Output directory")
+    parser.add_argument("--workers", type=int, default=None, help="Processes (default: CPU count)")
+    parser.add_argument("--chunk-frames", type=int, default=900, help="Frames per chunk")
+    parser.add_argument("--format", default="auto", choices=["auto", "parquet", "npz"])
+    parser.add_argument("--model-profile", default="accurate", choices=list(PROFILES))
+    parser.add_argument("--no-mirror", action="store_true",
+                        help="Do not flip frames (the live pipeline mirrors them)")
+    parser.add_argument("--force", action="store_true", help="Ignore the manifest and redo all chunks")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    videos = find_videos(args.inputs)
+    if not videos:
+        print("No videos found")
+        return 1
+    stats = run(videos, args.output, workers=args.workers, chunk_frames=args.chunk_frames,
+                fmt=args.format, profile=args.model_profile, mirror=not args.no_mirror,
+                force=args.force)
+    print(f"Done: {stats['frames']} frames in {stats['chunks']} chunks "
+          f"({stats['skipped']} skipped) in {stats['seconds']:.1f}s, {stats['fps']:.0f} fps")
+    if stats["failed"]:
+        print(f"{stats['failed']} chunks failed (see {MANIFEST}); run again to retry them")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1 @@
+# Headless benchmarks and simulators
@@ -0,0 +1,84 @@
+"""
+Per-frame cost of single-hand detection versus two-hand tracking.
+
+Compares, on the same frames:
+  - single:    HandDetector(max_hands=1) on the full frame (the default mode)
+  - two-hands: HandDetector(max_hands=2) on the full frame
+  - tracker:   TwoHandTracker (the max_hands=2 graph + identity association)
+
+Usage:
+    python -m benchmarks.hand_tracking_benchmark --video session.mp4 --frames 300
+    python -m benchmarks.hand_tracking_benchmark --camera 0
+"""
+
+import argparse
+import time
+
+import cv2
+import numpy as np
+
+from hand_gestures.hand_detector import HandDetector
+from hand_gestures.hand_tracker import TwoHandTracker
+
+
+def load_frames(video=None, camera=None, count=300):
+    """Read frames up front so every mode sees identical input."""
+    cap = cv2.VideoCapture(video if video is not None else camera)
+    if not cap.isOpened():
+        raise RuntimeError(f"Could not open {'video ' + video if video else 'camera'}")
+    frames = []
+    while len(frames) < count:
+        ok, frame = cap.read()
+        if not ok:
+            break
+        frames.append(cv2.flip(frame, 1))
+    cap.release()
+    return frames
+
+
+def time_mode(process, frames, warmup=10):
+    for frame in frames[:warmup]:
+        process(frame)
+    times = []
+    for frame in frames[warmup:]:
+        start = time.perf_counter()
+        process(frame)
+        times.append(time.perf_counter() - start)
+    return np.array(times) * 1000.0
+
+
+def run(frames):
+    single = HandDetector(max_hands=1)
+    two = HandDetector(max_hands=2)
+    tracker = TwoHandTracker()
+
+    results = {
+        "single": time_mode(single.detect_hands, frames),
+        "two-hands": time_mode(two.detect_hands, frames),
+        "tracker": time_mode(tracker.process, frames),
+    }
+    return results, tracker
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Two-hand tracking cost benchmark")
+    parser.add_argument("--video", default=None, help="Video file with one or two hands")
+    parser.add_argument("--camera", type=int, default=0)
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args(argv)
+
+    frames = load_frames(args.video, args.camera, args.frames)
+    print(f"Loaded {len(frames)} frames")
+    results, tracker = run(frames)
+
+    baseline = results["single"].mean()
+    print("-" * 60)
+    print(f"{'mode':<12}{'mean ms':>10}{'p95 ms':>10}{'x single':>10}")
+    for name, times in results.items():
+        print(f"{name:<12}{times.mean():>10.2f}{np.percentile(times, 95):>10.2f}"
+              f"{times.mean() / baseline:>10.2f}")
+    print(f"tracker hand acquisitions: {tracker.acquisitions} in {tracker.frames} frames")
+
+
+if __name__ == "__main__":
+    main()
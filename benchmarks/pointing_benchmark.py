@@ -0,0 +1,407 @@
+"""
+Fitts's-law pointing benchmark for CursorController.
+
+Runs the ISO 9241-9 multi-directional target-acquisition task (targets
+on a circle, selected in alternating order) against a virtual screen.
+Head-pose trajectories are either synthesized by a closed-loop simulated
+user or replayed from a recording. They are fed through
+CursorController.update on a simulated clock, and the script reports
+effective throughput (bits/s), movement time, overshoot and jitter.
+
+Selection is by dwell: a target counts as acquired once the cursor has
+stayed inside it for --dwell seconds, and the movement time includes
+the dwell.
+
+Recorded trajectories are CSV files with a header and columns
+t,pitch,yaw,trial. Here `trial` is the index of the target being
+acquired, in task order, for the single --amplitude/--width condition
+given on the command line.
+
+Usage:
+    python -m benchmarks.pointing_benchmark
+    python -m benchmarks.pointing_benchmark --sensitivity-x 15 --amplitudes 300 700 --widths 40 100
+    python -m benchmarks.pointing_benchmark --replay session.csv --amplitude 500 --width 60
+"""
+
+import argparse
+import csv
+import math
+
+import numpy as np
+
+from benchmarks.typing_simulator import SimClock, _min_jerk
+from core.cursor_controller import CursorController
+from utils.input_backend import RecordingBackend
+
+
+FORWARD = (0.0, 0.0, 1.0)
+
+
+class HeadMotor:
+    """
+    Motor and sensing model for the simulated user.
+
+    Args:
+        jitter_deg: Gaussian per-frame head-pose estimation noise (degrees)
+        tremor_deg: Amplitude of a slow head sway (degrees)
+        tremor_hz: Sway frequency
+        endpoint_sd: Relative SD of each submovement endpoint (fraction of the move)
+        gain_error: SD of the user's misjudgement of the angle-to-screen gain
+        reaction_time: Seconds before a correction is started
+        movement_a, movement_b: Submovement time a + b*log2(D/W + 1)
+    """
+
+    def __init__(self, jitter_deg=0.3, tremor_deg=0.2, tremor_hz=1.5,
+                 endpoint_sd=0.08, gain_error=0.05, reaction_time=0.2,
+                 movement_a=0.25, movement_b=0.15):
+        self.jitter_deg = jitter_deg
+        self.tremor_deg = tremor_deg
+        self.tremor_hz = tremor_hz
+        self.endpoint_sd = endpoint_sd
+        self.gain_error = gain_error
+        self.reaction_time = reaction_time
+        self.movement_a = movement_a
+        self.movement_b = movement_b
+
+    def movement_time(self, distance, width):
+        return self.movement_a + self.movement_b * math.log2(abs(distance) / width + 1)
+
+
+def task_targets(amplitude, width, count, screen_size):
+    """
+    ISO 9241-9 circle of `count` targets (diameter = amplitude), and the
+    order they are selected in: each target is followed by the one roughly
+    opposite it.
+
+    Returns:
+        (centres as an (N, 2) array, selection order as a list of indices)
+    """
+    cx, cy = screen_size[0] / 2, screen_size[1] / 2
+    angles = 2 * np.pi * np.arange(count) / count - np.pi / 2
+    centres = np.stack([cx + amplitude / 2 * np.cos(angles),
+                        cy + amplitude / 2 * np.sin(angles)], axis=1)
+    step = (count + 1) // 2
+    order = [(i * step) % count for i in range(count + 1)]
+    return centres, order
+
+
+def make_controller(screen_size, clock, sensitivity_x=20, sensitivity_y=10, filter_length=8):
+    """Headless CursorController calibrated to a straight-ahead head."""
+    controller = CursorController(
+        sensitivity_x=sensitivity_x, sensitivity_y=sensitivity_y, filter_length=filter_length,
+        input_backend=RecordingBackend(clock=clock, screen_size=screen_size),
+        screen_size=screen_size, start_thread=False
+    )
+    controller.calibration_offset_yaw = 180
+    controller.calibration_offset_pitch = 180
+    controller.mouse_control_enabled = True
+    return controller
+
+
+class PointingSimulator:
+    """
+    Closed-loop simulated user for the multi-directional tapping task.
+
+    Each trial is a minimum-jerk head movement towards where the user
+    believes the target is (with a gain misjudgement and endpoint
+    noise). The user then waits for the cursor. If the cursor is not
+    inside the target after a reaction time, a corrective submovement
+    is planned from the visible error. Otherwise the user holds still
+    until the dwell completes.
+    """
+
+    def __init__(self, controller_factory, motor=None, fps=30.0, dwell=0.3,
+                 timeout=5.0, seed=0):
+        """
+        Args:
+            controller_factory: Callable(screen_size, clock) -> CursorController
+            motor: HeadMotor model
+            fps: Simulated camera frame rate
+            dwell: Seconds inside the target that select it
+            timeout: Seconds before a trial is abandoned (counted as an error)
+            seed: RNG seed
+        """
+        self.controller_factory = controller_factory
+        self.motor = motor or HeadMotor()
+        self.dt = 1.0 / fps
+        self.dwell = dwell
+        self.timeout = timeout
+        self.rng = np.random.default_rng(seed)
+
+    def run(self, amplitude, width, screen_size, count=13):
+        """
+        Run one condition.
+
+        Returns:
+            (trial dicts for analyze, target centres, selection order)
+        """
+        clock = SimClock()
+        controller = self.controller_factory(screen_size, clock)
+        self._clock = clock
+        self._controller = controller
+        self._phase = self.rng.uniform(0, 2 * np.pi)
+        self._head = np.zeros(2)   # (yaw, pitch) in degrees
+
+        centres, order = task_targets(amplitude, width, count, screen_size)
+
+        # Move onto the first target without recording it
+        self._acquire(centres[order[0]], width)
+
+        trials = []
+        for index in order[1:]:
+            trial = self._acquire(centres[index], width)
+            trial["target"] = index
+            trials.append(trial)
+        return trials, centres, order
+
+    # -----------------------------------------------------
+    # User model
+    # -----------------------------------------------------
+    def _angles_for(self, x, y, gain):
+        """The user's internal model of the angle -> screen mapping."""
+        c = self._controller
+        yaw = c.sensitivity_x * (2 * x / c.MONITOR_WIDTH - 1)
+        pitch = c.sensitivity_y * (1 - 2 * y / c.MONITOR_HEIGHT)
+        return np.array([yaw, pitch]) / gain
+
+    def _step(self, samples):
+        m = self.motor
+        self._phase += 2 * np.pi * m.tremor_hz * self.dt
+        sway = m.tremor_deg * np.array([np.sin(self._phase), np.cos(self._phase * 0.7)])
+        yaw, pitch = self._head + sway + self.rng.normal(0.0, m.jitter_deg, 2)
+        self._controller.update(pitch, yaw, FORWARD)
+        self._clock.advance(self.dt)
+        samples.append((self._clock.now, *self._controller.get_position()))
+
+    def _submove(self, goal, width_deg, samples):
+        m = self.motor
+        start = self._head.copy()
+        distance = float(np.linalg.norm(goal - start))
+        endpoint = goal + self.rng.normal(0.0, m.endpoint_sd * distance / math.sqrt(2), 2)
+        frames = max(1, int(round(m.movement_time(distance, width_deg) / self.dt)))
+        for f in range(1, frames + 1):
+            self._head = start + (endpoint - start) * _min_jerk(f / frames)
+            self._step(samples)
+
+    def _acquire(self, centre, width):
+        m = self.motor
+        gain = 1.0 + self.rng.normal(0.0, m.gain_error)
+        c = self._controller
+        width_deg = width / c.MONITOR_WIDTH * 2 * c.sensitivity_x
+
+        start_time = self._clock.now
+        samples = [(start_time, *c.get_position())]
+        goal = self._angles_for(centre[0], centre[1], gain)
+        self._submove(goal, width_deg, samples)
+
+        inside_for = 0.0
+        outside_for = 0.0
+        submovements = 1
+        selected = False
+        while self._clock.now - start_time < self.timeout:
+            self._step(samples)
+            x, y = samples[-1][1:]
+            if math.hypot(x - centre[0], y - centre[1]) <= width / 2:
+                inside_for += self.dt
+                outside_for = 0.0
+                if inside_for >= self.dwell:
+                    selected = True
+                    break
+            else:
+                inside_for = 0.0
+                outside_for += self.dt
+                if outside_for >= m.reaction_time:
+                    # Corrective submovement from the visible error
+                    error = self._angles_for(centre[0], centre[1], gain) - \
+                        self._angles_for(x, y, gain)
+                    self._submove(self._head + error, width_deg, samples)
+                    submovements += 1
+                    outside_for = 0.0
+
+        return {
+            "samples": np.array(samples),
+            "selected": selected,
+            "submovements": submovements,
+        }
+
+
+# ---------------------------------------------------------
+# Replay
+# ---------------------------------------------------------
+def read_trajectory(path):
+    """Rows (t, pitch, yaw, trial) from a recorded CSV."""
+    with open(path, newline="") as f:
+        return [
+            (float(r["t"]), float(r["pitch"]), float(r["yaw"]), int(r["trial"]))
+            for r in csv.DictReader(f)
+        ]
+
+
+def replay(rows, controller, centres, order, width):
+    """Feed a recorded trajectory through the controller, split into trials."""
+    trials = []
+    current = None
+    for t, pitch, yaw, trial in rows:
+        controller.update(pitch, yaw, FORWARD)
+        sample = (t, *controller.get_position())
+        if current is None or trial != current["index"]:
+            if current is not None:
+                trials.append(current)
+            current = {"index": trial, "samples": [sample]}
+        else:
+            current["samples"].append(sample)
+    if current is not None:
+        trials.append(current)
+
+    result = []
+    for trial in trials:
+        position = trial["index"] + 1   # trial 0 acquires order[1]
+        if position >= len(order):
+            break
+        samples = np.array(trial["samples"])
+        centre = centres[order[position]]
+        x, y = samples[-1, 1:]
+        result.append({
+            "samples": samples,
+            "selected": math.hypot(x - centre[0], y - centre[1]) <= width / 2,
+            "submovements": None,
+            "target": order[position],
+        })
+    return result
+
+
+# ---------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------
+def analyze(trials, centres, order, width, dwell=0.3):
+    """
+    ISO 9241-9 effective measures for one condition.
+
+    For each trial the movement axis runs from the previous selection
+    point to the target centre. The endpoint deviation along it gives
+    the effective width We = 4.133 * SD and the effective amplitude Ae.
+    Throughput is IDe / MT with IDe = log2(Ae / We + 1).
+
+    Returns:
+        dict with throughput (bits/s), movement_time (s), error_rate,
+        overshoot (px past the far target edge), reentry_rate and
+        jitter (RMS px while holding inside a target that was selected)
+    """
+    dx, amplitudes, times, overshoots, jitters = [], [], [], [], []
+    reentries = 0
+    errors = 0
+    start = centres[order[0]]
+
+    for trial in trials:
+        samples = trial["samples"]
+        target = centres[trial["target"]]
+        end = samples[-1, 1:]
+        times.append(samples[-1, 0] - samples[0, 0])
+        errors += not trial["selected"]
+
+        axis = target - start
+        a = float(np.linalg.norm(axis))
+        u = axis / a if a > 0 else np.array([1.0, 0.0])
+        amplitudes.append(a)
+
+        projection = (samples[:, 1:] - start) @ u          # distance along the axis
+        dx.append(float(projection[-1] - a))
+        overshoots.append(max(0.0, float(projection.max()) - (a + width / 2)))
+
+        inside = np.hypot(*(samples[:, 1:] - target).T) <= width / 2
+        entries = np.count_nonzero(inside[1:] & ~inside[:-1])
+        reentries += entries > 1
+
+        hold = samples[samples[:, 0] >= samples[-1, 0] - dwell, 1:]
+        if trial["selected"] and len(hold) > 1:
+            jitters.append(float(np.sqrt(((hold - hold.mean(axis=0)) ** 2).sum(axis=1).mean())))
+
+        start = end
+
+    n = max(len(trials), 1)
+    we = 4.133 * float(np.std(dx, ddof=1)) if len(dx) > 1 else float(width)
+    ae = float(np.mean(amplitudes)) + float(np.mean(dx))
+    ide = math.log2(ae / we + 1) if we > 0 else 0.0
+    mt = float(np.mean(times))
+    return {
+        "amplitude": float(np.mean(amplitudes)),
+        "width": width,
+        "effective_width": we,
+        "effective_id": ide,
+        "movement_time": mt,
+        "throughput": ide / mt if mt > 0 else 0.0,
+        "error_rate": errors / n,
+        "overshoot": float(np.mean(overshoots)),
+        "reentry_rate": reentries / n,
+        "jitter": float(np.mean(jitters)) if jitters else 0.0,
+    }
+
+
+def summarize(conditions):
+    """Mean of the per-condition measures (throughput is averaged, as in ISO 9241-9)."""
+    keys = ("throughput", "movement_time", "error_rate", "overshoot", "reentry_rate", "jitter")
+    return {k: float(np.mean([c[k] for c in conditions])) for k in keys}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CursorController pointing benchmark (ISO 9241-9)")
+    parser.add_argument("--screen", default="1920x1080", help="Virtual screen WxH")
+    parser.add_argument("--amplitudes", type=float, nargs="+", default=[300.0, 600.0, 900.0])
+    parser.add_argument("--widths", type=float, nargs="+", default=[40.0, 80.0, 160.0])
+    parser.add_argument("--targets", type=int, default=13, help="Targets per circle (odd)")
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--dwell", type=float, default=0.3, help="Dwell time that selects (s)")
+    parser.add_argument("--sensitivity-x", type=float, default=20.0)
+    parser.add_argument("--sensitivity-y", type=float, default=10.0)
+    parser.add_argument("--filter-length", type=int, default=8)
+    parser.add_argument("--jitter", type=float, default=0.3, help="Pose noise per frame (deg)")
+    parser.add_argument("--tremor", type=float, default=0.2, help="Head sway amplitude (deg)")
+    parser.add_argument("--reaction", type=float, default=0.2, help="Reaction time (s)")
+    parser.add_argument("--replay", help="Recorded t,pitch,yaw,trial CSV")
+    parser.add_argument("--amplitude", type=float, default=600.0, help="Condition of --replay")
+    parser.add_argument("--width", type=float, default=80.0, help="Condition of --replay")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    screen_size = tuple(int(v) for v in args.screen.lower().split("x"))
+
+    def controller_factory(size, clock):
+        return make_controller(size, clock, args.sensitivity_x, args.sensitivity_y,
+                               args.filter_length)
+
+    conditions = []
+    if args.replay:
+        centres, order = task_targets(args.amplitude, args.width, args.targets, screen_size)
+        controller = controller_factory(screen_size, SimClock())
+        trials = replay(read_trajectory(args.replay), controller, centres, order, args.width)
+        conditions.append(analyze(trials, centres, order, args.width, args.dwell))
+    else:
+        motor = HeadMotor(jitter_deg=args.jitter, tremor_deg=args.tremor,
+                          reaction_time=args.reaction)
+        for i, amplitude in enumerate(args.amplitudes):
+            for j, width in enumerate(args.widths):
+                sim = PointingSimulator(controller_factory, motor, fps=args.fps,
+                                        dwell=args.dwell,
+                                        seed=args.seed + i * len(args.widths) + j)
+                trials, centres, order = sim.run(amplitude, width, screen_size, args.targets)
+                conditions.append(analyze(trials, centres, order, width, args.dwell))
+
+    print(f"{'A':>6} {'W':>5} {'We':>6} {'IDe':>5} {'MT(s)':>6} {'TP':>5} "
+          f"{'err':>5} {'over':>6} {'re-ent':>6} {'jitter':>6}")
+    for c in conditions:
+        print(f"{c['amplitude']:6.0f} {c['width']:5.0f} {c['effective_width']:6.1f} "
+              f"{c['effective_id']:5.2f} {c['movement_time']:6.2f} {c['throughput']:5.2f} "
+              f"{c['error_rate']:5.0%} {c['overshoot']:6.1f} {c['reentry_rate']:6.0%} "
+              f"{c['jitter']:6.1f}")
+
+    s = summarize(conditions)
+    print("-" * 60)
+    print(f"Throughput:      {s['throughput']:.2f} bits/s")
+    print(f"Movement time:   {s['movement_time']:.2f} s")
+    print(f"Errors:          {s['error_rate']:.1%}")
+    print(f"Overshoot:       {s['overshoot']:.1f} px (re-entries in {s['reentry_rate']:.0%} of trials)")
+    print(f"Jitter:          {s['jitter']:.1f} px RMS while holding")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Round trip and traffic of the remote input protocol.
+
+Drives a RemoteInputBackend against a LoopbackAgent (events are recorded,
+not performed) over TCP and a Unix socket. Cursor moves are issued at
+--rate Hz with a click every --click-every moves, as the pipeline would.
+Reports ping round-trip time, bytes per move, how many moves each end
+coalesced, and checks that every click arrived in order and the cursor
+ended on the last target.
+
+Usage:
+    python -m benchmarks.remote_input_benchmark
+    python -m benchmarks.remote_input_benchmark --rate 1000 --seconds 5 --transport tcp
+"""
+
+import argparse
+import math
+import sys
+import time
+
+from remote_input.agent import LoopbackAgent
+from remote_input.backend import RemoteInputBackend
+
+
+def drive(backend, rate, seconds, click_every):
+    """Circle the cursor at `rate` moves/s. Returns (moves, clicks, last target)."""
+    interval = 1.0 / rate
+    total = int(rate * seconds)
+    start = time.perf_counter()
+    clicks = 0
+    target = None
+    for i in range(total):
+        angle = 2.0 * math.pi * i / 240.0
+        target = (960 + int(400 * math.cos(angle)), 540 + int(300 * math.sin(angle)))
+        backend.move_to(*target)
+        if click_every and i % click_every == click_every - 1:
+            backend.click("left" if clicks % 2 == 0 else "right")
+            clicks += 1
+        delay = start + (i + 1) * interval - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+    return total, clicks, target
+
+
+def run(transport, rate, seconds, click_every):
+    with LoopbackAgent(transport=transport) as agent:
+        backend = RemoteInputBackend(agent.address, ping_interval=0.05)
+        moves, clicks, target = drive(backend, rate, seconds, click_every)
+        backend.close()
+        stats = backend.stats()
+        # Wait until everything sent has arrived and been applied
+        deadline = time.monotonic() + 2.0
+        applied = -1
+        while time.monotonic() < deadline and (agent.received < stats["sent_messages"]
+                                               or agent.applied != applied):
+            applied = agent.applied
+            time.sleep(0.05)
+        events = agent.backend.events
+
+    applied_moves = [args for _, kind, args in events if kind == "move"]
+    applied_clicks = [args[0] for _, kind, args in events if kind == "click"]
+    expected_clicks = ["left" if i % 2 == 0 else "right" for i in range(clicks)]
+    return {
+        "moves": moves,
+        "applied_moves": len(applied_moves),
+        "host_coalesced": stats["coalesced_moves"],
+        "agent_coalesced": agent.coalesced_moves,
+        "bytes_per_move": stats["sent_bytes"] / max(stats["sent_messages"], 1),
+        "rtt_ms": stats["rtt_ms"],
+        "rtt_p95_ms": stats["rtt_p95_ms"],
+        "clicks_ok": applied_clicks == expected_clicks,
+        "final_ok": bool(applied_moves) and tuple(applied_moves[-1]) == target,
+        "gaps": agent.sequence_gaps,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Remote input protocol benchmark")
+    parser.add_argument("--transport", choices=["tcp", "unix", "both"], default="both")
+    parser.add_argument("--rate", type=float, default=240.0, help="Cursor moves per second")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--click-every", type=int, default=60, help="Moves between clicks (0: none)")
+    args = parser.parse_args(argv)
+
+    transports = ["tcp", "unix"] if args.transport == "both" else [args.transport]
+    if "unix" in transports and sys.platform == "win32":
+        transports.remove("unix")
+
+    print(f"{'transport':<10}{'moves':>8}{'applied':>9}{'coalesced':>11}{'B/msg':>7}"
+          f"{'rtt ms':>8}{'p95 ms':>8}  checks")
+    ok = True
+    for transport in transports:
+        r = run(transport, args.rate, args.seconds, args.click_every)
+        rtt = f"{r['rtt_ms']:>8.2f}{r['rtt_p95_ms']:>8.2f}" if r["rtt_ms"] is not None else f"{'n/a':>16}"
+        checks = "ok" if r["clicks_ok"] and r["final_ok"] and not r["gaps"] else "FAILED"
+        ok = ok and checks == "ok"
+        print(f"{transport:<10}{r['moves']:>8}{r['applied_moves']:>9}"
+              f"{r['host_coalesced'] + r['agent_coalesced']:>11}{r['bytes_per_move']:>7.1f}"
+              f"{rtt}  {checks}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,657 @@
+"""
+Synthetic FaceMesh and Hands landmarks for load testing.
+
+Generates long landmark streams without a camera or MediaPipe:
+  - faces: 468 (or 478 with iris) points from a canonical mesh, rotated
+    through yaw/pitch/roll sweeps, with eyelid-closure (blink) curves and
+    an optional eye-in-head gaze offset
+  - hands: 21 points blended between scripted poses (open, fist,
+    pinches, point), rotated to a dial angle, mirrored for the left hand
+
+Everything is vectorized over frames: a chunk of frames is a single
+(frames, points, 3) float32 array in normalized image coordinates, like
+MediaPipe output. LandmarkView and the *_results helpers wrap rows as
+result-compatible objects (.multi_face_landmarks, .landmark[i].x, ...)
+for code that expects MediaPipe results.
+
+The face mesh is MediaPipe's canonical_face_model.obj when the installed
+mediapipe package ships it, otherwise a parametric face that places the
+landmarks HeadPoseEstimator, BlinkDetector and GazeEstimator read.
+
+Usage:
+    python -m benchmarks.synthetic_landmarks --frames 2000000
+    python -m benchmarks.synthetic_landmarks --frames 500000 --drive 20000 --iris
+"""
+
+import argparse
+import math
+import os
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from utils.landmarks import LandmarkList, Point
+
+FACE_POINTS = 468
+IRIS_FACE_POINTS = 478
+HAND_POINTS = 21
+
+# Eye landmarks in BlinkDetector order: corner, upper, upper, corner, lower, lower
+LEFT_EYE = (33, 160, 158, 133, 153, 144)
+RIGHT_EYE = (362, 385, 387, 263, 373, 380)
+
+# Full eyelid contours, moved together when the eye closes
+LEFT_UPPER_LID = (246, 161, 160, 159, 158, 157, 173)
+LEFT_LOWER_LID = (7, 163, 144, 145, 153, 154, 155)
+RIGHT_UPPER_LID = (398, 384, 385, 386, 387, 388, 466)
+RIGHT_LOWER_LID = (382, 381, 380, 374, 373, 390, 249)
+
+# Iris centre + ring (refine_landmarks=True)
+LEFT_IRIS = (468, 469, 470, 471, 472)
+RIGHT_IRIS = (473, 474, 475, 476, 477)
+
+# Face landmarks with a fixed place in the parametric mesh (head units:
+# face width 1, x towards the image right, y down, z away from the camera)
+FACE_ANCHORS = {
+    1: (0.0, 0.10, -0.35),      # nose tip
+    10: (0.0, -0.65, 0.05),     # top of head
+    152: (0.0, 0.65, 0.05),     # chin
+    234: (-0.5, 0.0, 0.30),     # face side (image left)
+    454: (0.5, 0.0, 0.30),      # face side (image right)
+}
+
+# Parametric eyes (head units); open EAR is about 0.28
+EYE_Y = -0.15
+EYE_HALF_OPENING = 0.03
+EYE_HALF_WIDTH = 0.10
+IRIS_RADIUS = 0.045
+
+
+# ---------------------------------------------------------
+# Canonical face
+# ---------------------------------------------------------
+def _mediapipe_mesh_path():
+    try:
+        import mediapipe
+    except ImportError:
+        return None
+    path = os.path.join(os.path.dirname(mediapipe.__file__),
+                        "modules", "face_geometry", "data", "canonical_face_model.obj")
+    return path if os.path.exists(path) else None
+
+
+def _load_obj_vertices(path, count=FACE_POINTS):
+    vertices = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("v "):
+                vertices.append([float(v) for v in line.split()[1:4]])
+                if len(vertices) == count:
+                    break
+    if len(vertices) < count:
+        raise ValueError(f"{path} has {len(vertices)} vertices, expected {count}")
+    mesh = np.array(vertices, dtype=np.float64)
+    # OBJ: y up, z towards the viewer -> image axes
+    mesh[:, 1:] *= -1
+    width = np.linalg.norm(mesh[454] - mesh[234])
+    centre = (mesh[234] + mesh[454]) / 2
+    return (mesh - centre) / width
+
+
+def _parametric_mesh():
+    """Anchors and eyes at fixed places, the rest spread over a half ellipsoid."""
+    n = FACE_POINTS
+    k = np.arange(n) + 0.5
+    # Fibonacci spiral over the front half of an ellipsoid
+    cos_polar = k / n
+    sin_polar = np.sqrt(1 - cos_polar ** 2)
+    azimuth = k * math.pi * (3 - math.sqrt(5))
+    mesh = np.stack([
+        0.5 * sin_polar * np.cos(azimuth),
+        0.65 * sin_polar * np.sin(azimuth),
+        0.35 - 0.6 * cos_polar,
+    ], axis=1)
+
+    for index, point in FACE_ANCHORS.items():
+        mesh[index] = point
+    # Both eyes: corners at the ends, lid contours as arcs from the first
+    # corner to the second (the order MediaPipe's contours follow)
+    for eye, upper, lower, cx in ((LEFT_EYE, LEFT_UPPER_LID, LEFT_LOWER_LID, -0.2),
+                                  (RIGHT_EYE, RIGHT_UPPER_LID, RIGHT_LOWER_LID, 0.2)):
+        mesh[eye[0]] = (cx - EYE_HALF_WIDTH, EYE_Y, -0.05)
+        mesh[eye[3]] = (cx + EYE_HALF_WIDTH, EYE_Y, -0.05)
+        for j, (up, low) in enumerate(zip(upper, lower)):
+            u = (j + 1) / (len(upper) + 1)
+            x = cx - EYE_HALF_WIDTH + 2 * EYE_HALF_WIDTH * u
+            opening = EYE_HALF_OPENING * math.sin(math.pi * u)
+            mesh[up] = (x, EYE_Y - opening, -0.06)
+            mesh[low] = (x, EYE_Y + opening, -0.06)
+    return mesh
+
+
+def _with_iris(mesh):
+    """Append the 10 iris points around the centre of each eye."""
+    ring = np.array([(1, 0), (0, -1), (-1, 0), (0, 1)], dtype=np.float64) * IRIS_RADIUS
+    extra = []
+    for c0, c1 in ((33, 133), (362, 263)):
+        centre = (mesh[c0] + mesh[c1]) / 2
+        centre[2] -= 0.01
+        extra.append(centre)
+        extra.extend(centre + np.array([dx, dy, 0.0]) for dx, dy in ring)
+    return np.vstack([mesh, np.array(extra)])
+
+
+_MESH_CACHE = {}
+
+
+def canonical_face(iris=False, source="auto"):
+    """
+    Neutral frontal face in head units, (468, 3) or (478, 3) with iris.
+
+    Args:
+        iris: Append the 10 refine_landmarks iris points
+        source: "auto" (MediaPipe mesh if installed), "mediapipe", "parametric"
+                or a path to an OBJ file with the 468 canonical vertices
+    """
+    key = (iris, source)
+    if key not in _MESH_CACHE:
+        if source == "parametric":
+            mesh = _parametric_mesh()
+        elif source in ("auto", "mediapipe"):
+            path = _mediapipe_mesh_path()
+            if path is None and source == "mediapipe":
+                raise FileNotFoundError("mediapipe canonical_face_model.obj not found")
+            mesh = _load_obj_vertices(path) if path else _parametric_mesh()
+        else:
+            mesh = _load_obj_vertices(source)
+        if iris:
+            mesh = _with_iris(mesh)
+        _MESH_CACHE[key] = mesh.astype(np.float32)
+    return _MESH_CACHE[key]
+
+
+# ---------------------------------------------------------
+# Motion curves (functions of the absolute frame index)
+# ---------------------------------------------------------
+def sweep(frames, amplitude, period, phase=0.0):
+    """Sinusoidal angle sweep: amplitude * sin(2*pi*frame/period + phase)."""
+    frames = np.asarray(frames, dtype=np.float64)
+    return (amplitude * np.sin(2 * math.pi * frames / period + phase)).astype(np.float32)
+
+
+def blink_curve(frames, fps=30.0, interval=4.0, duration=0.3, hold=0.0, offset=0.0):
+    """
+    Eyelid closure (0 open .. 1 closed) for periodic blinks.
+
+    Args:
+        frames: Absolute frame indices
+        interval: Seconds between blink starts
+        duration: Closing plus opening time (natural blink ~0.1-0.4 s)
+        hold: Seconds fully closed (long blinks / winks for clicking)
+        offset: Time of the first blink
+    """
+    t = (np.asarray(frames, dtype=np.float64) / fps - offset) % interval
+    half = duration / 2
+    closing = np.clip(t / half, 0, 1)
+    opening = np.clip((duration + hold - t) / half, 0, 1)
+    c = np.minimum(closing, opening)
+    # Smoothstep so lids accelerate and decelerate
+    return (c * c * (3 - 2 * c)).astype(np.float32)
+
+
+def rotation_matrices(yaw, pitch, roll):
+    """
+    (frames, 3, 3) rotations in image axes (x right, y down, z away).
+    Positive yaw turns the nose towards the image right, positive pitch
+    raises it, positive roll tilts the top of the head to the right.
+    """
+    yaw, pitch, roll = (np.radians(np.asarray(a, dtype=np.float64)) for a in (yaw, pitch, roll))
+    yaw, pitch, roll = np.broadcast_arrays(yaw, pitch, roll)
+    cy, sy = np.cos(yaw), np.sin(yaw)
+    cp, sp = np.cos(pitch), np.sin(pitch)
+    cr, sr = np.cos(roll), np.sin(roll)
+    one, zero = np.ones_like(cy), np.zeros_like(cy)
+
+    ry = np.stack([cy, zero, -sy, zero, one, zero, sy, zero, cy], -1).reshape(-1, 3, 3)
+    rx = np.stack([one, zero, zero, zero, cp, sp, zero, -sp, cp], -1).reshape(-1, 3, 3)
+    rz = np.stack([cr, -sr, zero, sr, cr, zero, zero, zero, one], -1).reshape(-1, 3, 3)
+    return (rz @ rx @ ry).astype(np.float32)
+
+
+# ---------------------------------------------------------
+# Faces
+# ---------------------------------------------------------
+class NoiseBank:
+    """
+    Pre-drawn standard normal samples read at random offsets. Drawing
+    fresh normals per landmark would cost more than generating the
+    landmarks themselves; for load testing a 1M-sample bank is plenty.
+    """
+
+    def __init__(self, size=1 << 20, seed=0):
+        self.rng = np.random.default_rng(seed)
+        self.samples = self.rng.standard_normal(size, dtype=np.float32)
+
+    def add(self, pts, sd):
+        """pts += N(0, sd) in place (pts must be contiguous)."""
+        flat = pts.reshape(-1)
+        size = len(self.samples)
+        done = 0
+        while done < len(flat):
+            offset = int(self.rng.integers(size))
+            n = min(size - offset, len(flat) - done)
+            flat[done:done + n] += sd * self.samples[offset:offset + n]
+            done += n
+        return pts
+
+
+class SyntheticFace:
+    """
+    Face landmark stream driven by per-frame pose, blink and gaze curves.
+
+    Each curve is a callable frames -> values (or a constant), evaluated
+    on absolute frame indices, so chunks join up seamlessly.
+    """
+
+    def __init__(self, yaw=None, pitch=None, roll=0.0, closure=None,
+                 right_closure=None, gaze=None, iris=False, mesh="auto",
+                 scale=0.3, center=(0.5, 0.5), aspect=640 / 480, noise=0.0, seed=0):
+        """
+        Args:
+            yaw, pitch, roll: Degrees, callable or constant
+                (default: yaw ±20° / 4 s and pitch ±12° / 6.5 s sweeps at 30 FPS)
+            closure: Left-eye (left-click wink) closure 0..1 (default: natural blinks)
+            right_closure: Right-eye (right-click wink) closure (default: same as `closure`)
+            gaze: Callable frames -> (frames, 2) iris offset in eye widths, or None
+            iris: 478 points instead of 468
+            mesh: canonical_face() source
+            scale: Face width as a fraction of the frame width
+            center: Normalized face centre, or callable frames -> (frames, 2)
+            aspect: Frame width / height (keeps pixel geometry undistorted)
+            noise: Gaussian landmark noise SD (normalized units)
+            seed: NoiseBank seed
+        """
+        self.yaw = yaw if yaw is not None else (lambda f: sweep(f, 20.0, 120))
+        self.pitch = pitch if pitch is not None else (lambda f: sweep(f, 12.0, 195))
+        self.roll = roll
+        self.closure = closure if closure is not None else (lambda f: blink_curve(f))
+        self.right_closure = right_closure
+        self.gaze = gaze
+        self.base = canonical_face(iris=iris, source=mesh)
+        self.scale = scale
+        self.center = center
+        self.aspect = aspect
+        self.noise = noise
+        self.noise_bank = NoiseBank(seed=seed) if noise else None
+
+        # Eyelid points move towards the corner line of their eye
+        self._lids = []
+        for upper, lower, (c0, c1) in ((LEFT_UPPER_LID, LEFT_LOWER_LID, (33, 133)),
+                                       (RIGHT_UPPER_LID, RIGHT_LOWER_LID, (362, 263))):
+            idx = np.array(upper + lower)
+            mid = (self.base[c0, 1] + self.base[c1, 1]) / 2
+            self._lids.append((idx, (mid - self.base[idx, 1]).astype(np.float32)))
+        self._iris = [np.array(LEFT_IRIS), np.array(RIGHT_IRIS)] if iris else None
+        if iris:
+            self._eye_width = float(np.linalg.norm(self.base[133] - self.base[33]))
+
+    @property
+    def points(self):
+        return len(self.base)
+
+    @staticmethod
+    def _curve(curve, frames):
+        values = curve(frames) if callable(curve) else curve
+        return np.broadcast_to(np.asarray(values, dtype=np.float32), frames.shape)
+
+    def frames(self, start, count, out=None):
+        """
+        Landmarks for frames [start, start + count).
+
+        Returns:
+            (count, points, 3) float32 array (normalized x, y, z)
+        """
+        f = np.arange(start, start + count)
+        rot = rotation_matrices(self._curve(self.yaw, f), self._curve(self.pitch, f),
+                                self._curve(self.roll, f))
+        # Head units -> normalized image coordinates: scale rows of R
+        rot *= np.array([self.scale, self.scale * self.aspect, self.scale],
+                        dtype=np.float32)[:, None]
+        center = self.center(f) if callable(self.center) else self.center
+        shift = np.zeros((count, 1, 3), dtype=np.float32)
+        shift[:, 0, :2] = center
+
+        # One affine map per frame: base @ R^T + shift
+        pts = np.matmul(self.base, rot.transpose(0, 2, 1), out=out)
+        pts += shift
+
+        # Eyelids: shift along the head's y axis, rotated with the head
+        left = self._curve(self.closure, f)
+        right = left if self.right_closure is None else self._curve(self.right_closure, f)
+        up_axis = rot[:, None, :, 1]
+        for (idx, delta), c in zip(self._lids, (left, right)):
+            pts[:, idx] += (c[:, None] * delta)[:, :, None] * up_axis
+
+        if self.gaze is not None and self._iris is not None:
+            g = np.asarray(self.gaze(f), dtype=np.float32) * self._eye_width
+            move = g[:, 0, None] * rot[:, :, 0] + g[:, 1, None] * rot[:, :, 1]
+            for idx in self._iris:
+                pts[:, idx] += move[:, None, :]
+
+        if self.noise:
+            self.noise_bank.add(pts, self.noise)
+        return pts
+
+    def stream(self, total, chunk=1024):
+        """Yield (start, array) chunks covering `total` frames."""
+        for start in range(0, total, chunk):
+            yield start, self.frames(start, min(chunk, total - start))
+
+
+# ---------------------------------------------------------
+# Hands
+# ---------------------------------------------------------
+# Right hand in the mirrored view, palm to the camera, fingers up.
+# Units: wrist -> middle MCP = 1; x right, y down, z away.
+_MCP = {5: (-0.30, -0.95), 9: (0.0, -1.0), 13: (0.25, -0.93), 17: (0.48, -0.82)}
+_SEGMENTS = {5: (0.45, 0.27, 0.22), 9: (0.50, 0.30, 0.23),
+             13: (0.46, 0.28, 0.22), 17: (0.36, 0.22, 0.20)}
+_THUMB_OPEN = ((-0.25, -0.30), (-0.50, -0.50), (-0.68, -0.70), (-0.80, -0.88))
+_THUMB_FOLDED = ((-0.25, -0.30), (-0.35, -0.50), (-0.15, -0.60), (0.05, -0.65))
+FINGER_TIPS = {"index": 8, "middle": 12, "ring": 16, "pinky": 20}
+
+
+def _hand_keyframe(curl, thumb="open", pinch=None):
+    """
+    Build one 21-point pose.
+
+    Args:
+        curl: {finger MCP index: 0 (straight) .. 1 (curled)}
+        thumb: "open" or "folded" (across the palm)
+        pinch: Fingertip index the thumb tip touches, or None
+    """
+    hand = np.zeros((HAND_POINTS, 3))
+    for mcp, (x, y) in _MCP.items():
+        d = np.array([x, y, 0.0]) / math.hypot(x, y)
+        towards = np.array([0.0, 0.0, -1.0])
+        p = np.array([x, y, 0.0])
+        hand[mcp] = p
+        angle = 0.0
+        c = curl.get(mcp, 0.0)
+        for k, (length, bend) in enumerate(zip(_SEGMENTS[mcp], (80, 100, 70))):
+            angle += math.radians(c * bend)
+            p = p + length * (math.cos(angle) * d + math.sin(angle) * towards)
+            hand[mcp + 1 + k] = p
+
+    thumb_points = _THUMB_OPEN if thumb == "open" else _THUMB_FOLDED
+    for k, (x, y) in enumerate(thumb_points):
+        hand[1 + k] = (x, y, -0.05 * k)
+    if pinch is not None:
+        tip = hand[pinch] + np.array([-0.03, 0.03, 0.0])
+        hand[4] = tip
+        hand[3] = (hand[2] + tip) / 2 + np.array([-0.08, 0.0, -0.05])
+    return hand.astype(np.float32)
+
+
+HAND_POSES = {
+    "open": _hand_keyframe({}),
+    "fist": _hand_keyframe({5: 1, 9: 1, 13: 1, 17: 1}, thumb="folded"),
+    "point": _hand_keyframe({9: 1, 13: 1, 17: 1}, thumb="folded"),
+    "pinch_index": _hand_keyframe({5: 0.4}, pinch=8),
+    "pinch_middle": _hand_keyframe({9: 0.45}, pinch=12),
+    "pinch_ring": _hand_keyframe({13: 0.5}, pinch=16),
+    "pinch_pinky": _hand_keyframe({17: 0.55}, pinch=20),
+}
+
+
+class HandScript:
+    """
+    Scripted pose program: a repeating list of (pose, hold seconds),
+    with `transition` seconds of linear blending into each pose.
+    """
+
+    def __init__(self, steps, fps=30.0, transition=0.15):
+        self.names = [name for name, _ in steps]
+        unknown = set(self.names) - set(HAND_POSES)
+        if unknown:
+            raise ValueError(f"Unknown hand pose(s) {sorted(unknown)}; choose from {sorted(HAND_POSES)}")
+        self.keyframes = np.stack([HAND_POSES[n] for n in self.names])
+        durations = np.array([max(hold, 1.0 / fps) for _, hold in steps]) * fps
+        self.starts = np.concatenate([[0.0], np.cumsum(durations)[:-1]])
+        self.period = float(durations.sum())
+        self.transition = transition * fps
+
+    def __call__(self, frames):
+        """(frames, 21, 3) blended poses in hand units."""
+        t = np.asarray(frames, dtype=np.float64) % self.period
+        step = np.searchsorted(self.starts, t, side="right") - 1
+        previous = (step - 1) % len(self.names)
+        w = np.clip((t - self.starts[step]) / max(self.transition, 1e-9), 0, 1).astype(np.float32)
+        w = w[:, None, None]
+        return self.keyframes[previous] * (1 - w) + self.keyframes[step] * w
+
+
+class SyntheticHand:
+    """
+    Hand landmark stream: scripted poses, dial rotation, placement and noise.
+    """
+
+    def __init__(self, script=None, dial=0.0, handedness="Right", scale=0.15,
+                 center=None, aspect=640 / 480, noise=0.0, seed=0):
+        """
+        Args:
+            script: HandScript or a pose name (default: open/pinch/fist cycle)
+            dial: Wrist -> middle-MCP tilt towards the image left in degrees
+                  (AirKeyboard's dial angle, 0..90), callable or constant
+            handedness: "Right" or "Left" (mirrored; thumb on the other side)
+            scale: Wrist -> middle-MCP length (normalized, image width)
+            center: Wrist position (default: right or left lower third)
+            noise: Gaussian landmark noise SD (normalized units)
+        """
+        if script is None:
+            script = HandScript([("open", 0.6), ("pinch_index", 0.3),
+                                 ("open", 0.6), ("fist", 0.5)])
+        self.script = script
+        self.dial = dial
+        self.handedness = handedness
+        self.scale = scale
+        self.center = center or ((0.7, 0.8) if handedness == "Right" else (0.3, 0.8))
+        self.aspect = aspect
+        self.noise = noise
+        self.noise_bank = NoiseBank(seed=seed) if noise else None
+
+    def frames(self, start, count):
+        """(count, 21, 3) float32 normalized landmarks."""
+        f = np.arange(start, start + count)
+        if isinstance(self.script, str):
+            pts = np.broadcast_to(HAND_POSES[self.script], (count, HAND_POINTS, 3)).copy()
+        else:
+            pts = self.script(f)
+
+        dial = self.dial(f) if callable(self.dial) else self.dial
+        dial = np.radians(np.broadcast_to(np.asarray(dial, dtype=np.float32), (count,)))
+        # Physical tilt whose normalized-coordinate angle equals `dial`
+        a = np.arctan2(self.aspect * np.sin(dial), np.cos(dial))
+        c, s = np.cos(a)[:, None], np.sin(a)[:, None]
+        x, y = pts[..., 0].copy(), pts[..., 1].copy()
+        pts[..., 0] = c * x + s * y
+        pts[..., 1] = -s * x + c * y
+        if self.handedness == "Left":
+            pts[..., 0] *= -1
+
+        center = self.center(f) if callable(self.center) else self.center
+        center = np.broadcast_to(np.asarray(center, dtype=np.float32), (count, 2))
+        pts *= self.scale
+        pts[..., 1] *= self.aspect
+        pts[..., :2] += center[:, None, :]
+        if self.noise:
+            self.noise_bank.add(pts, self.noise)
+        return pts
+
+    def stream(self, total, chunk=1024):
+        for start in range(0, total, chunk):
+            yield start, self.frames(start, min(chunk, total - start))
+
+
+# ---------------------------------------------------------
+# MediaPipe-compatible views
+# ---------------------------------------------------------
+class LandmarkView:
+    """
+    Read-only landmark sequence over an (N, 3) array row. Points are
+    built on access, so consumers that read a handful of landmarks per
+    frame do not pay for all of them.
+    """
+    __slots__ = ("array",)
+
+    def __init__(self, array):
+        self.array = array
+
+    def __len__(self):
+        return len(self.array)
+
+    def __getitem__(self, i):
+        x, y, z = self.array[i].tolist()
+        return Point(x, y, z)
+
+    def __iter__(self):
+        return (Point(x, y, z) for x, y, z in self.array.tolist())
+
+
+def face_results(frames):
+    """Yield FaceMesh-like results (.multi_face_landmarks) for each frame row."""
+    for row in frames:
+        yield SimpleNamespace(multi_face_landmarks=[LandmarkList(LandmarkView(row))])
+
+
+def hand_results(right=None, left=None):
+    """
+    Yield Hands-like results (.multi_hand_landmarks, .multi_handedness)
+    for frame-aligned right/left arrays (either may be None).
+    """
+    count = len(right) if right is not None else len(left)
+    labels = {"Right": _handedness("Right"), "Left": _handedness("Left")}
+    for i in range(count):
+        hands, handedness = [], []
+        for label, frames in (("Right", right), ("Left", left)):
+            if frames is not None:
+                hands.append(LandmarkList(LandmarkView(frames[i])))
+                handedness.append(labels[label])
+        yield SimpleNamespace(multi_hand_landmarks=hands or None,
+                              multi_handedness=handedness or None)
+
+
+def _handedness(label):
+    return SimpleNamespace(classification=[SimpleNamespace(label=label, score=1.0)])
+
+
+# ---------------------------------------------------------
+# Load test
+# ---------------------------------------------------------
+def generation_rate(source, total, chunk=1024):
+    """Frames per second for generating `total` frames from a stream source."""
+    start = time.perf_counter()
+    for _, _ in source.stream(total, chunk):
+        pass
+    return total / (time.perf_counter() - start)
+
+
+def drive_consumers(face, right, left, frames, w=640, h=480):
+    """
+    Feed generated frames to the per-frame consumers and time each one.
+
+    Returns:
+        {consumer: frames per second}
+    """
+    from core.blink_detector import BlinkDetector
+    from core.head_pose import HeadPoseEstimator
+    from hand_gestures.gesture_actions import GestureActions
+    from hand_gestures.motion_gestures import MotionGestures
+    from keyboard_control.air_keyboard import AirKeyboard
+    from utils.input_backend import RecordingBackend
+    from benchmarks.pointing_benchmark import make_controller
+
+    faces = face.frames(0, frames)
+    rights = right.frames(0, frames)
+    lefts = left.frames(0, frames)
+    face_lms = [r.multi_face_landmarks[0].landmark for r in face_results(faces)]
+    hand_lms = [(r.multi_hand_landmarks[0].landmark, r.multi_hand_landmarks[1].landmark)
+                for r in hand_results(rights, lefts)]
+
+    head_pose = HeadPoseEstimator()
+    blink = BlinkDetector(input_backend=RecordingBackend())
+    keyboard = AirKeyboard(input_backend=RecordingBackend())
+    keyboard.enabled = True
+    clock = SimpleNamespace(now=0.0)
+    controller = make_controller((1920, 1080), lambda: clock.now, 20, 10, 8)
+
+    rates = {}
+    poses = []
+
+    start = time.perf_counter()
+    for lms in face_lms:
+        poses.append(head_pose.estimate(lms, w, h))
+    rates["HeadPoseEstimator"] = frames / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for i, lms in enumerate(face_lms):
+        blink.process(lms, w, h, i / 30)
+    rates["BlinkDetector"] = frames / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for pitch, yaw, _ in poses:
+        clock.now += 1 / 30
+        controller.set_target(*controller.head_target(pitch, yaw))
+    rates["CursorController"] = frames / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for r, l in hand_lms:
+        keyboard.process(r, l, None)
+    rates["AirKeyboard"] = frames / (time.perf_counter() - start)
+
+    gestures = GestureActions(input_backend=RecordingBackend())
+    start = time.perf_counter()
+    for r, _ in hand_lms:
+        gestures.perform_actions(LandmarkList(r))
+    rates["GestureActions"] = frames / (time.perf_counter() - start)
+
+    motion = MotionGestures(input_backend=RecordingBackend())
+    start = time.perf_counter()
+    for i, (r, _) in enumerate(hand_lms):
+        motion.update(r, i / 30)
+    rates["MotionGestures"] = frames / (time.perf_counter() - start)
+    return rates
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Synthetic landmark generator throughput")
+    parser.add_argument("--frames", type=int, default=1_000_000, help="Frames to generate per stream")
+    parser.add_argument("--chunk", type=int, default=1024, help="Frames per generated array")
+    parser.add_argument("--iris", action="store_true", help="478-point faces")
+    parser.add_argument("--mesh", default="auto", help="auto | mediapipe | parametric | path to OBJ")
+    parser.add_argument("--noise", type=float, default=0.001, help="Landmark noise SD")
+    parser.add_argument("--drive", type=int, default=0,
+                        help="Also feed this many frames through the consumers")
+    args = parser.parse_args()
+
+    face = SyntheticFace(iris=args.iris, mesh=args.mesh, noise=args.noise)
+    right = SyntheticHand(dial=lambda f: 45 + sweep(f, 45, 300), noise=args.noise)
+    left = SyntheticHand(handedness="Left", noise=args.noise, seed=1)
+
+    mesh = args.mesh
+    if mesh == "auto":
+        mesh = "mediapipe" if _mediapipe_mesh_path() else "parametric"
+    print(f"Face mesh: {mesh}, {face.points} points")
+    for name, source in (("faces", face), ("hands", right)):
+        rate = generation_rate(source, args.frames, args.chunk)
+        print(f"{name:6s} {rate:12,.0f} frames/s  ({rate * 60 / 1e6:6.1f} M frames/min)")
+
+    if args.drive:
+        print(f"\nConsumers ({args.drive} frames, result-compatible objects):")
+        for name, rate in drive_consumers(face, right, left, args.drive).items():
+            print(f"  {name:18s} {rate:10,.0f} frames/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,384 @@
+"""
+AirKeyboard typing-throughput simulator.
+
+Synthesizes right-hand dial trajectories (wrist -> middle-MCP angle) and
+left-hand pinch events for a target phrase, drives AirKeyboard.process
+headless against a RecordingBackend on a simulated clock, and reports
+characters per minute, error rates and per-keystroke latency.
+
+Usage:
+    python -m benchmarks.typing_simulator --phrase "HELLO WORLD" --trials 5
+"""
+
+import argparse
+import math
+
+import numpy as np
+
+from keyboard_control.air_keyboard import AirKeyboard
+from utils.input_backend import RecordingBackend
+from utils.landmarks import Point
+
+
+class SimClock:
+    """Manually advanced clock shared by the keyboard and the recorder."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, dt):
+        self.now += dt
+
+
+class MotorNoise:
+    """
+    Motor model for the simulated user.
+
+    Args:
+        jitter_deg: Gaussian per-frame angle noise (degrees)
+        tremor_deg: Amplitude of a physiological tremor (degrees)
+        tremor_hz: Tremor frequency
+        endpoint_sd: Relative SD of the aimed endpoint (fraction of the move)
+        reaction_time: Seconds between seeing the right selection and pinching
+        movement_a, movement_b: Fitts's-law movement time a + b*log2(D/W + 1)
+    """
+
+    def __init__(self, jitter_deg=0.8, tremor_deg=0.5, tremor_hz=9.0,
+                 endpoint_sd=0.05, reaction_time=0.2,
+                 movement_a=0.15, movement_b=0.12):
+        self.jitter_deg = jitter_deg
+        self.tremor_deg = tremor_deg
+        self.tremor_hz = tremor_hz
+        self.endpoint_sd = endpoint_sd
+        self.reaction_time = reaction_time
+        self.movement_a = movement_a
+        self.movement_b = movement_b
+
+    def movement_time(self, distance, width):
+        return self.movement_a + self.movement_b * math.log2(abs(distance) / width + 1)
+
+
+def _min_jerk(t):
+    t = min(max(t, 0.0), 1.0)
+    return t ** 3 * (10 - 15 * t + 6 * t ** 2)
+
+
+def right_hand_at(angle, fist=False):
+    """
+    21 right-hand landmarks whose wrist->middle-MCP angle selects `angle`
+    (0..90). Fingertips are extended (LETTERS dial), or curled next to the
+    wrist with fist=True (SYMBOLS dial).
+    """
+    theta = math.radians(90.0 - angle)
+    wrist = (0.7, 0.8)
+    dx, dy = math.cos(theta), math.sin(theta)
+    hand = [Point(wrist[0], wrist[1]) for _ in range(21)]
+    hand[9] = Point(wrist[0] - 0.15 * dx, wrist[1] - 0.15 * dy)
+    reach = 0.1 if fist else 0.3
+    for tip in (8, 12, 16, 20):
+        hand[tip] = Point(wrist[0] - reach * dx, wrist[1] - reach * dy)
+    return hand
+
+
+def left_hand_pinching(finger_tip=None):
+    """21 left-hand landmarks; finger_tip (8/12/16/20) touches the thumb if given."""
+    thumb = (0.3, 0.6)
+    hand = [Point(0.3, 0.8) for _ in range(21)]
+    hand[4] = Point(*thumb)
+    for i, tip in enumerate((8, 12, 16, 20)):
+        hand[tip] = Point(thumb[0] + 0.04 * i, thumb[1] - 0.15)
+    if finger_tip is not None:
+        hand[finger_tip] = Point(thumb[0] + 0.005, thumb[1])
+    return hand
+
+
+PINCH_WRITE, PINCH_SPACE, PINCH_COMPLETE, PINCH_BACKSPACE = 8, 12, 16, 20
+
+
+class TypingSimulator:
+    """
+    Closed-loop simulated user typing a phrase on an AirKeyboard.
+
+    For every keystroke the user moves the dial to the target slot with
+    a minimum-jerk movement, waits until the highlighted slot matches
+    (plus a reaction time), pinches and holds until the keyboard emits.
+    Digits and punctuation are typed with the right hand in a fist, which
+    switches the dial to AirKeyboard.SYMBOLS. Wrong characters are
+    noticed and removed with a backspace pinch.
+    """
+
+    def __init__(self, keyboard_factory=None, noise=None, fps=30.0,
+                 use_completions=False, seed=0, time_limit=600.0, max_key_attempts=8):
+        """
+        Args:
+            keyboard_factory: Callable(input_backend, clock) -> AirKeyboard
+            noise: MotorNoise model
+            fps: Simulated camera frame rate
+            use_completions: Accept word completions when available
+            seed: RNG seed
+            time_limit: Simulated seconds before giving up on a phrase
+            max_key_attempts: Tries at one phrase position before its key
+                is reported as unreachable and the phrase is abandoned
+        """
+        self.keyboard_factory = keyboard_factory or (
+            lambda backend, clock: AirKeyboard(input_backend=backend, clock=clock)
+        )
+        self.noise = noise or MotorNoise()
+        self.dt = 1.0 / fps
+        self.use_completions = use_completions
+        self.rng = np.random.default_rng(seed)
+        self.time_limit = time_limit
+        self.max_key_attempts = max_key_attempts
+
+    # -----------------------------------------------------
+    # Dial geometry
+    # -----------------------------------------------------
+    @staticmethod
+    def _slot_angle(index, slots, n_chars_mode=True):
+        """Dial angle (0..90) aimed at the centre of a slot."""
+        if n_chars_mode:
+            # AirKeyboard: idx = round(angle / 90 * (n - 1))
+            return index * 90.0 / (slots - 1)
+        # Completion arc: idx = int(angle / 90 * n)
+        return (index + 0.5) * 90.0 / slots
+
+    # -----------------------------------------------------
+    # Simulation
+    # -----------------------------------------------------
+    def run(self, phrase):
+        clock = SimClock()
+        backend = RecordingBackend(clock=clock)
+        keyboard = self.keyboard_factory(backend, clock)
+        keyboard.enabled = True
+        self._clock = clock
+        self._keyboard = keyboard
+        self._backend = backend
+        self._angle = 0.0
+        self._phase = 0.0
+        self._fist = False
+
+        phrase = phrase.upper()
+        unsupported = sorted(set(phrase) - set(keyboard.LETTERS + keyboard.SYMBOLS))
+        if unsupported:
+            raise ValueError(
+                f"Phrase contains characters the keyboard cannot type: {''.join(unsupported)!r} "
+                f"(supported: letters, space and {keyboard.SYMBOLS!r})"
+            )
+        latencies = []
+        wrong = 0
+        actions = 0
+        attempts = {}
+        unreachable = None
+
+        while backend.typed_text() != phrase and clock.now < self.time_limit:
+            typed = backend.typed_text()
+            if not phrase.startswith(typed):
+                # Fix the mistake first
+                start = clock.now
+                self._pinch(PINCH_BACKSPACE)
+                actions += 1
+                latencies.append(clock.now - start)
+                continue
+
+            remaining = phrase[len(typed):]
+            target = remaining[0]
+            attempts[len(typed)] = attempts.get(len(typed), 0) + 1
+            if attempts[len(typed)] > self.max_key_attempts:
+                unreachable = target
+                break
+
+            start = clock.now
+            before = len(backend.events)
+
+            completion = self._completion_for(remaining) if self.use_completions else None
+            if completion is not None:
+                self._aim(completion, len(keyboard.word_tracker.completions), chars=False)
+                self._pinch(PINCH_COMPLETE)
+            elif target == " ":
+                self._pinch(PINCH_SPACE)
+            else:
+                self._fist = target not in keyboard.LETTERS
+                charset = keyboard.SYMBOLS if self._fist else keyboard.LETTERS
+                self._aim(charset.index(target), len(charset), chars=True, target_char=target)
+                self._pinch(PINCH_WRITE)
+                self._fist = False
+
+            actions += 1
+            latencies.append(clock.now - start)
+            new_text = backend.typed_text()
+            if len(backend.events) > before and not phrase.startswith(new_text):
+                wrong += 1
+
+        elapsed = clock.now
+        final = backend.typed_text()
+        lat = np.array(latencies) if latencies else np.zeros(1)
+        return {
+            "phrase": phrase,
+            "typed": final,
+            "completed": final == phrase,
+            "unreachable": unreachable,
+            "seconds": elapsed,
+            "cpm": len(final) / elapsed * 60.0 if elapsed > 0 else 0.0,
+            "actions": actions,
+            "error_rate": wrong / max(actions, 1),
+            "uncorrected_error_rate": _edit_distance(final, phrase) / max(len(phrase), 1),
+            "latency_mean": float(lat.mean()),
+            "latency_p50": float(np.percentile(lat, 50)),
+            "latency_p95": float(np.percentile(lat, 95)),
+        }
+
+    def _completion_for(self, remaining):
+        tracker = self._keyboard.word_tracker
+        if tracker is None or not tracker.current_word:
+            return None
+        word = remaining.split(" ", 1)[0]
+        full = (tracker.current_word + word.lower())
+        # Only worth it when it saves at least two pinches
+        if len(word) < 2 or full not in tracker.completions:
+            return None
+        # Accepting adds a trailing space: only use it when the phrase continues with one
+        if not remaining[len(word):].startswith(" "):
+            return None
+        return tracker.completions.index(full)
+
+    def _step(self, right_angle, pinch=None):
+        """Advance one frame with the dial at right_angle (plus motor noise)."""
+        n = self.noise
+        self._phase += self.dt
+        observed = (right_angle
+                    + self.rng.normal(0.0, n.jitter_deg)
+                    + n.tremor_deg * math.sin(2 * math.pi * n.tremor_hz * self._phase))
+        observed = min(max(observed, 0.0), 90.0)
+        self._keyboard.process(right_hand_at(observed, self._fist), left_hand_pinching(pinch), None)
+        self._clock.advance(self.dt)
+
+    def _selected_ok(self, index, chars, target_char):
+        kb = self._keyboard
+        if chars:
+            return kb.selected_char == target_char
+        return kb.selected_completion == index
+
+    def _aim(self, index, slots, chars, target_char=None):
+        n = self.noise
+        slot_width = 90.0 / max(slots - (1 if chars else 0), 1)
+        max_frames = int(5.0 / self.dt)
+
+        for _attempt in range(4):
+            goal = self._slot_angle(index, slots, chars)
+            distance = goal - self._angle
+            endpoint = goal + self.rng.normal(0.0, n.endpoint_sd * abs(distance))
+            duration = n.movement_time(distance, slot_width)
+            start_angle = self._angle
+            frames = max(1, int(round(duration / self.dt)))
+            for f in range(1, frames + 1):
+                self._angle = start_angle + (endpoint - start_angle) * _min_jerk(f / frames)
+                self._step(self._angle)
+
+            # Wait for the highlight to settle on the target, then react
+            correct_for = 0.0
+            for _ in range(max_frames):
+                self._step(self._angle)
+                if self._selected_ok(index, chars, target_char):
+                    correct_for += self.dt
+                    if correct_for >= n.reaction_time:
+                        return
+                else:
+                    correct_for = 0.0
+                    # Corrective sub-movement once the smoothing has caught up
+                    kb_angle = abs(self._keyboard.smooth_angle)
+                    if abs(kb_angle - self._angle) < slot_width / 2:
+                        break
+
+    def _pinch(self, finger_tip, max_hold=1.0):
+        before = len(self._backend.events)
+        held = 0.0
+        while len(self._backend.events) == before and held < max_hold:
+            self._step(self._angle, pinch=finger_tip)
+            held += self.dt
+        # Release before the next action
+        for _ in range(max(1, int(0.1 / self.dt))):
+            self._step(self._angle)
+
+
+def _edit_distance(a, b):
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i]
+        for j, cb in enumerate(b, 1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb)))
+        prev = cur
+    return prev[-1]
+
+
+def summarize(results):
+    keys = ("cpm", "error_rate", "uncorrected_error_rate",
+            "latency_mean", "latency_p50", "latency_p95")
+    return {k: float(np.mean([r[k] for r in results])) for k in keys}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="AirKeyboard typing-throughput benchmark")
+    parser.add_argument("--phrase", default="THE QUICK BROWN FOX")
+    parser.add_argument("--trials", type=int, default=5)
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--jitter", type=float, default=0.8, help="Per-frame angle noise (deg)")
+    parser.add_argument("--tremor", type=float, default=0.5, help="Tremor amplitude (deg)")
+    parser.add_argument("--reaction", type=float, default=0.2, help="Reaction time (s)")
+    parser.add_argument("--smoothing", type=float, default=None, help="Override DIAL_SMOOTHING")
+    parser.add_argument("--pinch-threshold", type=float, default=None, help="Override PINCH_T")
+    parser.add_argument("--action-delay", type=float, default=None, help="Override action_delay")
+    parser.add_argument("--completions", action="store_true",
+                        help="Use word completion (keyboard_control/words.txt)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    tracker_factory = None
+    if args.completions:
+        from keyboard_control.word_completion import CompletionTrie, WordTracker
+        trie = CompletionTrie.load("keyboard_control/words.txt")
+        tracker_factory = lambda: WordTracker(trie, k=3)
+
+    def keyboard_factory(backend, clock):
+        kb = AirKeyboard(
+            word_tracker=tracker_factory() if tracker_factory else None,
+            input_backend=backend, clock=clock
+        )
+        if args.smoothing is not None:
+            kb.DIAL_SMOOTHING = args.smoothing
+        if args.pinch_threshold is not None:
+            kb.PINCH_T = args.pinch_threshold
+        if args.action_delay is not None:
+            kb.action_delay = args.action_delay
+        return kb
+
+    noise = MotorNoise(jitter_deg=args.jitter, tremor_deg=args.tremor,
+                       reaction_time=args.reaction)
+    results = []
+    for trial in range(args.trials):
+        sim = TypingSimulator(keyboard_factory, noise, fps=args.fps,
+                              use_completions=args.completions, seed=args.seed + trial)
+        try:
+            result = sim.run(args.phrase)
+        except ValueError as e:
+            parser.error(str(e))
+        results.append(result)
+        print(f"Trial {trial + 1}: {result['cpm']:.1f} CPM, "
+              f"errors {result['error_rate']:.1%}, typed '{result['typed']}'")
+        if result["unreachable"] is not None:
+            print(f"  Gave up: key '{result['unreachable']}' unreachable "
+                  f"after {sim.max_key_attempts} attempts")
+
+    s = summarize(results)
+    print("-" * 60)
+    print(f"CPM:                  {s['cpm']:.1f}")
+    print(f"Error rate:           {s['error_rate']:.1%}")
+    print(f"Uncorrected errors:   {s['uncorrected_error_rate']:.1%}")
+    print(f"Keystroke latency:    mean {s['latency_mean'] * 1000:.0f} ms, "
+          f"p50 {s['latency_p50'] * 1000:.0f} ms, p95 {s['latency_p95'] * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+from core.state import SystemState
+
+# Compute units a frame can need. Pipeline stages declare the unit they
+# require (Stage(requires=...)); stage functions check the finer ones.
+FACE_MESH = "face_mesh"    # FaceMesh inference
+HEAD_POSE = "head_pose"    # solvePnP head orientation
+BLINK = "blink"            # Wink clicks
+CURSOR = "cursor"          # Head-driven cursor movement
+HANDS = "hands"            # Hand inference
+TWO_HANDS = "two_hands"    # Hands come from the two-hand tracker
+GESTURES = "gestures"      # Scroll / zoom / volume gestures
+KEYBOARD = "keyboard"      # Air keyboard
+PRESENCE = "presence"      # Lightweight face-presence check (low power)
+
+# What each state needs on its own
+STATE_UNITS = {
+    SystemState.OFF: {FACE_MESH},
+    SystemState.ON: {FACE_MESH, HEAD_POSE, BLINK, CURSOR},
+    SystemState.FROZEN: {FACE_MESH, BLINK},
+    SystemState.PAUSED: {FACE_MESH},
+}
+
+# What each feature toggle adds, whatever the state
+FEATURE_UNITS = {
+    "keyboard": {HANDS, TWO_HANDS, KEYBOARD},
+    "gestures": {HANDS, GESTURES},
+    "calibration": {FACE_MESH, HEAD_POSE},
+}
+
+# Low power replaces everything else
+LOW_POWER_UNITS = {PRESENCE}
+
+
+class ActivationGraph:
+    """
+    Declarative map from (SystemState, feature toggles) to the compute
+    units a frame needs. The pipeline resolves it once per frame and
+    skips every stage and model that is not in the result.
+    """
+
+    def __init__(self, state_units=None, feature_units=None, low_power_units=None):
+        """
+        Args:
+            state_units: {SystemState: set of units} (default STATE_UNITS)
+            feature_units: {feature name: set of units} (default FEATURE_UNITS)
+            low_power_units: Units run while in low-power mode (default LOW_POWER_UNITS)
+        """
+        self.state_units = state_units or STATE_UNITS
+        self.feature_units = feature_units or FEATURE_UNITS
+        self.low_power_units = frozenset(low_power_units or LOW_POWER_UNITS)
+        self._cache = {}
+
+    def resolve(self, state, features=(), low_power=False):
+        """
+        Args:
+            state: Current SystemState
+            features: Names of enabled feature toggles
+            low_power: True while LowPowerMode is active
+
+        Returns:
+            frozenset of unit names to compute this frame
+        """
+        if low_power:
+            return self.low_power_units
+
+        key = (state, frozenset(features))
+        units = self._cache.get(key)
+        if units is None:
+            unknown = key[1] - self.feature_units.keys()
+            if unknown:
+                raise ValueError(f"Unknown feature(s): {', '.join(sorted(unknown))}")
+            units = set(self.state_units.get(state, ()))
+            for feature in key[1]:
+                units |= self.feature_units[feature]
+            units = frozenset(units)
+            self._cache[key] = units
+        return units
+
+    def describe(self):
+        """The whole map as a readable table."""
+        lines = ["Activation map:"]
+        for state, units in self.state_units.items():
+            lines.append(f"  {state.name:<12} -> {', '.join(sorted(units)) or '-'}")
+        for feature, units in self.feature_units.items():
+            lines.append(f"  +{feature:<11} -> {', '.join(sorted(units))}")
+        lines.append(f"  {'low power':<12} -> {', '.join(sorted(self.low_power_units))}")
+        return "\n".join(lines)
+
+
+def format_active(state, features, units):
+    """One-line summary of a resolved activation, for logs and overlays."""
+    label = state.name + "".join(f"+{f}" for f in sorted(features))
+    return f"{label}: {', '.join(sorted(units)) or '-'}"
@@ -1,69 +1,180 @@
 import time
 import numpy as np
-import pyautogui
+
+from utils.input_backend import PyAutoGUIBackend
+from utils.streaming_quantile import StreamingQuantile
 
 
 class BlinkDetector:
+    """
+    Wink clicks from the eye aspect ratio (EAR) of both eyes.
+
+    - Holding one eye closed while the other stays open for
+      BLINK_DURATION_THRESHOLD seconds clicks: left eye = left click,
+      right eye = right click (eyes as seen in the mirrored preview)
+    - Natural blinks close both eyes together and never click; a wink is
+      only timed while the other eye is open, so the uneven end of a
+      blink (one eye reopening a frame early) is far too short to click
+    - The closed threshold of each eye is learned online: streaming
+      estimates of its open level (median EAR) and closed level (5th
+      percentile) place the threshold between them, so narrow and wide
+      eyes both work. EYE_CLOSED_THRESHOLD is used until enough frames
+      have been seen
+    - Durations use the frames' capture timestamps
+    """
+
+    # MediaPipe FaceMesh eye landmarks: corner, upper, upper, corner, lower, lower
+    LEFT_EYE = [33, 160, 158, 133, 153, 144]
+    RIGHT_EYE = [362, 385, 387, 263, 373, 380]
+
+    BUTTONS = ("left", "right")
+
     def __init__(self,
                  eye_closed_threshold=0.20,
-                 blink_duration_threshold=1.0):
-
-        # MediaPipe FaceMesh left eye landmarks
-        self.LEFT_EYE = [33, 160, 158, 133, 153, 144]
-
+                 blink_duration_threshold=0.3,
+                 input_backend=None,
+                 adaptive=True):
+        """
+        Args:
+            eye_closed_threshold: EAR below which an eye is closed (before
+                the per-eye thresholds are learned, or when not adaptive)
+            blink_duration_threshold: Seconds a wink is held to click
+            input_backend: Where clicks go (default: PyAutoGUI)
+            adaptive: Learn per-eye thresholds from this user's EAR
+        """
         self.EYE_CLOSED_THRESHOLD = eye_closed_threshold
         self.BLINK_DURATION_THRESHOLD = blink_duration_threshold
-
-        self.left_eye_closed_start = None
-        self.left_eye_clicked = False
+        self.adaptive = adaptive
+
+        self.input = input_backend or PyAutoGUIBackend()
+
+        # Adaptive thresholds: per eye, open level + CLOSED_FRACTION of the
+        # way down to the closed level, kept within [MIN_RATIO, MAX_RATIO]
+        # of the open level
+        self.CLOSED_FRACTION = 0.5
+        self.MIN_RATIO = 0.55
+        self.MAX_RATIO = 0.8
+        self.REOPEN_MARGIN = 1.15    # Reopened above threshold * margin (hysteresis)
+        self.warmup_frames = 60
+        self.max_gap = 0.25          # Longer tracking gaps cancel a wink
+
+        # Streams: left median, right median, left 5%, right 5%
+        self.levels = StreamingQuantile([0.5, 0.5, 0.05, 0.05], streams=4)
+
+        self._eye_points = self.LEFT_EYE + self.RIGHT_EYE
+        self._scale = np.empty(2)
+        self._samples = np.empty(4)
+        self.ear = np.zeros(2)
+        self.thresholds = np.full(2, eye_closed_threshold)
+        self.reset()
+
+    @property
+    def eye_closed(self):
+        """True while either eye is closed (a wink or blink is being timed)."""
+        return self.closed[0] or self.closed[1]
+
+    def reset(self):
+        """Forget the learned thresholds and wink state (e.g. a new user)."""
+        self.levels.reset()
+        self.frames = 0
+        self.closed = [False, False]     # Per eye, with hysteresis
+        self.wink_start = None           # When the current wink started
+        self.wink_eye = None             # 0 = left, 1 = right
+        self.clicked = False             # The current wink has clicked
+        self.last_time = None
 
     # -----------------------------------------------------
     # Calculate Eye Aspect Ratio (EAR)
     # -----------------------------------------------------
-    def _calculate_EAR(self, landmarks, w, h):
-        points = []
-
-        for idx in self.LEFT_EYE:
-            x = int(landmarks[idx].x * w)
-            y = int(landmarks[idx].y * h)
-            points.append((x, y))
-
-        # Vertical distances
-        A = np.linalg.norm(np.array(points[1]) - np.array(points[5]))
-        B = np.linalg.norm(np.array(points[2]) - np.array(points[4]))
-
-        # Horizontal distance
-        C = np.linalg.norm(np.array(points[0]) - np.array(points[3]))
-
-        ear = (A + B) / (2.0 * C)
-        return ear
+    def eye_aspect_ratios(self, landmarks, w, h):
+        """
+        EAR of both eyes in one step.
+
+        Returns:
+            (2,) array: left, right (reused by the next call)
+        """
+        coords = []
+        for idx in self._eye_points:
+            lm = landmarks[idx]
+            coords.append(lm.x)
+            coords.append(lm.y)
+        self._scale[0], self._scale[1] = w, h
+        pts = np.array(coords).reshape(2, 6, 2) * self._scale
+        # Vertical distances (upper - lower pairs) over the horizontal one
+        d = pts[:, 1:3] - pts[:, 5:3:-1]
+        vertical = np.hypot(d[..., 0], d[..., 1])
+        d = pts[:, 0] - pts[:, 3]
+        horizontal = np.hypot(d[:, 0], d[:, 1])
+        np.divide(vertical[:, 0] + vertical[:, 1], 2.0 * horizontal, out=self.ear)
+        return self.ear
+
+    def _update_thresholds(self, ear):
+        if not self.adaptive:
+            self.thresholds.fill(self.EYE_CLOSED_THRESHOLD)
+            return
+        self._samples[:2] = ear
+        self._samples[2:] = ear
+        self.levels.update(self._samples)
+        self.frames += 1
+        if self.frames < self.warmup_frames:
+            self.thresholds.fill(self.EYE_CLOSED_THRESHOLD)
+            return
+        level = self.levels.value()
+        open_level, closed_level = level[:2], level[2:]
+        threshold = closed_level + self.CLOSED_FRACTION * (open_level - closed_level)
+        np.clip(threshold, self.MIN_RATIO * open_level, self.MAX_RATIO * open_level,
+                out=self.thresholds)
 
     # -----------------------------------------------------
     # Process blink detection
     # -----------------------------------------------------
-    def process(self, landmarks, w, h):
-        ear = self._calculate_EAR(landmarks, w, h)
-
-        current_time = time.time()
-
-        # Eye is closed
-        if ear < self.EYE_CLOSED_THRESHOLD:
-
-            if self.left_eye_closed_start is None:
-                self.left_eye_closed_start = current_time
-
+    def process(self, landmarks, w, h, timestamp=None):
+        """
+        Update with one frame's face landmarks.
+
+        Args:
+            timestamp: Capture time of the frame (default: now)
+
+        Returns:
+            "left_click", "right_click" or None
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        ear = self.eye_aspect_ratios(landmarks, w, h)
+        self._update_thresholds(ear)
+
+        if self.last_time is not None and timestamp - self.last_time > self.max_gap:
+            # Closure across a tracking gap cannot be timed
+            self.wink_start = None
+        self.last_time = timestamp
+
+        for e in (0, 1):
+            if self.closed[e]:
+                self.closed[e] = ear[e] < self.thresholds[e] * self.REOPEN_MARGIN
             else:
-                duration = current_time - self.left_eye_closed_start
-
-                if (duration >= self.BLINK_DURATION_THRESHOLD
-                        and not self.left_eye_clicked):
-
-                    pyautogui.click()
-                    print("Left eye long blink detected → CLICK")
-
-                    self.left_eye_clicked = True
-
-        # Eye is open again → reset
-        else:
-            self.left_eye_closed_start = None
-            self.left_eye_clicked = False
+                self.closed[e] = ear[e] < self.thresholds[e]
+        left, right = self.closed
+
+        if left and right:
+            # Both eyes shut: a natural blink (or squeezing), never a click
+            self.wink_start = None
+            return None
+        if not left and not right:
+            self.wink_start = None
+            self.clicked = False
+            return None
+
+        eye = 0 if left else 1
+        if self.wink_start is None or self.wink_eye != eye:
+            self.wink_start = timestamp
+            self.wink_eye = eye
+            self.clicked = False
+            return None
+
+        if not self.clicked and timestamp - self.wink_start >= self.BLINK_DURATION_THRESHOLD:
+            button = self.BUTTONS[eye]
+            self.input.click(button=button)
+            print(f"{button.capitalize()} eye wink detected → {button.upper()} CLICK")
+            self.clicked = True
+            return f"{button}_click"
+        return None
@@ -1,3 +1,5 @@
+import threading
+
 import cv2
 
 class Camera:
@@ -10,11 +12,44 @@ class Camera:
         if not self.cap.isOpened():
             raise RuntimeError("Could not open webcam")
         
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        self.width = None
+        self.height = None
+        # Settings queued by other threads, applied by read()
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self.set_resolution(width, height)
+        self._apply_pending()
+    
+    def set_resolution(self, width, height):
+        """
+        Request a new capture resolution (no-op if unchanged).
+        Like set_fps, safe to call from any thread: it is applied by the
+        thread calling read(), before the next capture.
+        """
+        with self._pending_lock:
+            self._pending["resolution"] = (width, height)
+    
+    def set_fps(self, fps):
+        """Request a capture frame rate (drivers may ignore it)."""
+        with self._pending_lock:
+            self._pending["fps"] = fps
+    
+    def _apply_pending(self):
+        if not self._pending:
+            return
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        resolution = pending.get("resolution")
+        if resolution is not None and resolution != (self.width, self.height):
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, resolution[0])
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, resolution[1])
+            self.width, self.height = resolution
+        if "fps" in pending:
+            self.cap.set(cv2.CAP_PROP_FPS, pending["fps"])
     
     def read(self):
         """Read a frame from the camera."""
+        self._apply_pending()
         ret, frame = self.cap.read()
         if not ret:
             return None
@@ -1,8 +1,83 @@
-import pyautogui
+import math
 import threading
 import time
 from collections import deque
 
+from core.screen_geometry import VirtualDesktop
+from utils.input_backend import PyAutoGUIBackend
+from utils.profiler import get_tracer
+
+
+class VelocityMapper:
+    """
+    Joystick-style mapping: head deflection from the calibrated centre
+    sets the cursor velocity instead of its position.
+    
+    Speed follows a power curve of the deflection beyond a dead zone
+    (pointer ballistics: slow and precise near the centre, fast at large
+    deflections). It is expressed in device-independent pixels per second
+    and multiplied by the DPI scale of the monitor under the cursor, so
+    it feels the same whatever the resolution or number of monitors.
+    """
+    
+    def __init__(self, max_deflection=(15.0, 10.0), dead_zone=0.12,
+                 max_speed=1500.0, exponent=2.0, max_dt=0.1):
+        """
+        Args:
+            max_deflection: (yaw, pitch) degrees that give full speed
+            dead_zone: Normalized deflection with no movement
+            max_speed: Full speed in device-independent pixels per second
+            exponent: Ballistics curve exponent (1 = linear)
+            max_dt: Longest time step integrated at once (avoids jumps after stalls)
+        """
+        self.max_deflection = max_deflection
+        self.dead_zone = dead_zone
+        self.max_speed = max_speed
+        self.exponent = exponent
+        self.max_dt = max_dt
+        self.position = None
+        self.last_time = None
+    
+    def reset(self, position):
+        self.position = [float(position[0]), float(position[1])]
+        self.last_time = None
+    
+    def speed(self, deflection):
+        """Speed (DIP/s) for a normalized deflection."""
+        if deflection <= self.dead_zone:
+            return 0.0
+        t = min(1.0, (deflection - self.dead_zone) / (1.0 - self.dead_zone))
+        return self.max_speed * t ** self.exponent
+    
+    def step(self, yaw, pitch, now, desktop, margin=0):
+        """
+        Integrate one frame.
+        
+        Args:
+            yaw, pitch: Deflection from centre in degrees (+yaw right, +pitch up)
+            now: Timestamp in seconds
+            desktop: VirtualDesktop to stay on
+        
+        Returns:
+            (x, y) cursor position
+        """
+        if self.position is None:
+            self.reset(desktop.primary.clamp(desktop.primary.x + desktop.primary.width / 2,
+                                             desktop.primary.y + desktop.primary.height / 2))
+        dt = 0.0 if self.last_time is None else min(self.max_dt, now - self.last_time)
+        self.last_time = now
+        
+        nx = yaw / self.max_deflection[0]
+        ny = -pitch / self.max_deflection[1]
+        deflection = math.hypot(nx, ny)
+        if deflection > 0 and dt > 0:
+            x, y = self.position
+            v = self.speed(deflection) * desktop.monitor_at(x, y).scale
+            x += v * dt * nx / deflection
+            y += v * dt * ny / deflection
+            self.position = list(desktop.clamp(x, y, margin))
+        return int(self.position[0]), int(self.position[1])
+
 class CursorController:
     """
     Controls the system cursor based on head orientation.
@@ -10,7 +85,11 @@ class CursorController:
     Based on Kalash's implementation.
     """
     
-    def __init__(self, sensitivity_x=20, sensitivity_y=10, filter_length=8):
+    MODES = ("absolute", "velocity")
+    
+    def __init__(self, sensitivity_x=20, sensitivity_y=10, filter_length=8,
+                 input_backend=None, screen_size=None, start_thread=True,
+                 desktop=None, mode="absolute", velocity=None, clock=time.time):
         """
         Initialize cursor controller.
         
@@ -18,11 +97,36 @@ class CursorController:
             sensitivity_x: Yaw range (degrees) for full screen width
             sensitivity_y: Pitch range (degrees) for full screen height
             filter_length: Number of frames to average for smoothing
+            input_backend: Where cursor moves go (default: PyAutoGUIBackend)
+            screen_size: (width, height) of a single virtual screen
+            start_thread: Start the background mover thread (headless
+                benchmarks read get_position() instead)
+            desktop: VirtualDesktop with all monitors (default: detected)
+            mode: "absolute" (head angle -> position on the current
+                monitor) or "velocity" (head deflection -> cursor speed,
+                across all monitors)
+            velocity: VelocityMapper for velocity mode
+            clock: Time source for velocity mode
         """
-        # Get screen dimensions
-        self.MONITOR_WIDTH, self.MONITOR_HEIGHT = pyautogui.size()
-        self.CENTER_X = self.MONITOR_WIDTH // 2
-        self.CENTER_Y = self.MONITOR_HEIGHT // 2
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown cursor mode '{mode}' (choose from {', '.join(self.MODES)})")
+        self.input = input_backend or PyAutoGUIBackend()
+        
+        # Get screen dimensions (all monitors)
+        if screen_size is not None:
+            desktop = VirtualDesktop.single(*screen_size)
+        elif desktop is None:
+            desktop = VirtualDesktop.from_system(fallback_size=self.input.screen_size())
+        self.desktop = desktop
+        primary = desktop.primary
+        self.CENTER_X = primary.x + primary.width // 2
+        self.CENTER_Y = primary.y + primary.height // 2
+        # Absolute mode maps the head-angle range onto one monitor
+        self.set_monitor(primary)
+        
+        self.mode = mode
+        self.velocity = velocity or VelocityMapper()
+        self.clock = clock
         
         # Control parameters
         self.sensitivity_x = sensitivity_x  # yaw range
@@ -42,9 +146,12 @@ class CursorController:
         self.mouse_lock = threading.Lock()
         
         # Start mouse movement thread
-        self.running = True
-        self.mouse_thread = threading.Thread(target=self._mouse_mover, daemon=True)
-        self.mouse_thread.start()
+        self.running = start_thread
+        self.mouse_thread = threading.Thread(
+            target=self._mouse_mover, name="cursor-mover", daemon=True
+        )
+        if start_thread:
+            self.mouse_thread.start()
     
     def _mouse_mover(self):
         """Background thread that smoothly moves the mouse to target position."""
@@ -52,8 +159,13 @@ class CursorController:
             if self.mouse_control_enabled:
                 with self.mouse_lock:
                     x, y = self.mouse_target
+                tracer = get_tracer()
                 try:
-                    pyautogui.moveTo(x, y)
+                    if tracer.enabled:
+                        with tracer.span("mouse_move", "input"):
+                            self.input.move_to(x, y)
+                    else:
+                        self.input.move_to(x, y)
                 except:
                     pass  # Handle pyautogui errors gracefully
             time.sleep(0.01)  # 100Hz update rate
@@ -73,13 +185,83 @@ class CursorController:
         # Add to smoothing filter
         self.ray_directions.append(forward_axis)
         
-        # Apply calibration
-        calibrated_yaw = yaw + self.calibration_offset_yaw
-        calibrated_pitch = pitch + self.calibration_offset_pitch
+        self.set_target(*self.head_target(pitch, yaw))
+    
+    def set_target(self, screen_x, screen_y):
+        """
+        Move the cursor target to a screen position computed elsewhere
+        (see core.gaze_fusion for the available target sources).
+        """
+        if not self.mouse_control_enabled:
+            return
+        
+        # Update target position
+        with self.mouse_lock:
+            self.mouse_target[:] = [screen_x, screen_y]
+    
+    def head_target(self, pitch, yaw):
+        """Screen position for a head pose in the current mapping mode."""
+        if self.mode == "velocity":
+            yaw_dev, pitch_dev = self._calibrated(pitch, yaw)
+            return self.velocity.step(yaw_dev - 180, pitch_dev - 180, self.clock(),
+                                      self.desktop, margin=10)
+        return self.map_angles(pitch, yaw)
+    
+    def warp(self, screen_x, screen_y):
+        """
+        Jump the mapping to a screen position (used by gaze jumps).
+        Only possible in velocity mode; returns False in absolute mode,
+        where the position is a function of the head angle.
+        """
+        if self.mode != "velocity":
+            return False
+        self.velocity.reset(self.desktop.clamp(screen_x, screen_y, 10))
+        return True
+    
+    def set_monitor(self, monitor):
+        """Monitor that absolute mode maps onto."""
+        self.monitor = monitor
+        self.MONITOR_WIDTH, self.MONITOR_HEIGHT = monitor.width, monitor.height
+    
+    def clamp(self, x, y, margin=10):
+        """
+        Nearest reachable point: on the current monitor in absolute mode,
+        on any monitor in velocity mode.
+        """
+        if self.mode == "velocity":
+            return self.desktop.clamp(x, y, margin)
+        return self.monitor.clamp(x, y, margin)
+    
+    def set_mode(self, mode):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown cursor mode '{mode}'")
+        if mode == "velocity" and self.mode != "velocity":
+            # Continue from where the cursor is
+            self.velocity.reset(self.get_position())
+        elif mode == "absolute" and self.mode != "absolute":
+            # Stay on the monitor velocity mode moved the cursor to
+            self.set_monitor(self.desktop.monitor_at(*self.get_position()))
+        self.mode = mode
+        print(f"[Cursor Controller] Mapping mode: {mode}")
+    
+    def toggle_mode(self):
+        self.set_mode(self.MODES[(self.MODES.index(self.mode) + 1) % len(self.MODES)])
+        return self.mode
+    
+    def _calibrated(self, pitch, yaw):
+        """Calibrated angles, 180 = straight ahead."""
+        return (yaw + self.calibration_offset_yaw) % 360, (pitch + self.calibration_offset_pitch) % 360
+    
+    def map_angles(self, pitch, yaw):
+        """
+        Map raw head angles to a screen position (calibration, dead zone,
+        sensitivity and clamping), without touching the cursor.
         
-        # Normalize angles to 0-360 range
-        calibrated_yaw = calibrated_yaw % 360
-        calibrated_pitch = calibrated_pitch % 360
+        Returns:
+            (screen_x, screen_y) in pixels
+        """
+        # Apply calibration, normalized to the 0-360 range
+        calibrated_yaw, calibrated_pitch = self._calibrated(pitch, yaw)
         
         # Dead zone for center position
         if abs(calibrated_yaw - 180) < 2:
@@ -87,26 +269,21 @@ class CursorController:
         if abs(calibrated_pitch - 180) < 3:
             calibrated_pitch = 180
         
-        # Map angles to screen coordinates
+        # Map angles onto the current monitor (velocity mode crosses monitors)
         # Yaw: 180 is center, (180-range) is left, (180+range) is right
-        screen_x = int(
+        screen_x = self.monitor.x + int(
             ((calibrated_yaw - (180 - self.sensitivity_x)) / (2 * self.sensitivity_x)) 
             * self.MONITOR_WIDTH
         )
         
         # Pitch: 180 is center, (180+range) is up, (180-range) is down
-        screen_y = int(
+        screen_y = self.monitor.y + int(
             ((180 + self.sensitivity_y - calibrated_pitch) / (2 * self.sensitivity_y)) 
             * self.MONITOR_HEIGHT
         )
         
-        # Clamp to screen boundaries (with small margin)
-        screen_x = max(10, min(self.MONITOR_WIDTH - 10, screen_x))
-        screen_y = max(10, min(self.MONITOR_HEIGHT - 10, screen_y))
-        
-        # Update target position
-        with self.mouse_lock:
-            self.mouse_target[:] = [screen_x, screen_y]
+        # Clamp onto the monitor (with small margin)
+        return self.monitor.clamp(screen_x, screen_y, margin=10)
     
     def calibrate(self, raw_yaw, raw_pitch):
         """
@@ -1,3 +1,5 @@
+import threading
+
 import cv2
 import mediapipe as mp
 
@@ -6,23 +8,76 @@ class FaceDetector:
     Handles face detection and landmark extraction using MediaPipe.
     Based on Om's implementation.
     """
-    def __init__(self):
+    def __init__(self, refine_landmarks=True, input_scale=1.0, max_faces=1):
+        """
+        Args:
+            refine_landmarks: Run the iris refinement model
+            input_scale: Downscale factor applied before inference
+            max_faces: Faces FaceMesh looks for (more than one for the
+                active-user lock, see core.face_tracker)
+        """
         self.mp_face_mesh = mp.solutions.face_mesh
-        self.face_mesh = self.mp_face_mesh.FaceMesh(
+        self.refine_landmarks = refine_landmarks
+        self.input_scale = input_scale
+        self.max_faces = max_faces
+        self.face_mesh = self._create_face_mesh()
+        # Option changes queued by other threads, applied by process()
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self.drawer = mp.solutions.drawing_utils
+        self.draw_style = mp.solutions.drawing_styles
+    
+    def _create_face_mesh(self):
+        return self.mp_face_mesh.FaceMesh(
             static_image_mode=False,
-            max_num_faces=1,
-            refine_landmarks=True,
+            max_num_faces=self.max_faces,
+            refine_landmarks=self.refine_landmarks,
             min_detection_confidence=0.5,
             min_tracking_confidence=0.5
         )
-        self.drawer = mp.solutions.drawing_utils
-        self.draw_style = mp.solutions.drawing_styles
+    
+    def configure(self, refine_landmarks=None, input_scale=None):
+        """
+        Change model options at runtime.
+        Safe to call from any thread: the change is queued and applied by
+        the thread running process(), before its next frame, so the graph
+        is never closed while it is in use. The FaceMesh graph is only
+        rebuilt when a graph option changes.
+        """
+        with self._pending_lock:
+            if refine_landmarks is not None:
+                self._pending["refine_landmarks"] = refine_landmarks
+            if input_scale is not None:
+                self._pending["input_scale"] = input_scale
+    
+    def _apply_pending(self):
+        if not self._pending:
+            return
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        self.input_scale = pending.get("input_scale", self.input_scale)
+        refine_landmarks = pending.get("refine_landmarks", self.refine_landmarks)
+        if refine_landmarks != self.refine_landmarks:
+            self.refine_landmarks = refine_landmarks
+            self.face_mesh.close()
+            self.face_mesh = self._create_face_mesh()
+    
+    def reset(self):
+        """Drop tracking state, e.g. before processing a different clip."""
+        self.face_mesh.close()
+        self.face_mesh = self._create_face_mesh()
     
     def process(self, frame):
         """
         Process a frame and detect face landmarks.
         Returns MediaPipe results object.
         """
+        self._apply_pending()
+        if self.input_scale != 1.0:
+            frame = cv2.resize(
+                frame, None, fx=self.input_scale, fy=self.input_scale,
+                interpolation=cv2.INTER_AREA
+            )
         rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         return self.face_mesh.process(rgb)
     
@@ -0,0 +1,253 @@
+import numpy as np
+
+from core.head_pose import HeadPoseEstimator
+
+
+def box_iou(a, b):
+    """
+    Pairwise IoU of (n, 4) and (m, 4) boxes (x_min, y_min, x_max, y_max).
+
+    Returns:
+        (n, m) array
+    """
+    x1 = np.maximum(a[:, None, 0], b[None, :, 0])
+    y1 = np.maximum(a[:, None, 1], b[None, :, 1])
+    x2 = np.minimum(a[:, None, 2], b[None, :, 2])
+    y2 = np.minimum(a[:, None, 3], b[None, :, 3])
+    inter = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+    area_a = (a[:, 2] - a[:, 0]) * (a[:, 3] - a[:, 1])
+    area_b = (b[:, 2] - b[:, 0]) * (b[:, 3] - b[:, 1])
+    union = area_a[:, None] + area_b[None, :] - inter
+    return np.where(union > 0, inter / np.maximum(union, 1e-12), 0.0)
+
+
+class FaceTrack:
+    """One face followed across frames."""
+
+    def __init__(self, track_id, box, timestamp):
+        self.id = track_id
+        self.box = box               # Normalized (x_min, y_min, x_max, y_max)
+        self.landmarks = None        # MediaPipe landmarks of the latest frame
+        self.pose = None             # (pitch, yaw, forward_axis) of the latest frame
+        self.first_seen = timestamp
+        self.last_seen = timestamp
+        self.hits = 1                # Consecutive frames seen
+        self.misses = 0              # Consecutive frames missed
+
+    @property
+    def area(self):
+        return (self.box[2] - self.box[0]) * (self.box[3] - self.box[1])
+
+    @property
+    def center(self):
+        return (self.box[0] + self.box[2]) / 2, (self.box[1] + self.box[3]) / 2
+
+    def __repr__(self):
+        return f"FaceTrack(id={self.id}, hits={self.hits}, misses={self.misses})"
+
+
+class FaceTracker:
+    """
+    Keeps face IDs stable across frames by bounding-box overlap.
+
+    Boxes come from the five head-pose key points (cheek edges, forehead,
+    chin, nose tip), which are gathered anyway for the batched pose, so
+    association costs one small IoU matrix per frame rather than a pass
+    over every landmark. Faces are matched greedily by descending IoU;
+    unmatched faces start new tracks and tracks unseen for `max_misses`
+    frames are dropped.
+    """
+
+    def __init__(self, iou_threshold=0.3, max_misses=10):
+        self.iou_threshold = iou_threshold
+        self.max_misses = max_misses
+        self.tracks = []
+        self.next_id = 1
+
+    def reset(self):
+        self.tracks = []
+
+    @staticmethod
+    def boxes(points):
+        """(n, 4) boxes from (n, 5, 3) key points."""
+        xy = points[:, :, :2]
+        return np.concatenate([xy.min(axis=1), xy.max(axis=1)], axis=1)
+
+    def update(self, points, timestamp):
+        """
+        Associate this frame's faces with the existing tracks.
+
+        Args:
+            points: (n, 5, 3) key points (HeadPoseEstimator.key_points)
+            timestamp: Capture time of the frame
+
+        Returns:
+            List of n tracks, aligned with the faces in `points`
+        """
+        boxes = self.boxes(points) if len(points) else np.empty((0, 4))
+        assigned = [None] * len(boxes)
+        free = list(range(len(self.tracks)))
+
+        if self.tracks and len(boxes):
+            iou = box_iou(np.array([t.box for t in self.tracks]), boxes)
+            # Greedy: best pairs first; there are only a handful of faces
+            for flat in np.argsort(-iou, axis=None):
+                t, d = divmod(int(flat), len(boxes))
+                if iou[t, d] < self.iou_threshold:
+                    break
+                if assigned[d] is not None or t not in free:
+                    continue
+                track = self.tracks[t]
+                track.box = boxes[d]
+                track.last_seen = timestamp
+                track.hits += 1
+                track.misses = 0
+                assigned[d] = track
+                free.remove(t)
+
+        for t in free:
+            track = self.tracks[t]
+            track.misses += 1
+            track.hits = 0
+        self.tracks = [t for t in self.tracks if t.misses <= self.max_misses]
+
+        for d, box in enumerate(boxes):
+            if assigned[d] is None:
+                track = FaceTrack(self.next_id, box, timestamp)
+                self.next_id += 1
+                self.tracks.append(track)
+                assigned[d] = track
+        return assigned
+
+
+class ActiveUserLock:
+    """
+    Decides which face drives the cursor and clicks when several are in view.
+
+    With no user enrolled, the lock enrolls a face that has been seen for
+    `enroll_frames` consecutive frames while facing the screen
+    (yaw within max_yaw of straight ahead), preferring the largest (closest) one. From then on
+    only that face is active; other faces, such as someone walking behind,
+    are ignored. If the user's track is lost (occlusion, turning away), a
+    face that reappears where the user was within `release_after` seconds
+    is taken to be the same user. After that, the lock is released and a new
+    user can enroll, unless the caller holds automatic enrollment off (while
+    cursor control is ON, a passer-by must not take over); enroll() always
+    switches to the face in view.
+
+    Each update runs the tracker and estimates head pose for all faces
+    in one vectorized batch.
+    """
+
+    def __init__(self, tracker=None, head_pose=None, enroll_frames=5,
+                 max_yaw=25.0, release_after=2.0, reacquire_iou=0.2):
+        self.tracker = tracker or FaceTracker()
+        self.head_pose = head_pose or HeadPoseEstimator()
+        self.enroll_frames = enroll_frames
+        self.max_yaw = max_yaw
+        self.release_after = release_after
+        self.reacquire_iou = reacquire_iou
+
+        self.user_id = None           # Enrolled track
+        self.user_box = None          # Where the user was last seen
+        self.user_seen = None         # When the user was last seen
+        self.enrollments = 0          # Changes when a (possibly different) user enrolls
+        self.tracks = []              # Faces of the latest frame
+        self._enroll_requested = False
+        self._points = None
+
+    def enroll(self):
+        """Re-enroll on the next frame (e.g. when the user presses C)."""
+        self._enroll_requested = True
+
+    def release(self):
+        if self.user_id is not None:
+            print(f"[Active User] Released face {self.user_id}")
+        self.user_id = None
+        self.user_box = None
+        self.user_seen = None
+
+    def update(self, faces, frame_width, frame_height, timestamp, estimate_pose=True,
+               auto_enroll=True):
+        """
+        Track this frame's faces and pick the active one.
+
+        Args:
+            faces: MediaPipe face landmark lists (result.multi_face_landmarks
+                entries' .landmark), possibly empty
+            estimate_pose: Compute head pose for every face
+            auto_enroll: Enroll a steady face when nobody is enrolled
+
+        Returns:
+            The active FaceTrack (with .landmarks and .pose set), or None
+        """
+        n = len(faces)
+        if self._points is None or len(self._points) < n:
+            self._points = np.empty((max(n, 4), len(HeadPoseEstimator.KEY_POINTS), 3))
+        points = HeadPoseEstimator.key_points(faces, out=self._points[:n])
+        tracks = self.tracker.update(points, timestamp)
+        if estimate_pose and n:
+            pitch, yaw, forward = self.head_pose.estimate_batch(points, frame_width, frame_height)
+        for i, track in enumerate(tracks):
+            track.landmarks = faces[i]
+            track.pose = (float(pitch[i]), float(yaw[i]), forward[i]) if estimate_pose else None
+        self.tracks = tracks
+
+        if self._enroll_requested and tracks:
+            self._enroll_requested = False
+            self.release()
+            self._enroll(self._best(tracks, require_steady=False), timestamp)
+
+        active = None
+        if self.user_id is not None:
+            active = next((t for t in tracks if t.id == self.user_id), None)
+            if active is None:
+                active = self._reacquire(tracks, timestamp)
+            if active is None and timestamp - self.user_seen > self.release_after:
+                self.release()
+        if self.user_id is None and auto_enroll:
+            candidate = self._best(tracks, require_steady=True)
+            if candidate is not None:
+                self._enroll(candidate, timestamp)
+                active = candidate
+
+        if active is not None:
+            self.user_box = active.box
+            self.user_seen = timestamp
+        return active
+
+    def _facing(self, track):
+        # HeadPoseEstimator gives +-180 degrees yaw for a face looking at the camera
+        return track.pose is None or 180.0 - abs(track.pose[1]) <= self.max_yaw
+
+    def _best(self, tracks, require_steady):
+        candidates = [t for t in tracks if self._facing(t)
+                      and (not require_steady or t.hits >= self.enroll_frames)]
+        if not candidates:
+            return None
+        return max(candidates, key=lambda t: t.area)
+
+    def _enroll(self, track, timestamp):
+        if track is None:
+            return
+        self.user_id = track.id
+        self.user_box = track.box
+        self.user_seen = timestamp
+        self.enrollments += 1
+        print(f"[Active User] Locked to face {track.id}")
+
+    def _reacquire(self, tracks, timestamp):
+        """A new track where the lost user just was is the same user."""
+        new = [t for t in tracks if t.first_seen > self.user_seen]
+        if not new or timestamp - self.user_seen > self.release_after:
+            return None
+        iou = box_iou(np.asarray([self.user_box]), np.array([t.box for t in new]))[0]
+        best = int(np.argmax(iou))
+        if iou[best] < self.reacquire_iou:
+            return None
+        self.user_id = new[best].id
+        return new[best]
+
+    def describe(self):
+        user = f"face {self.user_id}" if self.user_id is not None else "nobody"
+        return f"{len(self.tracks)} face(s), active: {user}"
@@ -0,0 +1,190 @@
+import math
+
+
+class GazeEstimator:
+    """
+    Coarse eye-in-head gaze from refined FaceMesh landmarks.
+
+    The iris centre is located relative to the midpoint of the eye
+    corners and expressed in eye widths, along the corner axis
+    (horizontal) and perpendicular to it (vertical). Both eyes are
+    averaged, smoothed and measured relative to a calibrated neutral.
+    This needs the 478-point mesh (refine_landmarks=True).
+    """
+
+    # (iris centre, corner, corner) per eye
+    EYES = ((468, 33, 133), (473, 362, 263))
+    NUM_LANDMARKS = 478
+
+    def __init__(self, smoothing=0.35):
+        """
+        Args:
+            smoothing: EMA weight of the newest sample (1 = no smoothing)
+        """
+        self.smoothing = smoothing
+        self.neutral = (0.0, 0.0)
+        self.offset = None
+
+    @staticmethod
+    def _eye_offset(landmarks, eye, w, h):
+        iris, c0, c1 = (landmarks[i] for i in eye)
+        ax, ay = c0.x * w, c0.y * h
+        bx, by = c1.x * w, c1.y * h
+        # Corner axis pointing towards the image right, whichever eye this is
+        ex, ey = bx - ax, by - ay
+        if ex < 0:
+            ex, ey = -ex, -ey
+        width = math.hypot(ex, ey)
+        if width < 1e-6:
+            return None
+        ux, uy = ex / width, ey / width
+        dx = iris.x * w - (ax + bx) / 2
+        dy = iris.y * h - (ay + by) / 2
+        return (dx * ux + dy * uy) / width, (dy * ux - dx * uy) / width
+
+    def raw(self, landmarks, w, h):
+        """Unsmoothed, uncalibrated (horizontal, vertical) offset, or None."""
+        if len(landmarks) < self.NUM_LANDMARKS:
+            return None
+        sx = sy = 0.0
+        n = 0
+        for eye in self.EYES:
+            offset = self._eye_offset(landmarks, eye, w, h)
+            if offset is not None:
+                sx += offset[0]
+                sy += offset[1]
+                n += 1
+        if n == 0:
+            return None
+        return sx / n, sy / n
+
+    def estimate(self, landmarks, w, h):
+        """
+        Smoothed gaze offset relative to neutral, in eye widths
+        (+x towards the image right, +y down), or None without iris landmarks.
+        """
+        raw = self.raw(landmarks, w, h)
+        if raw is None:
+            return None
+        gx, gy = raw[0] - self.neutral[0], raw[1] - self.neutral[1]
+        if self.offset is None:
+            self.offset = (gx, gy)
+        else:
+            a = self.smoothing
+            self.offset = (self.offset[0] + a * (gx - self.offset[0]),
+                           self.offset[1] + a * (gy - self.offset[1]))
+        return self.offset
+
+    def calibrate(self, landmarks, w, h):
+        """Take the current iris position as looking straight ahead."""
+        raw = self.raw(landmarks, w, h)
+        if raw is not None:
+            self.neutral = raw
+            self.offset = None
+
+
+class HeadPoseSource:
+    """Cursor target from head pose only (CursorController.head_target)."""
+
+    name = "head"
+
+    def target(self, controller, pose, landmarks, w, h):
+        pitch, yaw, _ = pose
+        return controller.head_target(pitch, yaw)
+
+    def calibrate(self, landmarks, w, h):
+        pass
+
+    def reset(self):
+        pass
+
+
+class GazeFusionSource:
+    """
+    Cursor target from gaze and head pose combined.
+
+    The gaze point is the head-pose point shifted by the eye-in-head
+    offset. When it stays more than `jump_fraction` of the screen away
+    from the cursor for `fixation_frames` frames, the cursor jumps
+    there. For `settle_frames` frames after a jump it keeps following
+    the gaze point: the head turning towards the target is cancelled
+    out by the eyes turning back. After that the offset freezes, and
+    head pose alone does the fine positioning. In velocity mapping the
+    jump moves the cursor itself (CursorController.warp) instead of an
+    offset. Without iris landmarks the source behaves like HeadPoseSource
+    with the last offset, and says so once.
+    """
+
+    name = "gaze"
+
+    def __init__(self, estimator=None, gain=(2.5, 4.0), jump_fraction=0.2,
+                 fixation_frames=3, settle_frames=10, margin=10):
+        """
+        Args:
+            estimator: GazeEstimator (default: a new one)
+            gain: Screen widths/heights per eye width of iris offset (x, y)
+            jump_fraction: Gaze-to-cursor distance (fraction of screen width) that triggers a jump
+            fixation_frames: Consecutive far frames before jumping (filters out glances and noise)
+            settle_frames: Frames the cursor follows the gaze point after a jump
+            margin: Screen-edge margin in pixels
+        """
+        self.estimator = estimator or GazeEstimator()
+        self.gain = gain
+        self.jump_fraction = jump_fraction
+        self.fixation_frames = fixation_frames
+        self.settle_frames = settle_frames
+        self.margin = margin
+        self.degraded = False
+        self.reset()
+
+    def reset(self):
+        self.offset = (0.0, 0.0)
+        self.far_frames = 0
+        self.settling = 0
+        self.jumps = 0
+
+    def calibrate(self, landmarks, w, h):
+        self.estimator.calibrate(landmarks, w, h)
+        self.reset()
+
+    def target(self, controller, pose, landmarks, w, h):
+        pitch, yaw, _ = pose
+        hx, hy = controller.head_target(pitch, yaw)
+        sw, sh = controller.MONITOR_WIDTH, controller.MONITOR_HEIGHT
+
+        gaze = self.estimator.estimate(landmarks, w, h)
+        if (gaze is None) != self.degraded:
+            self.degraded = gaze is None
+            print("[Gaze] No iris landmarks, falling back to head pose" if self.degraded
+                  else "[Gaze] Iris landmarks back, gaze fusion resumed")
+        if gaze is not None:
+            # Gaze = where the head points plus where the eyes point in the head
+            ax, ay = (controller.map_angles(pitch, yaw)
+                      if controller.mode == "velocity" else (hx, hy))
+            gx = ax + gaze[0] * self.gain[0] * sw
+            gy = ay + gaze[1] * self.gain[1] * sh
+            cx, cy = hx + self.offset[0], hy + self.offset[1]
+
+            if self.settling > 0:
+                hx, hy = self._jump_to(controller, gx, gy, hx, hy)
+                self.settling -= 1
+            elif math.hypot(gx - cx, gy - cy) > self.jump_fraction * sw:
+                self.far_frames += 1
+                if self.far_frames >= self.fixation_frames:
+                    hx, hy = self._jump_to(controller, gx, gy, hx, hy)
+                    self.settling = self.settle_frames
+                    self.far_frames = 0
+                    self.jumps += 1
+            else:
+                self.far_frames = 0
+
+        return controller.clamp(int(hx + self.offset[0]), int(hy + self.offset[1]),
+                                self.margin)
+
+    def _jump_to(self, controller, gx, gy, hx, hy):
+        """Move the cursor to the gaze point; returns the new head point."""
+        if controller.warp(gx, gy):
+            self.offset = (0.0, 0.0)
+            return gx, gy
+        self.offset = (gx - hx, gy - hy)
+        return hx, hy
@@ -16,6 +16,9 @@ class HeadPoseEstimator:
         "front": 1        # Nose tip
     }
     
+    # Key point order used by estimate_batch
+    KEY_POINTS = np.array(list(LANDMARKS.values()))
+    
     def __init__(self):
         pass
     
@@ -92,3 +95,64 @@ class HeadPoseEstimator:
             pitch = -pitch
         
         return pitch, yaw, forward_axis
+    
+    @classmethod
+    def key_points(cls, faces, out=None):
+        """
+        Gather the pose landmarks of several faces into one array.
+        
+        Args:
+            faces: Sequence of MediaPipe face landmark lists
+            out: Optional preallocated (n, 5, 3) array
+            
+        Returns:
+            (n, 5, 3) normalized x/y/z in LANDMARKS order
+        """
+        n = len(faces)
+        if out is None:
+            out = np.empty((n, len(cls.KEY_POINTS), 3), dtype=np.float64)
+        for f, landmarks in enumerate(faces):
+            for k, i in enumerate(cls.KEY_POINTS):
+                lm = landmarks[i]
+                out[f, k, 0] = lm.x
+                out[f, k, 1] = lm.y
+                out[f, k, 2] = lm.z
+        return out
+    
+    def estimate_batch(self, points, frame_width, frame_height):
+        """
+        Head pose of several faces at once (same result as estimate()).
+        
+        Args:
+            points: (n, 5, 3) key points from key_points()
+            frame_width: Width of the video frame
+            frame_height: Height of the video frame
+            
+        Returns:
+            (pitch (n,), yaw (n,), forward_axis (n, 3)) in degrees
+        """
+        w, h = frame_width, frame_height
+        pts = points * np.array([w, h, w], dtype=np.float64)
+        left, right, top, bottom = pts[:, 0], pts[:, 1], pts[:, 2], pts[:, 3]
+        
+        right_axis = right - left
+        right_axis /= np.linalg.norm(right_axis, axis=1, keepdims=True)
+        up_axis = top - bottom
+        up_axis /= np.linalg.norm(up_axis, axis=1, keepdims=True)
+        forward_axis = np.cross(right_axis, up_axis)
+        forward_axis /= -np.linalg.norm(forward_axis, axis=1, keepdims=True)
+        
+        # Dot products with the reference (0, 0, -1) of the normalized
+        # XZ and YZ projections; a zero projection gives 90 degrees
+        fx, fy, fz = forward_axis[:, 0], forward_axis[:, 1], forward_axis[:, 2]
+        xz_norm = np.hypot(fx, fz)
+        yz_norm = np.hypot(fy, fz)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cos_yaw = np.where(xz_norm > 0, -fz / xz_norm, 0.0)
+            cos_pitch = np.where(yz_norm > 0, -fz / yz_norm, 0.0)
+        
+        yaw = np.degrees(np.arccos(np.clip(cos_yaw, -1, 1)))
+        yaw = np.where(fx < 0, -yaw, yaw)
+        pitch = np.degrees(np.arccos(np.clip(cos_pitch, -1, 1)))
+        pitch = np.where(fy > 0, -pitch, pitch)
+        return pitch, yaw, forward_axis
@@ -0,0 +1,242 @@
+import time
+from dataclasses import dataclass, asdict
+
+import cv2
+import numpy as np
+
+from core.quality_controller import QualityLevel, DEFAULT_LADDER
+from utils import host_cache
+
+
+@dataclass(frozen=True)
+class ModelProfile:
+    """Named FaceMesh / Hands configuration."""
+    name: str
+    capture_width: int
+    capture_height: int
+    input_scale: float        # Fraction of the frame fed to the models
+    refine_landmarks: bool    # FaceMesh iris refinement
+    model_complexity: int     # Hands model complexity (0 or 1)
+    description: str = ""
+
+    def as_quality_level(self):
+        return QualityLevel(
+            self.name, self.capture_width, self.capture_height,
+            self.input_scale, self.refine_landmarks, self.model_complexity,
+            preview_interval=1
+        )
+
+
+# Ordered from most accurate to cheapest
+PROFILES = {
+    "accurate": ModelProfile(
+        "accurate", 640, 480, 1.0, True, 1,
+        "Full frame, iris refinement, full Hands model"),
+    "balanced": ModelProfile(
+        "balanced", 640, 480, 1.0, False, 1,
+        "Full frame without the iris model (blink EAR only needs eyelid points)"),
+    "fast": ModelProfile(
+        "fast", 640, 480, 0.75, False, 0,
+        "3/4-size model input, lite Hands model"),
+}
+DEFAULT_PROFILE = "balanced"
+
+
+def get_profile(name):
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown model profile '{name}' (choose from {', '.join(PROFILES)})"
+        ) from None
+
+
+def _pixels(level):
+    return level.capture_width * level.capture_height * level.input_scale ** 2
+
+
+def ladder_for(profile, base=DEFAULT_LADDER):
+    """
+    Quality ladder that starts at the profile and continues with the rungs
+    of `base` that are no more expensive in any option. The quality
+    controller then never steps above the selected profile.
+    """
+    top = profile.as_quality_level()
+    ladder = [top]
+    for level in base:
+        cheaper = (
+            _pixels(level) <= _pixels(top)
+            and level.refine_landmarks <= top.refine_landmarks
+            and level.model_complexity <= top.model_complexity
+        )
+        same = (
+            _pixels(level) == _pixels(top)
+            and level.refine_landmarks == top.refine_landmarks
+            and level.model_complexity == top.model_complexity
+        )
+        if cheaper and not same:
+            ladder.append(level)
+    return tuple(ladder)
+
+
+# ---------------------------------------------------------
+# Self-benchmark
+# ---------------------------------------------------------
+def capture_frames(source=0, count=60, width=640, height=480, log=print):
+    """
+    Benchmark frames from the camera or a recorded clip.
+
+    The landmark models only run once a face or hand is found, so the
+    frames must show a real person: synthetic frames would only time the
+    detectors and make every profile look affordable.
+
+    Args:
+        source: Camera index, or path of a recorded video
+        count: Frames to read
+        width, height: Capture size (camera only; clips are resized later)
+    """
+    if isinstance(source, str):
+        log(f"[Model Profiles] Reading {count} benchmark frames from {source}")
+        cap = cv2.VideoCapture(source)
+        if not cap.isOpened():
+            raise RuntimeError(f"Could not open benchmark video {source}")
+        read = lambda: cap.read()[1]
+        release = cap.release
+    else:
+        from core.camera import Camera
+
+        log(f"[Model Profiles] Capturing {count} benchmark frames from camera {source} "
+            "(face the camera, hands visible)")
+        camera = Camera(index=source, width=width, height=height)
+        read = camera.read
+        release = camera.release
+
+    frames = []
+    try:
+        while len(frames) < count:
+            frame = read()
+            if frame is None:
+                break
+            frames.append(cv2.flip(frame, 1))
+    finally:
+        release()
+    if not frames:
+        raise RuntimeError("No benchmark frames could be read")
+    return frames
+
+
+def benchmark_profile(profile, frames, warmup=10):
+    """
+    Time FaceMesh and Hands for one profile on the given frames.
+
+    Returns:
+        dict with mean and p90 per-frame milliseconds (face + hands, serial)
+        and the number of frames where a face / a hand was found
+    """
+    # Imported here so that using the registry does not pull in MediaPipe
+    from core.face_detector import FaceDetector
+    from hand_gestures.hand_detector import HandDetector
+
+    face = FaceDetector(refine_landmarks=profile.refine_landmarks,
+                        input_scale=profile.input_scale)
+    hands = HandDetector(model_complexity=profile.model_complexity,
+                         input_scale=profile.input_scale)
+    size = (profile.capture_width, profile.capture_height)
+    frames = [
+        f if (f.shape[1], f.shape[0]) == size else cv2.resize(f, size, interpolation=cv2.INTER_AREA)
+        for f in frames
+    ]
+
+    times = []
+    face_frames = hand_frames = 0
+    for i, frame in enumerate(frames):
+        start = time.perf_counter()
+        face_result = face.process(frame)
+        hand_result = hands.detect_hands(frame)
+        if i >= warmup:
+            times.append(time.perf_counter() - start)
+        face_frames += face_result.multi_face_landmarks is not None
+        hand_frames += hand_result.multi_hand_landmarks is not None
+    face.face_mesh.close()
+    hands.hands.close()
+
+    times = np.array(times) * 1000.0
+    return {
+        "mean_ms": float(times.mean()),
+        "p90_ms": float(np.percentile(times, 90)),
+        "face_frames": face_frames,
+        "hand_frames": hand_frames,
+    }
+
+
+def check_detections(face_frames, hand_frames, total, log=print, tag="Model Profiles"):
+    """
+    Warn about benchmark frames the landmark models did not run on.
+
+    Returns:
+        False if no face was found at all (the timings are meaningless)
+    """
+    if face_frames == 0:
+        log(f"[{tag}] WARNING: no face found in {total} benchmark frames; "
+            "FaceMesh landmarks never ran, so the timings are not usable")
+        return False
+    if hand_frames == 0:
+        log(f"[{tag}] WARNING: no hand found in the benchmark frames; "
+            "hand landmark cost is not included")
+    return True
+
+
+def select_profile(target_fps=20, headroom=0.7, frames=None, source=0, use_cache=True,
+                   log=print):
+    """
+    Pick the most accurate profile whose p90 inference time fits in
+    `headroom` of the frame budget on this machine. The choice is cached
+    per host, so later starts skip the benchmark. If no face shows up in
+    the benchmark frames the default profile is used and nothing is cached.
+
+    Args:
+        target_fps: Frame rate to hold
+        headroom: Share of the frame budget inference may use (the rest is
+            capture, interpretation and drawing)
+        frames: Benchmark frames (default: read from `source`)
+        source: Camera index or video path for capture_frames()
+        use_cache: Read a previous result for this host if there is one
+
+    Returns:
+        (ModelProfile, {profile name: timings}, from_cache)
+    """
+    fingerprint = host_cache.host_fingerprint(
+        target_fps=target_fps, headroom=headroom, profiles=sorted(PROFILES)
+    )
+    if use_cache:
+        cached = host_cache.load("model_profile", fingerprint)
+        if cached is not None and cached.get("profile") in PROFILES:
+            return PROFILES[cached["profile"]], cached.get("timings", {}), True
+
+    if frames is None:
+        frames = capture_frames(source, log=log)
+    budget_ms = 1000.0 / target_fps * headroom
+
+    timings = {}
+    chosen = None
+    for profile in PROFILES.values():
+        timings[profile.name] = t = benchmark_profile(profile, frames)
+        log(
+            f"[Model Profiles] {profile.name:<9} p90={t['p90_ms']:.1f}ms "
+            f"(budget {budget_ms:.1f}ms)"
+        )
+        if not check_detections(t["face_frames"], t["hand_frames"], len(frames), log):
+            log(f"[Model Profiles] Using '{DEFAULT_PROFILE}' without caching the choice")
+            return PROFILES[DEFAULT_PROFILE], timings, False
+        if t["p90_ms"] <= budget_ms:
+            chosen = profile
+            break
+    if chosen is None:
+        chosen = list(PROFILES.values())[-1]
+
+    host_cache.store("model_profile", fingerprint, {
+        "profile": chosen.name,
+        "timings": timings,
+        "options": asdict(chosen),
+    })
+    return chosen, timings, False
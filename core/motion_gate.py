@@ -0,0 +1,139 @@
+import cv2
+import numpy as np
+
+# MediaPipe FaceMesh eye corners (left eye, right eye)
+EYE_CORNERS = ((33, 133), (362, 263))
+
+
+def eye_corners(landmarks):
+    """Normalized ((x, y), (x, y)) corners of both eyes, for should_infer(eyes=...)."""
+    return [((landmarks[a].x, landmarks[a].y), (landmarks[b].x, landmarks[b].y))
+            for a, b in EYE_CORNERS]
+
+
+class MotionGate:
+    """
+    Cheap motion detector that decides whether a frame needs inference.
+
+    The frame is reduced to a small grayscale thumbnail and compared with
+    the thumbnail of the last frame that was actually inferred (not the
+    previous frame, so slow drifts still add up). The motion score is the
+    mean absolute difference over the whole thumbnail, or inside the last
+    face/hand ROIs if that is larger. Below the threshold the
+    caller reuses the previous landmarks; inference is still forced at
+    least every `max_skip` frames.
+
+    An eye closing is too small to show in the thumbnail (a few pixels of
+    the face box), so when eye corners are given each eye is also compared
+    at full resolution, against its own lower `eye_threshold`.
+    """
+
+    def __init__(self, threshold=3.0, size=(80, 60), max_skip=10, roi_margin=0.1,
+                 eye_threshold=6.0):
+        """
+        Args:
+            threshold: Mean absolute gray-level difference that counts as motion
+            size: Thumbnail (width, height)
+            max_skip: Maximum consecutive gated frames
+            roi_margin: Margin added around each ROI (normalized)
+            eye_threshold: Mean difference inside an eye box that counts as motion
+        """
+        self.threshold = threshold
+        self.size = size
+        self.max_skip = max_skip
+        self.roi_margin = roi_margin
+        self.eye_threshold = eye_threshold
+
+        self.reference = None        # (thumbnail, full-size gray or None)
+        self.skipped = 0
+        self.frames = 0
+        self.gated = 0
+        self.last_score = 0.0
+        self.last_eye_score = 0.0
+        self.last_thumbnail = None   # Snapshot of the latest frame, for commit()
+
+    @property
+    def gated_fraction(self):
+        """Fraction of frames that reused landmarks instead of running inference."""
+        return self.gated / self.frames if self.frames else 0.0
+
+    def _thumbnail(self, frame):
+        small = cv2.resize(frame, self.size, interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+
+    def _score(self, diff, rois):
+        # The global mean catches things entering the frame (a new hand);
+        # the ROIs make small face/hand movements count fully
+        score = float(diff.mean())
+        if not rois:
+            return score
+
+        tw, th = self.size
+        for x0, y0, x1, y1 in rois:
+            m = self.roi_margin
+            c0 = int(max(0.0, x0 - m) * tw)
+            r0 = int(max(0.0, y0 - m) * th)
+            c1 = int(np.ceil(min(1.0, x1 + m) * tw))
+            r1 = int(np.ceil(min(1.0, y1 + m) * th))
+            if c1 > c0 and r1 > r0:
+                score = max(score, float(diff[r0:r1, c0:c1].mean()))
+        return score
+
+    @staticmethod
+    def _eye_score(gray, reference, eyes):
+        h, w = gray.shape
+        score = 0.0
+        for (x0, y0), (x1, y1) in eyes:
+            # Box around the corner-to-corner line, sized by the eye's width
+            width = abs(x1 - x0) * w
+            cx, cy = (x0 + x1) / 2 * w, (y0 + y1) / 2 * h
+            c0, c1 = int(max(0, cx - 0.75 * width)), int(min(w, cx + 0.75 * width + 1))
+            r0, r1 = int(max(0, cy - 0.5 * width)), int(min(h, cy + 0.5 * width + 1))
+            if c1 > c0 and r1 > r0:
+                diff = cv2.absdiff(gray[r0:r1, c0:c1], reference[r0:r1, c0:c1])
+                score = max(score, float(diff.mean()))
+        return score
+
+    def should_infer(self, frame, rois=None, commit=True, eyes=None):
+        """
+        Args:
+            frame: BGR frame
+            rois: Optional list of normalized (x0, y0, x1, y1) boxes to watch
+            commit: Take this frame as the new reference right away. Pass
+                False when the frame may still be dropped before inference
+                and call commit(gate.last_thumbnail) once inference ran.
+            eyes: Optional eye corners (see eye_corners()) of the last
+                inferred face; winks and blinks then count as motion
+
+        Returns:
+            True if inference should run, False if the last landmarks can be reused
+        """
+        self.frames += 1
+        thumb = self._thumbnail(frame)
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if eyes else None
+        self.last_thumbnail = (thumb, gray)
+
+        if (self.reference is not None and self.skipped < self.max_skip
+                and (gray is None or self.reference[1] is not None)):
+            diff = cv2.absdiff(thumb, self.reference[0])
+            self.last_score = self._score(diff, rois)
+            self.last_eye_score = (self._eye_score(gray, self.reference[1], eyes)
+                                   if gray is not None else 0.0)
+            if self.last_score < self.threshold and self.last_eye_score < self.eye_threshold:
+                self.skipped += 1
+                self.gated += 1
+                return False
+
+        if commit:
+            self.commit(self.last_thumbnail)
+        return True
+
+    def commit(self, thumbnail):
+        """Record that inference ran on the frame with this snapshot (last_thumbnail)."""
+        self.reference = thumbnail
+        self.skipped = 0
+
+    def reset(self):
+        """Force inference on the next frame."""
+        self.reference = None
+        self.skipped = 0
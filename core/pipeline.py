@@ -0,0 +1,272 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.profiler import get_tracer
+
+
+class FrameContext:
+    """
+    Per-frame data passed from stage to stage.
+    Stages read and write plain attributes; the defaults below keep
+    downstream stages working when an upstream stage is disabled.
+    """
+
+    def __init__(self, index, capture_time=None):
+        self.index = index
+        self.capture_time = capture_time  # Set by the source when the frame arrives
+        self.stop = False     # Set by any stage to shut the pipeline down
+        self.drop = False     # Set by any stage to skip the remaining stages
+        self.active = None    # Compute units for this frame (None = all), see core.activation
+
+        # Source
+        self.frame = None
+        self.w = 0
+        self.h = 0
+        self.low_power = False      # Presence-only frame (see LowPowerMode)
+
+        # Inference
+        self.landmarks_reused = False  # Motion gate: previous results reused
+        self.gate_thumbnail = None
+        self.face_result = None
+        self.hand_result = None
+        self.tracked_hands = None   # Set instead of hand_result in two-hand mode
+
+        # Interpretation
+        self.face_detected = False
+        self.landmarks = None
+        self.pose = None
+        self.hands = []
+        self.right_hand = None
+        self.left_hand = None
+
+    def runs(self, unit):
+        """True if the given compute unit is active for this frame."""
+        return self.active is None or unit in self.active
+
+
+class Stage:
+    """
+    One pipeline stage.
+
+    Args:
+        name: Unique stage name
+        func: Callable taking the FrameContext
+        blocking: Run func in the executor instead of the event loop thread
+        enabled: Disabled stages pass frames through untouched
+        requires: Compute unit the stage needs; the stage is skipped on
+            frames where it is not active (ctx.runs)
+    """
+
+    def __init__(self, name, func, blocking=False, enabled=True, requires=None):
+        self.name = name
+        self.func = func
+        self.blocking = blocking
+        self.enabled = enabled
+        self.requires = requires
+        self._call = func
+
+    def wanted(self, ctx):
+        return self.requires is None or ctx.runs(self.requires)
+
+    def bind(self, tracer):
+        """Wrap func in a trace span only when tracing is on."""
+        if not tracer.enabled:
+            self._call = self.func
+            return
+
+        def traced(ctx):
+            with tracer.span(self.name):
+                self.func(ctx)
+        self._call = traced
+
+    async def run(self, ctx, loop, executor):
+        if not self.wanted(ctx):
+            return
+        if self.blocking:
+            await loop.run_in_executor(executor, self._call, ctx)
+        else:
+            self._call(ctx)
+
+
+class ParallelStage(Stage):
+    """
+    Runs several stages concurrently on the same frame.
+    Branches must write to different context attributes.
+    """
+
+    def __init__(self, name, branches, enabled=True):
+        super().__init__(name, None, blocking=True, enabled=enabled)
+        self.branches = list(branches)
+
+    def bind(self, tracer):
+        for branch in self.branches:
+            branch.bind(tracer)
+
+    async def run(self, ctx, loop, executor):
+        await asyncio.gather(*(
+            branch.run(ctx, loop, executor)
+            for branch in self.branches if branch.enabled and branch.wanted(ctx)
+        ))
+
+
+class LatestQueue:
+    """
+    Bounded queue with a latest-wins policy: when full, the oldest
+    item is discarded so downstream stages always see the newest frame.
+    """
+
+    def __init__(self, maxsize=1):
+        self.queue = asyncio.Queue(maxsize=maxsize)
+        self.dropped = 0
+
+    async def put(self, item):
+        while self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        await self.queue.put(item)
+
+    async def get(self):
+        return await self.queue.get()
+
+
+class Pipeline:
+    """
+    Asyncio pipeline orchestrator.
+
+    The first stage is the source: it is called with a fresh FrameContext
+    in a loop and sets ctx.capture_time once its frame has been read
+    (after any blocking read or throttling). Every other stage runs in its own task and is connected to
+    its predecessor by a LatestQueue, so a slow stage drops stale frames
+    instead of building up latency.
+
+    Different stages work on different frames at the same time. An object
+    used inside a blocking stage (camera, detectors, trackers) must only
+    be changed by that stage: other stages queue changes (the configure()
+    and set_* methods do) and read per-frame copies from the context.
+    """
+
+    def __init__(self, stages, max_workers=4, queue_size=1):
+        """
+        Args:
+            stages: Ordered list of Stage objects (source first)
+            max_workers: Threads for blocking stages
+            queue_size: Capacity of each inter-stage queue
+        """
+        if not stages:
+            raise ValueError("Pipeline needs at least a source stage")
+        self.stages = list(stages)
+        self.max_workers = max_workers
+        self.queue_size = queue_size
+        self.queues = []
+        self.frame_index = 0
+        self.stage_times = {stage.name: 0.0 for stage in self.stages}
+        self._stop_event = None
+
+    # -----------------------------------------------------
+    # Configuration
+    # -----------------------------------------------------
+    def stage(self, name):
+        """Look up a stage (or a parallel branch) by name."""
+        for stage in self.stages:
+            if stage.name == name:
+                return stage
+            for branch in getattr(stage, "branches", ()):
+                if branch.name == name:
+                    return branch
+        raise KeyError(name)
+
+    def enable(self, name):
+        self.stage(name).enabled = True
+
+    def disable(self, name):
+        self.stage(name).enabled = False
+
+    def describe(self):
+        """Human-readable stage layout."""
+        parts = []
+        for stage in self.stages:
+            label = stage.name if stage.enabled else f"({stage.name})"
+            branches = getattr(stage, "branches", None)
+            if branches:
+                label += "[" + " | ".join(
+                    b.name if b.enabled else f"({b.name})" for b in branches
+                ) + "]"
+            parts.append(label)
+        return " -> ".join(parts)
+
+    def dropped_frames(self):
+        """Frames discarded by the latest-wins queues."""
+        return sum(q.dropped for q in self.queues)
+
+    # -----------------------------------------------------
+    # Execution
+    # -----------------------------------------------------
+    def stop(self):
+        """Request shutdown (safe to call from any stage)."""
+        if self._stop_event is not None:
+            self._stop_event.set()
+
+    async def _run_stage(self, stage, ctx, loop, executor):
+        start = time.perf_counter()
+        await stage.run(ctx, loop, executor)
+        self.stage_times[stage.name] = time.perf_counter() - start
+        if ctx.stop:
+            self.stop()
+
+    async def _source_loop(self, loop, executor, out_queue):
+        source = self.stages[0]
+        while not self._stop_event.is_set():
+            ctx = FrameContext(self.frame_index)
+            self.frame_index += 1
+            await self._run_stage(source, ctx, loop, executor)
+            if ctx.stop:
+                return
+            if ctx.drop:
+                continue
+            if out_queue is not None:
+                await out_queue.put(ctx)
+
+    async def _stage_loop(self, stage, loop, executor, in_queue, out_queue):
+        while True:
+            ctx = await in_queue.get()
+            if stage.enabled and not ctx.drop:
+                await self._run_stage(stage, ctx, loop, executor)
+            if out_queue is not None:
+                await out_queue.put(ctx)
+
+    async def run(self):
+        """Run until a stage sets ctx.stop or stop() is called."""
+        loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        self.queues = [LatestQueue(self.queue_size) for _ in self.stages[1:]]
+        tracer = get_tracer()
+        for stage in self.stages:
+            stage.bind(tracer)
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="pipeline"
+        )
+        tasks = [asyncio.create_task(self._source_loop(
+            loop, executor, self.queues[0] if self.queues else None
+        ))]
+        for i, stage in enumerate(self.stages[1:]):
+            out_queue = self.queues[i + 1] if i + 1 < len(self.queues) else None
+            tasks.append(asyncio.create_task(
+                self._stage_loop(stage, loop, executor, self.queues[i], out_queue)
+            ))
+
+        stop_waiter = asyncio.create_task(self._stop_event.wait())
+        try:
+            done, _ = await asyncio.wait(
+                tasks + [stop_waiter], return_when=asyncio.FIRST_COMPLETED
+            )
+            # Surface stage errors
+            for task in done:
+                if task is not stop_waiter and task.exception() is not None:
+                    raise task.exception()
+        finally:
+            for task in tasks + [stop_waiter]:
+                task.cancel()
+            await asyncio.gather(*tasks, stop_waiter, return_exceptions=True)
+            executor.shutdown(wait=True)
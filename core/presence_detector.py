@@ -0,0 +1,123 @@
+import time
+
+import cv2
+import mediapipe as mp
+
+from core.state import SystemState
+
+
+class PresenceDetector:
+    """
+    Lightweight face-presence check for low-power mode.
+    Runs MediaPipe's short-range face detector on a downscaled frame
+    instead of FaceMesh with iris refinement.
+    """
+
+    def __init__(self, width=160, min_detection_confidence=0.5):
+        """
+        Args:
+            width: Width the frame is downscaled to before detection
+            min_detection_confidence: Detector confidence threshold
+        """
+        self.width = width
+        self.detector = mp.solutions.face_detection.FaceDetection(
+            model_selection=0,   # short-range model (within ~2 m)
+            min_detection_confidence=min_detection_confidence
+        )
+
+    def detect(self, frame):
+        """Return True if a face is visible in the BGR frame."""
+        h, w = frame.shape[:2]
+        scale = self.width / w
+        small = cv2.resize(frame, (self.width, int(h * scale)), interpolation=cv2.INTER_AREA)
+        result = self.detector.process(cv2.cvtColor(small, cv2.COLOR_BGR2RGB))
+        return bool(result.detections)
+
+
+class LowPowerMode:
+    """
+    Decides when the pipeline can drop to presence-only processing.
+
+    Low power is entered while the system is PAUSED (no face), or when it
+    has been OFF for `off_idle_timeout` seconds with nobody using a
+    hand-driven feature: either none is enabled, or one is (gestures are
+    on by default) but no face is in view. Capture is throttled to
+    `low_power_fps` and only the PresenceDetector runs. Low power is left
+    on the first frame where the face returns (in OFF only if a hand
+    feature is enabled) or the state needs the full pipeline again.
+    """
+
+    def __init__(self, presence_detector, camera=None, low_power_fps=5.0,
+                 full_fps=30.0, off_idle_timeout=10.0):
+        """
+        Args:
+            presence_detector: PresenceDetector used while in low power
+            camera: Camera whose driver frame rate follows the mode (optional)
+            low_power_fps: Capture rate while in low power
+            full_fps: Capture rate restored when leaving low power
+            off_idle_timeout: Seconds idle in OFF before low power
+        """
+        self.presence_detector = presence_detector
+        self.camera = camera
+        self.low_power_fps = low_power_fps
+        self.full_fps = full_fps
+        self.frame_interval = 1.0 / low_power_fps
+        self.off_idle_timeout = off_idle_timeout
+
+        self.active = False
+        self.off_since = None
+        self.last_frame_time = 0.0
+        self.low_power_frames = 0
+
+    def update(self, state, hands_needed, face_detected=False):
+        """
+        Re-evaluate the mode after each frame.
+
+        Args:
+            state: Current SystemState
+            hands_needed: True if the air keyboard or hand gestures are on
+            face_detected: True if a face was seen this frame (by FaceMesh,
+                or by the PresenceDetector while in low power)
+
+        Returns:
+            True while low power is active
+        """
+        now = time.time()
+        # Hand features only need hand inference while someone is in view
+        if state == SystemState.OFF and not (hands_needed and face_detected):
+            if self.off_since is None:
+                self.off_since = now
+        else:
+            self.off_since = None
+
+        engage = state == SystemState.PAUSED or (
+            self.off_since is not None and now - self.off_since >= self.off_idle_timeout
+        )
+        if engage != self.active:
+            self._set_active(engage, state.name if engage else "full pipeline needed")
+        return self.active
+
+    def wake(self):
+        """Leave low power immediately (face came back)."""
+        self.off_since = None
+        if self.active:
+            self._set_active(False, "face detected")
+
+    def _set_active(self, active, reason):
+        self.active = active
+        if self.camera is not None:
+            self.camera.set_fps(self.low_power_fps if active else self.full_fps)
+        print(f"[Low Power] {'ENTER' if active else 'EXIT'} ({reason})")
+
+    def throttle(self):
+        """Sleep so captures happen at most at the low-power rate."""
+        if not self.active:
+            return
+        wait = self.frame_interval - (time.time() - self.last_frame_time)
+        if wait > 0:
+            time.sleep(wait)
+        self.last_frame_time = time.time()
+        self.low_power_frames += 1
+
+    def detect_presence(self, frame):
+        return self.presence_detector.detect(frame)
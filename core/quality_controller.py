@@ -0,0 +1,232 @@
+import time
+from collections import deque
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class QualityLevel:
+    """One rung of the quality ladder."""
+    name: str
+    capture_width: int
+    capture_height: int
+    input_scale: float        # Fraction of the frame fed to the models
+    refine_landmarks: bool    # FaceMesh iris refinement
+    model_complexity: int     # Hands model complexity (0 or 1)
+    preview_interval: int     # Show every Nth frame in the preview window
+
+
+# Ordered from best quality to cheapest
+DEFAULT_LADDER = (
+    QualityLevel("full", 640, 480, 1.0, True, 1, 1),
+    QualityLevel("no-iris", 640, 480, 1.0, False, 1, 1),
+    QualityLevel("light-hands", 640, 480, 0.75, False, 0, 2),
+    QualityLevel("reduced", 480, 360, 0.75, False, 0, 2),
+    QualityLevel("minimal", 320, 240, 1.0, False, 0, 3),
+)
+
+
+class QualityController:
+    """
+    Closed-loop controller that keeps the frame rate near a target by
+    stepping through a quality ladder.
+
+    Frame times are collected over a sliding window and summarised by a
+    percentile. The controller steps down quickly when the budget is
+    exceeded and steps up slowly when there is plenty of headroom, with a
+    cooldown after every step and a growing hold time for step-ups that
+    had to be undone (hysteresis against oscillation).
+
+    Level changes are queued on the camera and detectors, which apply them
+    on their own threads before their next frame, so record() can be called
+    from any pipeline stage.
+
+    Model options can be pinned (see pin()) while a feature depends on
+    them, e.g. iris refinement for gaze; the ladder then only steps the
+    remaining options.
+    """
+
+    def __init__(
+        self,
+        camera=None,
+        face_detector=None,
+        hand_detector=None,
+        target_fps=20,
+        ladder=DEFAULT_LADDER,
+        start_level=0,
+        percentile=90,
+        window=30,
+        degrade_margin=1.15,
+        upgrade_ratio=0.65,
+        upgrade_hold=90
+    ):
+        """
+        Initialize quality controller.
+
+        Args:
+            camera: Camera to resize (optional)
+            face_detector: FaceDetector to reconfigure (optional)
+            hand_detector: HandDetector (or list of hand trackers) to reconfigure (optional)
+            target_fps: Frame rate to hold
+            ladder: Sequence of QualityLevel, best quality first
+            start_level: Index of the initial level
+            percentile: Frame-time percentile compared against the budget
+            window: Number of frames per decision
+            degrade_margin: Step down when percentile > budget * margin
+            upgrade_ratio: Step up when percentile < budget * ratio
+            upgrade_hold: Frames of headroom required before stepping up
+        """
+        self.camera = camera
+        self.face_detector = face_detector
+        if hand_detector is None:
+            self.hand_detectors = []
+        elif isinstance(hand_detector, (list, tuple)):
+            self.hand_detectors = list(hand_detector)
+        else:
+            self.hand_detectors = [hand_detector]
+
+        self.ladder = tuple(ladder)
+        self.budget = 1.0 / target_fps
+        self.percentile = percentile
+        self.window = window
+        self.degrade_margin = degrade_margin
+        self.upgrade_ratio = upgrade_ratio
+        self.base_upgrade_hold = upgrade_hold
+        self.upgrade_hold = upgrade_hold
+
+        self.frame_times = deque(maxlen=window)
+        self.headroom_frames = 0
+        self.cooldown = 0
+        self.last_step_up_time = None
+        self.level_index = max(0, min(len(self.ladder) - 1, start_level))
+        self.history = []
+        self.pinned = {}
+
+        self._apply(self.level, reason="initial")
+
+    @property
+    def level(self):
+        """Currently applied quality level."""
+        return self.ladder[self.level_index]
+
+    @property
+    def preview_interval(self):
+        """Show one preview frame out of this many."""
+        return self.level.preview_interval
+
+    def pin(self, **options):
+        """
+        Hold model options at a value whatever the level, e.g.
+        pin(refine_landmarks=True). Passing None releases an option.
+        """
+        for name, value in options.items():
+            if name not in ("refine_landmarks", "model_complexity", "input_scale"):
+                raise ValueError(f"Cannot pin '{name}'")
+            if value is None:
+                self.pinned.pop(name, None)
+            else:
+                self.pinned[name] = value
+        self._configure(self.level)
+        pins = ", ".join(f"{k}={v}" for k, v in self.pinned.items()) or "none"
+        print(f"[Quality Controller] Pinned options: {pins}")
+
+    def frame_time_percentile(self):
+        """Current frame-time percentile in seconds (None if no data)."""
+        if not self.frame_times:
+            return None
+        return float(np.percentile(self.frame_times, self.percentile))
+
+    def record(self, frame_time):
+        """
+        Record the duration of one frame and step the ladder if needed.
+
+        Args:
+            frame_time: Seconds spent on the frame
+
+        Returns:
+            True if the quality level changed
+        """
+        self.frame_times.append(frame_time)
+
+        if self.cooldown > 0:
+            self.cooldown -= 1
+            return False
+        if len(self.frame_times) < self.window:
+            return False
+
+        p = self.frame_time_percentile()
+
+        # Over budget -> step down straight away
+        if p > self.budget * self.degrade_margin:
+            self.headroom_frames = 0
+            if self.level_index < len(self.ladder) - 1:
+                self._on_degrade()
+                return self._step(+1, p)
+            return False
+
+        # Plenty of headroom -> step up only after a sustained hold
+        if p < self.budget * self.upgrade_ratio and self.level_index > 0:
+            self.headroom_frames += 1
+            if self.headroom_frames >= self.upgrade_hold:
+                self.last_step_up_time = time.time()
+                return self._step(-1, p)
+        else:
+            self.headroom_frames = 0
+        return False
+
+    def _on_degrade(self):
+        """Back off future step-ups if the last one did not hold."""
+        if (self.last_step_up_time is not None
+                and time.time() - self.last_step_up_time < 10.0):
+            self.upgrade_hold = min(self.upgrade_hold * 2, self.base_upgrade_hold * 8)
+        else:
+            self.upgrade_hold = self.base_upgrade_hold
+        self.last_step_up_time = None
+
+    def _step(self, direction, p):
+        old = self.level
+        self.level_index += direction
+        reason = (
+            f"p{self.percentile}={p * 1000:.1f}ms "
+            f"budget={self.budget * 1000:.1f}ms"
+        )
+        self._apply(self.level, reason=reason, previous=old)
+
+        self.frame_times.clear()
+        self.headroom_frames = 0
+        self.cooldown = self.window
+        return True
+
+    def _configure(self, level):
+        options = {
+            "refine_landmarks": level.refine_landmarks,
+            "model_complexity": level.model_complexity,
+            "input_scale": level.input_scale,
+        }
+        options.update(self.pinned)
+        if self.face_detector is not None:
+            self.face_detector.configure(
+                refine_landmarks=options["refine_landmarks"],
+                input_scale=options["input_scale"]
+            )
+        for hand_detector in self.hand_detectors:
+            hand_detector.configure(
+                model_complexity=options["model_complexity"],
+                input_scale=options["input_scale"]
+            )
+
+    def _apply(self, level, reason, previous=None):
+        if self.camera is not None:
+            self.camera.set_resolution(level.capture_width, level.capture_height)
+        self._configure(level)
+
+        self.history.append((time.time(), level.name, reason))
+        if previous is None:
+            print(f"[Quality Controller] Level '{level.name}' ({reason})")
+        else:
+            arrow = "DOWN" if self.ladder.index(level) > self.ladder.index(previous) else "UP"
+            print(
+                f"[Quality Controller] Step {arrow}: '{previous.name}' -> "
+                f"'{level.name}' ({reason})"
+            )
@@ -0,0 +1,173 @@
+import os
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Monitor:
+    """One display in virtual-desktop coordinates (OS pixels)."""
+    x: int
+    y: int
+    width: int
+    height: int
+    scale: float = 1.0        # DPI scale factor (1.0 = 96 DPI, 2.0 = 200 %)
+    primary: bool = False
+    name: str = ""
+
+    @property
+    def right(self):
+        return self.x + self.width
+
+    @property
+    def bottom(self):
+        return self.y + self.height
+
+    def contains(self, x, y):
+        return self.x <= x < self.right and self.y <= y < self.bottom
+
+    def clamp(self, x, y, margin=0):
+        return (
+            max(self.x + margin, min(self.right - 1 - margin, x)),
+            max(self.y + margin, min(self.bottom - 1 - margin, y)),
+        )
+
+
+class VirtualDesktop:
+    """
+    All monitors with their offsets and DPI scaling.
+
+    Monitors may be laid out in any arrangement (side by side, stacked,
+    different sizes), so the bounding box can contain areas that are not
+    on any display. clamp() moves a point onto the nearest monitor.
+    """
+
+    def __init__(self, monitors):
+        if not monitors:
+            raise ValueError("VirtualDesktop needs at least one monitor")
+        self.monitors = list(monitors)
+        self.left = min(m.x for m in self.monitors)
+        self.top = min(m.y for m in self.monitors)
+        self.right = max(m.right for m in self.monitors)
+        self.bottom = max(m.bottom for m in self.monitors)
+
+    @property
+    def width(self):
+        return self.right - self.left
+
+    @property
+    def height(self):
+        return self.bottom - self.top
+
+    @property
+    def primary(self):
+        for monitor in self.monitors:
+            if monitor.primary:
+                return monitor
+        return self.monitors[0]
+
+    def monitor_at(self, x, y):
+        """Monitor containing the point, else the nearest one."""
+        for monitor in self.monitors:
+            if monitor.contains(x, y):
+                return monitor
+        return min(self.monitors, key=lambda m: _distance_sq(m.clamp(x, y), (x, y)))
+
+    def clamp(self, x, y, margin=0):
+        """Nearest on-screen point (with an inner margin on that monitor)."""
+        return self.monitor_at(x, y).clamp(x, y, margin)
+
+    def describe(self):
+        return ", ".join(
+            f"{m.name or 'display'} {m.width}x{m.height}+{m.x}+{m.y}"
+            f"{' @' + format(m.scale, 'g') + 'x' if m.scale != 1.0 else ''}"
+            f"{' (primary)' if m.primary else ''}"
+            for m in self.monitors
+        )
+
+    # -----------------------------------------------------
+    # Construction
+    # -----------------------------------------------------
+    @classmethod
+    def single(cls, width, height):
+        return cls([Monitor(0, 0, int(width), int(height), primary=True)])
+
+    @classmethod
+    def parse(cls, spec):
+        """
+        Build a layout from 'WxH+X+Y[@scale]' entries separated by commas,
+        e.g. '3840x2160+0+0@2,3840x2160+3840+0@2'. The first entry is primary.
+        """
+        monitors = []
+        for i, part in enumerate(p.strip() for p in spec.split(",") if p.strip()):
+            try:
+                geometry, _, scale = part.partition("@")
+                size, _, offset = geometry.partition("+")
+                width, height = (int(v) for v in size.lower().split("x"))
+                x, y = (int(v) for v in offset.split("+")) if offset else (0, 0)
+            except ValueError:
+                raise ValueError(f"Bad monitor spec '{part}' (expected WxH+X+Y[@scale])") from None
+            monitors.append(Monitor(x, y, width, height, float(scale or 1.0),
+                                    primary=(i == 0), name=f"display{i + 1}"))
+        return cls(monitors)
+
+    @classmethod
+    def from_system(cls, fallback_size=None):
+        """
+        Detect monitors through the optional `screeninfo` package, with the
+        DPI scale factor the OS applies to each (see os_scale_factor).
+        Without screeninfo a single monitor of `fallback_size` is used.
+        """
+        try:
+            from screeninfo import get_monitors
+            found = get_monitors()
+        except Exception:
+            found = []
+
+        monitors = [
+            Monitor(m.x, m.y, m.width, m.height, os_scale_factor(m.x, m.y),
+                    primary=bool(getattr(m, "is_primary", False)),
+                    name=getattr(m, "name", "") or "")
+            for m in found
+        ]
+        if monitors:
+            return cls(monitors)
+        if fallback_size is None:
+            raise RuntimeError("No monitors detected and no fallback size given")
+        return cls.single(*fallback_size)
+
+
+def os_scale_factor(x, y):
+    """
+    Display scale the OS applies to the monitor containing (x, y).
+
+    Windows reports it per monitor (GetDpiForMonitor; the process is
+    DPI-aware once PyAutoGUI is imported). Elsewhere the desktop-wide
+    GDK_SCALE / QT_SCALE_FACTOR settings are used. Defaults to 1.0; the
+    physical size reported by EDID is not used, as it says nothing about
+    the scaling the user chose.
+    """
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        user32 = ctypes.windll.user32
+        shcore = ctypes.windll.shcore
+    except (ImportError, AttributeError, OSError, ValueError):
+        pass
+    else:
+        monitor = user32.MonitorFromPoint(wintypes.POINT(x, y), 2)  # MONITOR_DEFAULTTONEAREST
+        dpi_x, dpi_y = wintypes.UINT(), wintypes.UINT()
+        if shcore.GetDpiForMonitor(monitor, 0, ctypes.byref(dpi_x), ctypes.byref(dpi_y)) == 0:
+            return dpi_x.value / 96.0
+
+    for variable in ("GDK_SCALE", "QT_SCALE_FACTOR"):
+        try:
+            scale = float(os.environ[variable])
+        except (KeyError, ValueError):
+            continue
+        if scale > 0:
+            return scale
+    return 1.0
+
+
+def _distance_sq(a, b):
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2
@@ -0,0 +1,95 @@
+import asyncio
+
+
+class FairScheduler:
+    """
+    Hands frames from many streams to a shared pool of workers.
+
+    Each stream has a one-frame slot with a latest-wins policy (like
+    LatestQueue): a newer frame replaces one no worker has picked up yet.
+    A free worker takes the pending stream that was served least recently,
+    so when the pool is saturated every stream gets an equal share of it.
+    A stream is never processed by two workers at once, which keeps its
+    session state single-threaded and its frames in order. Any free
+    worker may take any stream, so each stream carries its own MediaPipe
+    graphs (their tracking state follows the stream, not the worker).
+    """
+
+    def __init__(self):
+        self.slots = {}          # stream -> pending item or None
+        self.dropped = {}        # stream -> frames replaced before being served
+        self.in_flight = set()   # streams being processed
+        self.closed = False
+        self._served = {}        # stream -> service ticket (higher = more recent)
+        self._ticket = 0
+        self._cond = None
+
+    @property
+    def cond(self):
+        # Created on first use so it binds to the running event loop
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+        return self._cond
+
+    def add_stream(self, name):
+        if name in self.slots:
+            raise ValueError(f"Stream '{name}' already registered")
+        self.slots[name] = None
+        self.dropped[name] = 0
+        self._served[name] = -1
+
+    def pending(self):
+        """Streams with a frame waiting and no worker on them."""
+        return [name for name, item in self.slots.items()
+                if item is not None and name not in self.in_flight]
+
+    async def put(self, name, item, wait=False):
+        """
+        Offer a stream's newest frame.
+
+        Args:
+            wait: Block until the previous frame was taken instead of
+                replacing it (recorded files processed as fast as possible)
+        """
+        async with self.cond:
+            if wait:
+                await self.cond.wait_for(lambda: self.slots[name] is None or self.closed)
+            if self.slots[name] is not None:
+                self.dropped[name] += 1
+            self.slots[name] = item
+            self.cond.notify_all()
+
+    async def get(self, worker):
+        """
+        Wait for work.
+
+        Returns:
+            (stream, item), or None once the scheduler is closed and drained
+        """
+        async with self.cond:
+            await self.cond.wait_for(lambda: self.closed or self.pending())
+            pending = self.pending()
+            if not pending:
+                return None
+            name = min(pending, key=self._served.__getitem__)
+            item = self.slots[name]
+            self.slots[name] = None
+            self.in_flight.add(name)
+            self._ticket += 1
+            self._served[name] = self._ticket
+            # A blocked put() may go ahead now
+            self.cond.notify_all()
+            return name, item
+
+    async def done(self, worker, name):
+        """Mark the stream's current frame as finished."""
+        async with self.cond:
+            self.in_flight.discard(name)
+            self.cond.notify_all()
+
+    async def close(self):
+        """Let workers finish the pending frames, then return None from get()."""
+        async with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+
@@ -1,15 +1,31 @@
-import pyautogui
 import math
 import time
 
+from utils.input_backend import PyAutoGUIBackend
+
 
 class GestureActions:
-    def __init__(self):
+    def __init__(self, input_backend=None, motion=None):
         """
         Controls system actions using hand gestures
+
+        input_backend: where key and scroll events go (defaults to PyAutoGUI)
+        motion: optional MotionGestures; adds swipes and flicks and replaces
+                the fixed-step scroll with speed-proportional scrolling.
+                Zoom and volume are skipped while the hand is in a motion
+                gesture, since a swipe or scroll pose also matches them
         """
+        self.input = input_backend or PyAutoGUIBackend()
+        self.motion = motion
+        self.enabled = True
         self.last_action_time = 0
         self.action_delay = 0.4  # seconds (prevents repeated triggers)
+        self.pinch_in_threshold = 0.03   # thumb-index distance for zoom in
+        self.pinch_out_threshold = 0.08  # thumb-index distance for zoom out
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        print(f"[Gestures] {'Enabled' if self.enabled else 'Disabled'}")
 
     def _can_perform_action(self):
         """
@@ -27,11 +43,22 @@ class GestureActions:
         """
         return math.hypot(p1.x - p2.x, p1.y - p2.y)
 
-    def perform_actions(self, hand_landmarks):
+    def perform_actions(self, hand_landmarks, timestamp=None, hand="Right", aspect=4 / 3):
         """
         Main gesture-action mapping logic
+
+        timestamp: capture time of the frame (for motion gestures)
+        hand: handedness label, each hand's motion is tracked separately
+        aspect: frame width / height
         """
+        if not self.enabled:
+            return
+
         landmarks = hand_landmarks.landmark
+        if self.motion is not None:
+            gesture = self.motion.update(landmarks, timestamp, hand=hand, aspect=aspect)
+            if gesture is not None or self.motion.in_motion(hand):
+                return
 
         # Important landmarks
         thumb_tip = landmarks[4]
@@ -41,22 +68,24 @@ class GestureActions:
         # ---------------- ZOOM (PINCH) ----------------
         pinch_distance = self._distance(thumb_tip, index_tip)
 
-        if pinch_distance < 0.03 and self._can_perform_action():
-            pyautogui.hotkey("ctrl", "+")   # Zoom in
+        if pinch_distance < self.pinch_in_threshold and self._can_perform_action():
+            self.input.hotkey("ctrl", "+")   # Zoom in
 
-        elif pinch_distance > 0.08 and self._can_perform_action():
-            pyautogui.hotkey("ctrl", "-")   # Zoom out
+        elif pinch_distance > self.pinch_out_threshold and self._can_perform_action():
+            self.input.hotkey("ctrl", "-")   # Zoom out
 
         # ---------------- SCROLL ----------------
-        if index_tip.y < middle_tip.y and self._can_perform_action():
-            pyautogui.scroll(50)            # Scroll up
+        # With motion gestures the scroll speed follows the hand instead
+        if self.motion is None:
+            if index_tip.y < middle_tip.y and self._can_perform_action():
+                self.input.scroll(50)            # Scroll up
 
-        elif index_tip.y > middle_tip.y and self._can_perform_action():
-            pyautogui.scroll(-50)           # Scroll down
+            elif index_tip.y > middle_tip.y and self._can_perform_action():
+                self.input.scroll(-50)           # Scroll down
 
         # ---------------- VOLUME ----------------
         if thumb_tip.y < index_tip.y and self._can_perform_action():
-            pyautogui.press("volumeup")
+            self.input.press("volumeup")
 
         elif thumb_tip.y > index_tip.y and self._can_perform_action():
-            pyautogui.press("volumedown")
+            self.input.press("volumedown")
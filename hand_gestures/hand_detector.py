@@ -1,3 +1,5 @@
+import threading
+
 import cv2
 import mediapipe as mp
 
@@ -7,24 +9,76 @@ class HandDetector:
         self,
         max_hands=1,
         detection_confidence=0.7,
-        tracking_confidence=0.7
+        tracking_confidence=0.7,
+        model_complexity=1,
+        input_scale=1.0
     ):
         """
         Initializes MediaPipe Hand Detector
         """
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
+        self.max_hands = max_hands
+        self.detection_confidence = detection_confidence
+        self.tracking_confidence = tracking_confidence
+        self.model_complexity = model_complexity
+        self.input_scale = input_scale
+        self.hands = self._create_hands()
+        self.drawer = mp.solutions.drawing_utils
+        # Option changes queued by other threads, applied by detect_hands()
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+
+    def _create_hands(self):
+        return self.mp_hands.Hands(
             static_image_mode=False,
-            max_num_hands=max_hands,
-            min_detection_confidence=detection_confidence,
-            min_tracking_confidence=tracking_confidence
+            max_num_hands=self.max_hands,
+            model_complexity=self.model_complexity,
+            min_detection_confidence=self.detection_confidence,
+            min_tracking_confidence=self.tracking_confidence
         )
-        self.drawer = mp.solutions.drawing_utils
+
+    def configure(self, model_complexity=None, input_scale=None):
+        """
+        Change model options at runtime.
+        Safe to call from any thread: the change is queued and applied by
+        the thread running detect_hands(), before its next frame. The Hands
+        graph is only rebuilt when a graph option changes.
+        """
+        with self._pending_lock:
+            if model_complexity is not None:
+                self._pending["model_complexity"] = model_complexity
+            if input_scale is not None:
+                self._pending["input_scale"] = input_scale
+
+    def _apply_pending(self):
+        if not self._pending:
+            return
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        self.input_scale = pending.get("input_scale", self.input_scale)
+        model_complexity = pending.get("model_complexity", self.model_complexity)
+        if model_complexity != self.model_complexity:
+            self.model_complexity = model_complexity
+            self.hands.close()
+            self.hands = self._create_hands()
+
+    def reset(self):
+        """
+        Drop tracking state, e.g. before processing a different clip
+        """
+        self.hands.close()
+        self.hands = self._create_hands()
 
     def detect_hands(self, frame):
         """
         Detect hands in a frame and return result
         """
+        self._apply_pending()
+        if self.input_scale != 1.0:
+            frame = cv2.resize(
+                frame, None, fx=self.input_scale, fy=self.input_scale,
+                interpolation=cv2.INTER_AREA
+            )
         rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         result = self.hands.process(rgb_frame)
         return result
@@ -0,0 +1,214 @@
+import cv2
+
+from hand_gestures.hand_detector import HandDetector
+from utils.landmarks import Point, LandmarkList, bounding_box
+
+
+class TrackedHand(LandmarkList):
+    """
+    A hand with a stable identity across frames.
+    Exposes .landmark like a MediaPipe result, in full-frame normalized coordinates.
+    """
+    __slots__ = ("label", "bbox", "center", "misses", "age")
+
+    def __init__(self, label, points):
+        super().__init__(points)
+        self.label = label
+        self.misses = 0
+        self.age = 0
+        self._update_geometry()
+
+    def update(self, points):
+        self.landmark = points
+        self.misses = 0
+        self.age += 1
+        self._update_geometry()
+
+    def snapshot(self):
+        """
+        Copy for one frame's consumers: the tracked hand itself is updated
+        by the next frame's inference while later stages still read this one.
+        """
+        copy = TrackedHand(self.label, self.landmark)
+        copy.misses = self.misses
+        copy.age = self.age
+        return copy
+
+    def _update_geometry(self):
+        self.bbox = bounding_box(self.landmark)
+        x0, y0, x1, y1 = self.bbox
+        self.center = ((x0 + x1) / 2, (y0 + y1) / 2)
+
+
+class TwoHandTracker:
+    """
+    Tracks a right and a left hand with stable identities.
+
+    A single MediaPipe graph with max_hands=2 runs on the full frame (its
+    own tracking keeps the palm detector idle while both hands stay in
+    view). Each frame's detections are matched to the existing tracks by
+    position, so identity follows the hand rather than MediaPipe's
+    per-frame handedness label, which is only used when a lone hand is
+    first acquired.
+    """
+
+    SLOTS = ("Right", "Left")
+
+    def __init__(
+        self,
+        detection_confidence=0.7,
+        tracking_confidence=0.7,
+        model_complexity=1,
+        max_misses=3,
+        max_jump=0.2
+    ):
+        """
+        Args:
+            detection_confidence, tracking_confidence, model_complexity: MediaPipe options
+            max_misses: Consecutive frames without a match before a hand is dropped
+            max_jump: Largest plausible per-frame move of a hand centre (normalized)
+        """
+        self.detector = HandDetector(
+            max_hands=2,
+            detection_confidence=detection_confidence,
+            tracking_confidence=tracking_confidence,
+            model_complexity=model_complexity,
+        )
+        self.tracks = {slot: None for slot in self.SLOTS}
+
+        self.max_misses = max_misses
+        self.max_jump = max_jump
+        self.acquisitions = 0
+        self.frames = 0
+
+    # -----------------------------------------------------
+    # Public API
+    # -----------------------------------------------------
+    @property
+    def right(self):
+        return self.tracks["Right"]
+
+    @property
+    def left(self):
+        return self.tracks["Left"]
+
+    def hands(self):
+        """Snapshots of the tracked hands (see TrackedHand.snapshot)."""
+        return [t.snapshot() for t in self.tracks.values() if t is not None]
+
+    def configure(self, model_complexity=None, input_scale=None):
+        """Forward model options to the two-hand graph."""
+        self.detector.configure(model_complexity=model_complexity, input_scale=input_scale)
+
+    def process(self, frame):
+        """
+        Update both hands from a BGR frame.
+
+        Returns:
+            Snapshots of the TrackedHands currently tracked
+        """
+        self.frames += 1
+        result = self.detector.detect_hands(frame)
+
+        candidates = []
+        for i, hand_landmarks in enumerate(result.multi_hand_landmarks or ()):
+            label = None
+            if result.multi_handedness:
+                label = result.multi_handedness[i].classification[0].label
+            points = [Point(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark]
+            candidates.append(TrackedHand(label, points))
+
+        self.update(candidates)
+        return self.hands()
+
+    def update(self, candidates):
+        """
+        Associate one frame's detected hands with the tracks.
+
+        Args:
+            candidates: TrackedHands built from the frame's detections
+                (label = MediaPipe handedness or None)
+        """
+        unmatched = self._match(candidates)
+
+        for slot in self.SLOTS:
+            track = self.tracks[slot]
+            if track is not None and track.misses > self.max_misses:
+                self.tracks[slot] = None
+
+        # A detection next to a tracked hand is a duplicate, not a new hand
+        unmatched = [
+            c for c in unmatched
+            if not any(t is not None and _distance(c.center, t.center) <= self.max_jump
+                       for t in self.tracks.values())
+        ]
+        if unmatched:
+            self._assign(unmatched)
+
+    def draw(self, frame, hand):
+        """Draw a tracked hand's skeleton and label."""
+        h, w = frame.shape[:2]
+        pts = [(int(p.x * w), int(p.y * h)) for p in hand.landmark]
+        color = (0, 200, 255) if hand.label == "Right" else (255, 120, 0)
+        for a, b in self.detector.mp_hands.HAND_CONNECTIONS:
+            cv2.line(frame, pts[a], pts[b], color, 2)
+        for p in pts:
+            cv2.circle(frame, p, 3, (255, 255, 255), -1)
+        cv2.putText(frame, hand.label, (pts[0][0] - 20, pts[0][1] + 25),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
+
+    # -----------------------------------------------------
+    # Internals
+    # -----------------------------------------------------
+    def _match(self, candidates):
+        """Greedy nearest-centre matching; returns the unmatched candidates."""
+        pairs = sorted(
+            (_distance(c.center, track.center), slot, i)
+            for slot, track in self.tracks.items() if track is not None
+            for i, c in enumerate(candidates)
+        )
+        matched_slots, matched = set(), set()
+        for distance, slot, i in pairs:
+            if distance > self.max_jump:
+                break
+            if slot in matched_slots or i in matched:
+                continue
+            self.tracks[slot].update(candidates[i].landmark)
+            matched_slots.add(slot)
+            matched.add(i)
+
+        for slot, track in self.tracks.items():
+            if track is not None and slot not in matched_slots:
+                track.misses += 1
+        return [c for i, c in enumerate(candidates) if i not in matched]
+
+    def _assign(self, candidates):
+        free = [slot for slot in self.SLOTS if self.tracks[slot] is None]
+        if not free:
+            return
+
+        if len(free) == 2 and len(candidates) >= 2:
+            # Both new: assign by position (mirrored view: right hand on the right)
+            candidates = sorted(candidates, key=lambda c: c.center[0], reverse=True)
+            assignment = zip(("Right", "Left"), candidates[:2])
+        elif len(free) == 2:
+            # One new hand: trust the handedness label this once
+            label = candidates[0].label if candidates[0].label in self.SLOTS else "Right"
+            assignment = [(label, candidates[0])]
+        else:
+            # The other hand is tracked: take the candidate closest to the free side
+            other = self.tracks[self.SLOTS[0] if free[0] == self.SLOTS[1] else self.SLOTS[1]]
+            if free[0] == "Right":
+                best = max(candidates, key=lambda c: c.center[0] - other.center[0])
+            else:
+                best = max(candidates, key=lambda c: other.center[0] - c.center[0])
+            assignment = [(free[0], best)]
+
+        for slot, candidate in assignment:
+            candidate.label = slot
+            self.tracks[slot] = candidate
+            self.acquisitions += 1
+
+
+def _distance(a, b):
+    return ((a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2) ** 0.5
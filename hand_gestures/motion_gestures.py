@@ -0,0 +1,223 @@
+import math
+import time
+
+from utils.input_backend import PyAutoGUIBackend
+from utils.landmark_history import LandmarkHistory
+
+
+# MediaPipe Hands indices
+WRIST = 0
+INDEX_MCP = 5
+PINKY_MCP = 17
+INDEX_TIP = 8
+INDEX_PIP = 6
+MIDDLE_TIP = 12
+MIDDLE_PIP = 10
+RING_TIP = 16
+RING_PIP = 14
+PINKY_TIP = 20
+PINKY_PIP = 18
+
+
+class _HandMotion:
+    """History and gesture state of one hand."""
+
+    def __init__(self, seconds, rate):
+        self.history = LandmarkHistory(21, seconds=seconds, rate=rate)
+        self.last_swipe = -math.inf
+        self.swipe_armed = True
+        self.scrolling = False
+        self.momentum = 0.0          # Flick scroll speed (frame heights / s)
+        self.scroll_residue = 0.0    # Fractional scroll units carried over
+
+
+class MotionGestures:
+    """
+    Gestures made of movement rather than a single pose, read from a
+    LandmarkHistory of each hand:
+
+    - Swipe: a fast horizontal sweep of the palm switches tabs
+      (right: next tab, left: previous tab)
+    - Two-finger scroll: with index and middle finger extended (ring and
+      pinky folded), vertical palm movement scrolls by an amount
+      proportional to its speed, like dragging on a touchpad
+    - Flick: releasing a fast two-finger stroke keeps scrolling with
+      momentum that decays over about half a second
+
+    Speeds are in frame heights per second, so they do not depend on the
+    camera resolution. Times are the frames' capture timestamps.
+    """
+
+    SWIPE_KEYS = {
+        "right": ("ctrl", "tab"),
+        "left": ("ctrl", "shift", "tab"),
+    }
+
+    def __init__(self, input_backend=None, history_seconds=1.0, rate=60):
+        """
+        Args:
+            input_backend: Where key and scroll events go (default: PyAutoGUI)
+            history_seconds: Motion kept per hand
+            rate: Highest expected frame rate (sizes the histories)
+        """
+        self.input = input_backend or PyAutoGUIBackend()
+        self.enabled = True
+        self.history_seconds = history_seconds
+        self.rate = rate
+        self.hands = {}          # handedness label -> _HandMotion
+
+        # Swipe
+        self.swipe_speed = 1.5       # Palm speed that counts as a swipe
+        self.swipe_distance = 0.25   # Minimum horizontal travel
+        self.swipe_window = 0.25     # Seconds the swipe is measured over
+        self.swipe_cooldown = 0.6    # Seconds before the next swipe
+
+        # Scroll
+        self.scroll_gain = 300.0     # Scroll units per frame height moved
+        self.scroll_dead_zone = 0.15 # Slower movement does not scroll (tremor)
+        self.flick_speed = 2.0       # Release speed that starts momentum
+        self.flick_decay = 6.0       # Momentum decay rate (1/s)
+
+        self.max_gap = 0.2           # Longer tracking gaps restart the motion
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        print(f"[Motion Gestures] {'Enabled' if self.enabled else 'Disabled'}")
+
+    def history(self, hand="Right"):
+        """The LandmarkHistory of one hand (created on first use)."""
+        return self._hand(hand).history
+
+    def in_motion(self, hand="Right"):
+        """
+        True while the hand is doing a motion gesture: the scroll pose is
+        held, a flick is still scrolling, or a swipe has not settled yet.
+        """
+        state = self.hands.get(hand)
+        if state is None or not self.enabled:
+            return False
+        return state.scrolling or bool(state.momentum) or not state.swipe_armed
+
+    def _hand(self, hand):
+        state = self.hands.get(hand)
+        if state is None:
+            state = _HandMotion(self.history_seconds, self.rate)
+            self.hands[hand] = state
+        return state
+
+    # -----------------------------------------------------
+    # Pose helpers
+    # -----------------------------------------------------
+    @staticmethod
+    def _extended(points, tip, pip):
+        # Image y grows downwards; the hand points up while scrolling
+        return points[tip, 1] < points[pip, 1]
+
+    def _scroll_pose(self, points):
+        return (self._extended(points, INDEX_TIP, INDEX_PIP)
+                and self._extended(points, MIDDLE_TIP, MIDDLE_PIP)
+                and not self._extended(points, RING_TIP, RING_PIP)
+                and not self._extended(points, PINKY_TIP, PINKY_PIP))
+
+    @staticmethod
+    def _palm(values, axis):
+        return (values[WRIST, axis] + values[INDEX_MCP, axis] + values[PINKY_MCP, axis]) / 3.0
+
+    # -----------------------------------------------------
+    # Per frame
+    # -----------------------------------------------------
+    def update(self, landmarks, timestamp=None, hand="Right", aspect=4 / 3):
+        """
+        Record one hand's landmarks and act on its motion.
+
+        Args:
+            landmarks: 21 MediaPipe hand landmarks (normalized)
+            timestamp: Capture time of the frame (default: now)
+            hand: Handedness label; each hand has its own history
+            aspect: Frame width / height, so horizontal speeds are in
+                frame heights per second too
+
+        Returns:
+            Name of the gesture performed ("swipe_left", "swipe_right",
+            "scroll", "flick") or None
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        state = self._hand(hand)
+        history = state.history
+        last = history.latest_time()
+        if last is not None and timestamp - last > self.max_gap:
+            history.clear()
+            state.scrolling = False
+            state.momentum = 0.0
+            last = None
+        history.append(landmarks, timestamp)
+        if not self.enabled:
+            return None
+
+        dt = 0.0 if last is None else timestamp - last
+        gesture = self._swipe(state, timestamp, aspect)
+        if gesture is None:
+            gesture = self._scroll(state, dt)
+        return gesture
+
+    def _swipe(self, state, now, aspect):
+        history = state.history
+        velocity = history.velocity(self.swipe_window)
+        vx = self._palm(velocity, 0) * aspect
+        vy = self._palm(velocity, 1)
+        if not state.swipe_armed:
+            # Wait for the hand to slow down, so the return stroke is not a swipe
+            if abs(vx) < self.swipe_speed / 3:
+                state.swipe_armed = True
+            return None
+        if now - state.last_swipe < self.swipe_cooldown:
+            return None
+        if abs(vx) < self.swipe_speed or abs(vx) < 2.0 * abs(vy):
+            return None
+        dx = self._palm(history.displacement(self.swipe_window), 0) * aspect
+        if abs(dx) < self.swipe_distance or dx * vx < 0:
+            return None
+        direction = "right" if vx > 0 else "left"
+        self.input.hotkey(*self.SWIPE_KEYS[direction])
+        state.last_swipe = now
+        state.swipe_armed = False
+        state.momentum = 0.0
+        return f"swipe_{direction}"
+
+    def _scroll(self, state, dt):
+        history = state.history
+        gesture = None
+        speed = 0.0
+        if self._scroll_pose(history.latest()):
+            # Up the frame (negative y) scrolls up (positive amounts)
+            speed = -self._palm(history.velocity(0.1), 1)
+            if abs(speed) < self.scroll_dead_zone:
+                speed = 0.0
+            state.scrolling = True
+            state.momentum = 0.0
+            if speed:
+                gesture = "scroll"
+        elif state.scrolling:
+            # Pose released: a fast last stroke keeps going
+            state.scrolling = False
+            release = -self._palm(history.velocity(0.15), 1)
+            if abs(release) >= self.flick_speed:
+                state.momentum = release
+                gesture = "flick"
+
+        if not state.scrolling and state.momentum:
+            speed = state.momentum
+            state.momentum *= math.exp(-self.flick_decay * dt)
+            if abs(state.momentum) < self.scroll_dead_zone:
+                state.momentum = 0.0
+
+        if speed:
+            state.scroll_residue += speed * dt * self.scroll_gain
+            amount = int(state.scroll_residue)
+            if amount:
+                state.scroll_residue -= amount
+                self.input.scroll(amount)
+        else:
+            state.scroll_residue = 0.0
+        return gesture
@@ -1,11 +1,19 @@
 import cv2
 import math
 import time
-import pyautogui
+
+from utils.input_backend import PyAutoGUIBackend
 
 
 class AirKeyboard:
-    def __init__(self):
+    def __init__(self, word_tracker=None, input_backend=None, clock=time.time):
+        """
+        word_tracker: optional WordTracker offering completions on the dial
+        input_backend: where key events go (defaults to PyAutoGUI)
+        clock: time source (simulators pass a simulated clock)
+        """
+        self.input = input_backend or PyAutoGUIBackend()
+        self.clock = clock
         self.enabled = False
         self.last_action_time = 0
         self.action_delay = 0.4
@@ -17,12 +25,15 @@ class AirKeyboard:
         self.DIAL_SMOOTHING = 0.2
         self.PINCH_T = 0.06
 
+        self.word_tracker = word_tracker
+        self.selected_completion = None
+
     def toggle(self):
         self.enabled = not self.enabled
         print(f"[Keyboard] {'Enabled' if self.enabled else 'Disabled'}")
 
     def _can_act(self):
-        return time.time() - self.last_action_time > self.action_delay
+        return self.clock() - self.last_action_time > self.action_delay
 
     def _dist(self, p1, p2):
         return math.hypot(p1.x - p2.x, p1.y - p2.y)
@@ -31,16 +42,38 @@ class AirKeyboard:
         tips = [8, 12, 16, 20]
         return all(self._dist(lms[t], lms[0]) < 0.18 for t in tips)
 
+    def _draw_dial(self, frame, current_set, completions):
+        """Draw the character dial and the completion arc."""
+        h, w = frame.shape[:2]
+        center = (w - 60, h - 60)
+        cv2.ellipse(frame, center, (320, 320), 0, 180, 270, (40, 40, 40), 30)
+
+        for i, ch in enumerate(current_set):
+            angle = 180 + (i / (len(current_set)-1) * 90)
+            x = int(center[0] + 360 * math.cos(math.radians(angle)))
+            y = int(center[1] + 360 * math.sin(math.radians(angle)))
+
+            if ch == self.selected_char:
+                cv2.circle(frame, (x, y), 24, (0, 255, 0), -1)
+                cv2.putText(frame, ch, (x-10, y+10), 1, 2, (255,255,255), 3)
+            else:
+                cv2.putText(frame, ch, (x-5, y+5), 1, 0.7, (200,200,200), 1)
+
+        for i, word in enumerate(completions):
+            angle = 180 + ((i + 0.5) / len(completions) * 90)
+            x = int(center[0] + 240 * math.cos(math.radians(angle)))
+            y = int(center[1] + 240 * math.sin(math.radians(angle)))
+            color = (0, 255, 255) if i == self.selected_completion else (160, 160, 160)
+            cv2.putText(frame, word.upper(), (x-30, y), 1, 1.0, color, 2)
+
     def process(self, right_hand, left_hand, frame):
         """
         right_hand, left_hand: hand_landmarks or None
-        frame: OpenCV frame (for UI drawing)
+        frame: OpenCV frame (for UI drawing), or None when running headless
         """
         if not self.enabled:
             return
 
-        h, w = frame.shape[:2]
-
         # -------- RIGHT HAND: DIAL SELECTION --------
         if right_hand:
             current_set = self.SYMBOLS if self.is_fist(right_hand) else self.LETTERS
@@ -57,34 +90,46 @@ class AirKeyboard:
                 (1 - self.DIAL_SMOOTHING) * self.smooth_angle
             )
 
-            idx = int((abs(self.smooth_angle) / 90) * (len(current_set) - 1))
+            # Round so each slot is centred on its drawn character and
+            # the end slots stay reachable despite smoothing
+            idx = int(round((abs(self.smooth_angle) / 90) * (len(current_set) - 1)))
             self.selected_char = current_set[idx]
 
-            # ---- UI DRAW ----
-            center = (w - 60, h - 60)
-            cv2.ellipse(frame, center, (320, 320), 0, 180, 270, (40, 40, 40), 30)
-
-            for i, ch in enumerate(current_set):
-                angle = 180 + (i / (len(current_set)-1) * 90)
-                x = int(center[0] + 360 * math.cos(math.radians(angle)))
-                y = int(center[1] + 360 * math.sin(math.radians(angle)))
+            # Completions share the dial angle on an inner arc
+            completions = self.word_tracker.completions if self.word_tracker else []
+            self.selected_completion = None
+            if completions:
+                cidx = int((abs(self.smooth_angle) / 90) * len(completions))
+                self.selected_completion = min(cidx, len(completions) - 1)
 
-                if ch == self.selected_char:
-                    cv2.circle(frame, (x, y), 24, (0, 255, 0), -1)
-                    cv2.putText(frame, ch, (x-10, y+10), 1, 2, (255,255,255), 3)
-                else:
-                    cv2.putText(frame, ch, (x-5, y+5), 1, 0.7, (200,200,200), 1)
+            if frame is not None:
+                self._draw_dial(frame, current_set, completions)
 
         # -------- LEFT HAND: ACTIONS --------
         if left_hand and self._can_act():
             if self._dist(left_hand[4], left_hand[8]) < self.PINCH_T:
-                pyautogui.write(self.selected_char)
-                self.last_action_time = time.time()
+                self.input.write(self.selected_char)
+                if self.word_tracker:
+                    self.word_tracker.type_char(self.selected_char)
+                self.last_action_time = self.clock()
 
             elif self._dist(left_hand[4], left_hand[12]) < self.PINCH_T:
-                pyautogui.press("space")
-                self.last_action_time = time.time()
+                self.input.press("space")
+                if self.word_tracker:
+                    self.word_tracker.reset()
+                self.last_action_time = self.clock()
+
+            elif (self.word_tracker and self.selected_completion is not None
+                    and self._dist(left_hand[4], left_hand[16]) < self.PINCH_T):
+                # Thumb-ring pinch accepts the highlighted completion
+                suffix = self.word_tracker.accept(self.selected_completion)
+                if suffix:
+                    self.input.write(suffix.upper())
+                self.selected_completion = None
+                self.last_action_time = self.clock()
 
             elif self._dist(left_hand[4], left_hand[20]) < self.PINCH_T:
-                pyautogui.press("backspace")
-                self.last_action_time = time.time()
+                self.input.press("backspace")
+                if self.word_tracker:
+                    self.word_tracker.backspace()
+                self.last_action_time = self.clock()
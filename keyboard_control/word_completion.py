@@ -0,0 +1,248 @@
+import mmap
+import os
+
+import numpy as np
+
+
+class CompletionTrie:
+    """
+    Compact, frequency-ranked prefix trie for word completion.
+
+    The trie is flattened into a handful of NumPy arrays (nodes in
+    breadth-first order, so every node's children are contiguous and
+    sorted by character). Each node stores the ids of its most frequent
+    words, and word ids are frequency ranks, so a lookup is one walk
+    down the prefix plus a slice. The arrays are cached next to the word
+    list and opened memory-mapped, which keeps start-up and memory cost
+    low even for large vocabularies.
+    """
+
+    CACHE_VERSION = 1
+    ARRAYS = ("node_char", "first_child", "child_count", "top_words",
+              "word_offsets", "word_blob")
+
+    def __init__(self, arrays):
+        self.node_char = arrays["node_char"]
+        self.first_child = arrays["first_child"]
+        self.child_count = arrays["child_count"]
+        self.top_words = arrays["top_words"]
+        self.word_offsets = arrays["word_offsets"]
+        self.word_blob = arrays["word_blob"]
+        self.max_results = self.top_words.shape[1]
+
+    def __len__(self):
+        return len(self.word_offsets) - 1
+
+    # -----------------------------------------------------
+    # Building and loading
+    # -----------------------------------------------------
+    @classmethod
+    def load(cls, word_list_path, max_results=8, rebuild=False):
+        """
+        Load the trie for a word list, building the cache if needed.
+
+        Args:
+            word_list_path: Text file with one word per line, most
+                frequent first, optionally followed by a tab and a count
+            max_results: Completions kept per node
+            rebuild: Ignore an existing cache
+        """
+        cache_dir = word_list_path + ".trie"
+        if rebuild or not cls._cache_is_fresh(word_list_path, cache_dir, max_results):
+            trie = cls.build(_read_word_list(word_list_path), max_results)
+            trie.save(cache_dir)
+            st = os.stat(word_list_path)
+            with open(os.path.join(cache_dir, "VERSION"), "w") as f:
+                f.write(f"{cls.CACHE_VERSION} {st.st_size} {st.st_mtime!r} {max_results}\n")
+
+        arrays = {
+            name: np.load(os.path.join(cache_dir, name + ".npy"), mmap_mode="r")
+            for name in cls.ARRAYS
+        }
+        return cls(arrays)
+
+    @classmethod
+    def _cache_is_fresh(cls, word_list_path, cache_dir, max_results):
+        stamp = os.path.join(cache_dir, "VERSION")
+        try:
+            with open(stamp) as f:
+                version, size, mtime, k = f.read().split()
+        except (OSError, ValueError):
+            return False
+        st = os.stat(word_list_path)
+        return (int(version) == cls.CACHE_VERSION and int(size) == st.st_size
+                and float(mtime) == st.st_mtime and int(k) == max_results)
+
+    @classmethod
+    def build(cls, ranked_words, max_results=8):
+        """
+        Build a trie from words ordered from most to least frequent.
+        """
+        # Deduplicate while keeping the first (most frequent) occurrence
+        seen = set()
+        words = []
+        for word in ranked_words:
+            if word and word not in seen:
+                seen.add(word)
+                words.append(word)
+
+        # Nested-dict trie; each node is [children, word_id or -1]
+        root = [{}, -1]
+        for word_id, word in enumerate(words):
+            node = root
+            for ch in word.encode("utf-8"):
+                node = node[0].setdefault(ch, [{}, -1])
+            node[1] = word_id
+
+        # Flatten breadth-first so siblings are contiguous
+        order = [(root, 0)]
+        node_char = [0]
+        first_child = []
+        child_count = []
+        i = 0
+        while i < len(order):
+            node, _ = order[i]
+            first_child.append(len(order))
+            child_count.append(len(node[0]))
+            for ch in sorted(node[0]):
+                order.append((node[0][ch], ch))
+                node_char.append(ch)
+            i += 1
+
+        # Per-node top words, merged bottom-up (ids are ranks, so smaller is better)
+        n_nodes = len(order)
+        top_words = np.full((n_nodes, max_results), -1, dtype=np.int32)
+        for idx in range(n_nodes - 1, -1, -1):
+            node, _ = order[idx]
+            candidates = [node[1]] if node[1] >= 0 else []
+            start = first_child[idx]
+            for child in range(start, start + child_count[idx]):
+                row = top_words[child]
+                candidates.extend(row[row >= 0].tolist())
+            candidates.sort()
+            best = candidates[:max_results]
+            top_words[idx, :len(best)] = best
+
+        encoded = [w.encode("utf-8") for w in words]
+        word_offsets = np.zeros(len(words) + 1, dtype=np.int64)
+        word_offsets[1:] = np.cumsum([len(w) for w in encoded])
+
+        return cls({
+            "node_char": np.array(node_char, dtype=np.uint8),
+            "first_child": np.array(first_child, dtype=np.int32),
+            "child_count": np.array(child_count, dtype=np.int16),
+            "top_words": top_words,
+            "word_offsets": word_offsets,
+            "word_blob": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+        })
+
+    def save(self, cache_dir):
+        os.makedirs(cache_dir, exist_ok=True)
+        for name in self.ARRAYS:
+            np.save(os.path.join(cache_dir, name + ".npy"), getattr(self, name))
+        return cache_dir
+
+    # -----------------------------------------------------
+    # Lookup
+    # -----------------------------------------------------
+    def _find(self, prefix):
+        node = 0
+        for ch in prefix.encode("utf-8"):
+            start = int(self.first_child[node])
+            count = int(self.child_count[node])
+            if count == 0:
+                return -1
+            children = self.node_char[start:start + count]
+            pos = int(np.searchsorted(children, ch))
+            if pos >= count or children[pos] != ch:
+                return -1
+            node = start + pos
+        return node
+
+    def word(self, word_id):
+        start, end = self.word_offsets[word_id], self.word_offsets[word_id + 1]
+        return bytes(self.word_blob[start:end]).decode("utf-8")
+
+    def complete(self, prefix, k=3):
+        """
+        Most frequent words that extend the prefix (the prefix itself
+        is not returned).
+        """
+        if not prefix:
+            return []
+        node = self._find(prefix)
+        if node < 0:
+            return []
+
+        results = []
+        for word_id in self.top_words[node]:
+            if word_id < 0:
+                break
+            word = self.word(word_id)
+            if word != prefix:
+                results.append(word)
+                if len(results) == k:
+                    break
+        return results
+
+
+def _read_word_list(path):
+    """Read a ranked word list through a memory map, most frequent first."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            entries = []
+            for raw in iter(mm.readline, b""):
+                parts = raw.decode("utf-8").strip().split("\t")
+                if not parts[0] or parts[0].startswith("#"):
+                    continue
+                count = float(parts[1]) if len(parts) > 1 else None
+                entries.append((parts[0].lower(), count))
+
+    # Explicit counts take precedence over file order
+    if any(count is not None for _, count in entries):
+        entries.sort(key=lambda e: -(e[1] or 0.0))
+    return [word for word, _ in entries]
+
+
+class WordTracker:
+    """
+    Follows the word currently being typed and caches its completions
+    so the trie is queried once per keystroke, not once per frame.
+    """
+
+    def __init__(self, trie, k=3):
+        self.trie = trie
+        self.k = k
+        self.current_word = ""
+        self.completions = []
+
+    def _refresh(self):
+        self.completions = self.trie.complete(self.current_word, self.k)
+
+    def type_char(self, ch):
+        if ch.isalpha():
+            self.current_word += ch.lower()
+        else:
+            self.current_word = ""
+        self._refresh()
+
+    def backspace(self):
+        self.current_word = self.current_word[:-1]
+        self._refresh()
+
+    def reset(self):
+        self.current_word = ""
+        self.completions = []
+
+    def accept(self, index):
+        """
+        Accept a completion. Returns the characters still to be typed
+        (including the trailing space) or None if there is no such completion.
+        """
+        if not 0 <= index < len(self.completions):
+            return None
+        suffix = self.completions[index][len(self.current_word):] + " "
+        self.reset()
+        return suffix
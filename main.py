@@ -10,52 +10,172 @@ Team Members:
 
 """
 
+import argparse
+import asyncio
 import cv2
 import keyboard
 import time
+from functools import partial
+from types import SimpleNamespace
 from core.camera import Camera
 from core.face_detector import FaceDetector
 from core.head_pose import HeadPoseEstimator
+from core.face_tracker import ActiveUserLock
 from core.cursor_controller import CursorController
+from core.screen_geometry import VirtualDesktop
+from core.gaze_fusion import HeadPoseSource, GazeFusionSource
 from core.state_manager import StateManager
 from utils.fps import FPSCounter
 from hand_gestures.hand_detector import HandDetector
+from hand_gestures.hand_tracker import TwoHandTracker
 from hand_gestures.gesture_actions import GestureActions
+from hand_gestures.motion_gestures import MotionGestures
 from keyboard_control.air_keyboard import AirKeyboard
+from keyboard_control.word_completion import CompletionTrie, WordTracker
 from core.blink_detector import BlinkDetector
+from core.quality_controller import QualityController
+from core.model_profiles import PROFILES, DEFAULT_PROFILE, get_profile, ladder_for, select_profile
+from core.pipeline import Pipeline, Stage, ParallelStage
+from core.motion_gate import MotionGate, eye_corners
+from core.presence_detector import PresenceDetector, LowPowerMode
+from core import activation
+from core.activation import ActivationGraph, format_active
+from utils.profiler import Profiler
+from utils.tuning import TuningWatcher
+from utils.resource_governor import (
+    PLANS as RESOURCE_PLANS, DEFAULT_PLAN, ResourceGovernor, get_plan, select_plan
+)
+from utils.landmarks import bounding_box
+from remote_input.backend import RemoteInputBackend
 
 
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Touchless device control")
+    parser.add_argument("--profile", action="store_true",
+                        help="Record sampled stacks, allocation diffs and stage spans")
+    parser.add_argument("--profile-dir", default="profile_output",
+                        help="Directory for profiling output (default: profile_output)")
+    parser.add_argument("--alloc-interval", type=int, default=300,
+                        help="Frames between tracemalloc snapshots (default: 300)")
+    parser.add_argument("--config", default="tuning.json",
+                        help="Tuning file, reloaded live when it changes (default: tuning.json)")
+    parser.add_argument("--word-list", default="keyboard_control/words.txt",
+                        help="Frequency-ranked word list for air-keyboard completion")
+    parser.add_argument("--no-motion-gate", action="store_true",
+                        help="Run inference on every frame, even when nothing moves")
+    parser.add_argument("--model-profile", default=DEFAULT_PROFILE,
+                        choices=["auto"] + list(PROFILES),
+                        help="FaceMesh/Hands profile; 'auto' benchmarks this machine once "
+                             f"and caches the choice (default: {DEFAULT_PROFILE})")
+    parser.add_argument("--rebenchmark", action="store_true",
+                        help="With --model-profile or --resource-plan auto, ignore the cached choice")
+    parser.add_argument("--benchmark-video", default=None,
+                        help="Recorded clip with a face for the auto benchmarks "
+                             "(default: frames captured from the camera at startup)")
+    parser.add_argument("--monitors", default=None,
+                        help="Monitor layout 'WxH+X+Y[@scale],...' (default: detected)")
+    parser.add_argument("--cursor-mode", default="absolute", choices=CursorController.MODES,
+                        help="Head-to-cursor mapping; switch at runtime with V (default: absolute)")
+    parser.add_argument("--no-low-power", action="store_true",
+                        help="Keep the full pipeline running while PAUSED or idle in OFF")
+    parser.add_argument("--input-agent", default=None, metavar="ADDRESS",
+                        help="Send input to a remote agent (tcp://host:port or unix:///path) "
+                             "instead of this machine")
+    parser.add_argument("--agent-token", default=None,
+                        help="Shared secret for --input-agent (default: $TOUCHLESS_AGENT_TOKEN)")
+    parser.add_argument("--resource-plan", default=DEFAULT_PLAN,
+                        choices=["auto"] + list(RESOURCE_PLANS),
+                        help="OpenCV threads, pipeline workers and core pinning; 'auto' "
+                             f"calibrates this machine once and caches the choice (default: {DEFAULT_PLAN})")
+    parser.add_argument("--max-faces", type=int, default=1,
+                        help="Faces to track; with more than one, only the enrolled user "
+                             "drives the cursor and clicks (default: 1)")
+    return parser.parse_args(argv)
 
 
-def main():
+def main(argv=None):
+    args = parse_args(argv)
+
     print("=" * 60)
     print("Computer Vision Based Touchless Device Control")
     print("=" * 60)
     print("\nInitializing system...")
     
+    # Pick the model profile before building the detectors
+    benchmark_source = args.benchmark_video if args.benchmark_video else 0
+    if args.model_profile == "auto":
+        print("Selecting model profile...")
+        profile, _, cached = select_profile(target_fps=20, source=benchmark_source,
+                                            use_cache=not args.rebenchmark)
+        source = "cached for this host" if cached else "self-benchmark"
+        print(f"✓ Model profile '{profile.name}' ({source})")
+    else:
+        profile = get_profile(args.model_profile)
+        print(f"✓ Model profile '{profile.name}'")
+    
+    # Share the cores before OpenCV and MediaPipe start their threads
+    if args.resource_plan == "auto":
+        print("Selecting resource plan...")
+        plan, _, cached = select_plan(profile, source=benchmark_source,
+                                      use_cache=not args.rebenchmark)
+        source = "cached for this host" if cached else "calibrated"
+    else:
+        plan = get_plan(args.resource_plan)
+        source = "selected"
+    governor = ResourceGovernor(plan).apply()
+    print(f"✓ Resource plan '{plan.name}' ({source}): {governor.describe()}")
+    
     # Initialize components
     try:
-        camera = Camera(index=0, width=640, height=480)
+        camera = Camera(index=0, width=profile.capture_width, height=profile.capture_height)
         print("✓ Camera initialized")
     except RuntimeError as e:
         print(f"✗ Camera error: {e}")
         return
     
-    face_detector = FaceDetector()
+    # Input goes to this desktop unless a remote agent performs it
+    input_backend = None
+    if args.input_agent:
+        try:
+            input_backend = RemoteInputBackend(args.input_agent, token=args.agent_token)
+            print(f"✓ Remote input agent at {args.input_agent}")
+        except (OSError, ValueError) as e:
+            print(f"✗ Input agent error: {e}")
+            camera.release()
+            return
+    
+    face_detector = FaceDetector(
+        refine_landmarks=profile.refine_landmarks,
+        input_scale=profile.input_scale,
+        max_faces=args.max_faces
+    )
     print("✓ Face detector initialized")
 
-    blink_detector = BlinkDetector()
+    blink_detector = BlinkDetector(input_backend=input_backend)
     print("✓ Blink detector initialized")
     
     head_pose = HeadPoseEstimator()
     print("✓ Head pose estimator initialized")
     
+    # Several faces in view: lock control to one enrolled user
+    user_lock = None
+    if args.max_faces > 1:
+        user_lock = ActiveUserLock(head_pose=head_pose)
+        print(f"✓ Active-user lock initialized (up to {args.max_faces} faces)")
+    
     cursor_controller = CursorController(
         sensitivity_x=20,  # Yaw range (degrees)
         sensitivity_y=10,  # Pitch range (degrees)
-        filter_length=8    # Smoothing filter size
+        filter_length=8,   # Smoothing filter size
+        input_backend=input_backend,
+        desktop=(VirtualDesktop.parse(args.monitors) if args.monitors
+                 else getattr(input_backend, "desktop", None)),
+        mode=args.cursor_mode
     )
-    print("✓ Cursor controller initialized")
+    print(f"✓ Cursor controller initialized ({cursor_controller.desktop.describe()})")
+    
+    # Cursor target sources, switched with 'E'
+    cursor_sources = [HeadPoseSource(), GazeFusionSource()]
     
     state_manager = StateManager(pause_timeout=0.5)
     print("✓ State manager initialized")
@@ -63,124 +183,123 @@ def main():
     fps_counter = FPSCounter()
     print("✓ FPS counter initialized")
 
-    air_keyboard = AirKeyboard()
+    word_tracker = None
+    try:
+        word_tracker = WordTracker(CompletionTrie.load(args.word_list), k=3)
+        print(f"✓ Word completion loaded ({len(word_tracker.trie)} words)")
+    except OSError as e:
+        print(f"✗ Word completion disabled: {e}")
+
+    air_keyboard = AirKeyboard(word_tracker=word_tracker, input_backend=input_backend)
     print("✓ Air keyboard initialized")
 
-    hand_detector = HandDetector()
+    hand_detector = HandDetector(
+        model_complexity=profile.model_complexity,
+        input_scale=profile.input_scale
+    )
     print("✓ Hand detector initialized")
 
-    gesture_actions = GestureActions()
+    # Used while the air keyboard needs both hands at once
+    hand_tracker = TwoHandTracker(model_complexity=profile.model_complexity)
+    print("✓ Two-hand tracker initialized")
+
+    gesture_actions = GestureActions(
+        input_backend=input_backend,
+        motion=MotionGestures(input_backend=input_backend)
+    )
     print("✓ Gesture actions initialized")
 
+    quality_controller = QualityController(
+        camera=camera,
+        face_detector=face_detector,
+        hand_detector=[hand_detector, hand_tracker],
+        target_fps=20,
+        # The selected profile is the best level the controller may return to
+        ladder=ladder_for(profile)
+    )
+    print("✓ Quality controller initialized")
+
+    tuning_watcher = TuningWatcher(args.config, targets=dict(
+        cursor_controller=cursor_controller,
+        blink_detector=blink_detector,
+        gesture_actions=gesture_actions,
+        air_keyboard=air_keyboard,
+    ))
+    print(f"✓ Tuning watcher initialized ({args.config})")
+
+    motion_gate = MotionGate(threshold=3.0, max_skip=10)
+    print("✓ Motion gate initialized")
+
+    low_power = None
+    if not args.no_low_power:
+        low_power = LowPowerMode(PresenceDetector(), camera=camera, low_power_fps=5)
+        print("✓ Low-power presence mode initialized")
+
+    
+    app = SimpleNamespace(
+        camera=camera,
+        face_detector=face_detector,
+        blink_detector=blink_detector,
+        head_pose=head_pose,
+        user_lock=user_lock,
+        blink_enrollment=0,
+        cursor_controller=cursor_controller,
+        cursor_sources=cursor_sources,
+        cursor_source=cursor_sources[0],
+        state_manager=state_manager,
+        fps_counter=fps_counter,
+        air_keyboard=air_keyboard,
+        hand_detector=hand_detector,
+        hand_tracker=hand_tracker,
+        gesture_actions=gesture_actions,
+        quality_controller=quality_controller,
+        tuning_watcher=tuning_watcher,
+        motion_gate=motion_gate,
+        low_power=low_power,
+        activation=ActivationGraph(),
+        last_active=None,
+        calibrate_requested=False,
+        # Last inference results, reused on frames the motion gate skips
+        last_face_result=None,
+        last_hand_result=None,
+        last_rois=[],
+        last_eyes=None,
+        # For storing raw angles (used for calibration)
+        raw_yaw=0,
+        raw_pitch=0,
+        last_toggle_time=0.0,
+        last_present_time=None,
+        preview_count=0,
+        profiler=None,
+    )
+    pipeline = build_default_pipeline(app, max_workers=plan.pipeline_workers)
+    if args.no_motion_gate:
+        pipeline.disable("motion_gate")
+
+    if args.profile:
+        app.profiler = Profiler(
+            output_dir=args.profile_dir, alloc_interval=args.alloc_interval
+        )
+        app.profiler.start()
     
     print("\n" + "=" * 60)
     print("CONTROLS:")
     print("  t        - Toggle cursor control ON/OFF")
     print("  C         - Calibrate (set current position as center)")
+    print("  K         - Toggle air keyboard")
+    print("  G         - Toggle hand gestures")
+    print("  E         - Switch cursor source (head / gaze + head)")
+    print("  V         - Switch cursor mapping (absolute / velocity)")
     print("  ESC       - Exit application")
     print("=" * 60)
-    print("\nStarting main loop...\n")
-    
-    # For storing raw angles (used for calibration)
-    raw_yaw = 0
-    raw_pitch = 0
+    print(f"\nPipeline: {pipeline.describe()}")
+    print(app.activation.describe())
+    print("Starting main loop...\n")
     
-    # Main loop
+    # Pins threads as they appear (pipeline workers, MediaPipe) and samples their CPU time
+    governor.start()
     try:
-        while True:
-            # Read frame from camera
-            frame = camera.read()
-            if frame is None:
-                print("Failed to read frame")
-                break
-            
-            # Flip frame horizontally for mirror effect
-            frame = cv2.flip(frame, 1)
-            h, w = frame.shape[:2]
-            
-            # Detect face landmarks
-            result = face_detector.process(frame)
-            
-            # Check if face is detected
-            face_detected = result.multi_face_landmarks is not None
-            state_manager.update_face_presence(face_detected)
-            
-            # Process head pose if face is detected
-            if face_detected:
-                landmarks = result.multi_face_landmarks[0].landmark
-                
-                # Blink detection (LEFT EYE → CLICK)
-                blink_detector.process(landmarks, w, h)
-                
-                # Estimate head orientation
-                pitch, yaw, forward_axis = head_pose.estimate(landmarks, w, h)
-                raw_pitch = pitch
-                raw_yaw = yaw
-                
-                # Update cursor if state is active
-                if state_manager.is_active():
-                    cursor_controller.update(pitch, yaw, forward_axis)
-                
-                # Optional: Draw face mesh for debugging
-                # face_detector.draw(frame, result)
-            
-            # ---------------- HAND PROCESSING ----------------
-            hand_result = hand_detector.detect_hands(frame)
-
-            right_hand = None
-            left_hand = None
-
-            if hand_result.multi_hand_landmarks:
-                for i, hand_landmarks in enumerate(hand_result.multi_hand_landmarks):
-                    # Draw hand landmarks
-                    hand_detector.draw_landmarks(frame, hand_landmarks)
-
-                    # Gesture-based actions (scroll / zoom / volume)
-                    gesture_actions.perform_actions(hand_landmarks)
-
-                    # Identify left / right hand
-                    if hand_result.multi_handedness:
-                        label = hand_result.multi_handedness[i].classification[0].label
-                        if label == "Right":
-                            right_hand = hand_landmarks.landmark
-                        elif label == "Left":
-                            left_hand = hand_landmarks.landmark
-
-            # ---------------- AIR KEYBOARD ----------------
-            air_keyboard.process(right_hand, left_hand, frame)
-
-
-
-            # Get current FPS
-            current_fps = fps_counter.tick()
-            
-            # Draw UI overlays
-            _draw_ui(frame, state_manager, cursor_controller, current_fps, face_detected)
-            
-            # Display frame
-            cv2.imshow("Touchless Device Control", frame)
-            
-            # Handle keyboard input
-            key = cv2.waitKey(1) & 0xFF
-            
-            # ESC to exit
-            if key == 27:
-                print("\nExiting...")
-                break
-            
-            # 'C' to calibrate
-            elif key == ord('c') or key == ord('C'):
-                cursor_controller.calibrate(raw_yaw, raw_pitch)
-            
-            # t to toggle (using keyboard library for F7)
-            if keyboard.is_pressed('t'):
-                was_enabled = cursor_controller.toggle()
-                # Sync state manager with cursor controller
-                if was_enabled:
-                    state_manager.state = state_manager.state.ON
-                else:
-                    state_manager.state = state_manager.state.OFF
-                time.sleep(0.3)  # Debounce
+        asyncio.run(pipeline.run())
     
     except KeyboardInterrupt:
         print("\nInterrupted by user")
@@ -188,20 +307,404 @@ def main():
     finally:
         # Cleanup
         print("\nCleaning up...")
+        if app.profiler is not None:
+            app.profiler.stop()
+        print(f"Motion gate skipped {motion_gate.gated_fraction:.0%} of inferences")
+        governor.stop()
+        print(governor.monitor.report())
         cursor_controller.cleanup()
+        if input_backend is not None:
+            print(f"Remote input: {input_backend.describe()}")
+            input_backend.close()
         camera.release()
         cv2.destroyAllWindows()
         print("Done!")
 
 
-def _draw_ui(frame, state_manager, cursor_controller, fps, face_detected):
+# ---------------------------------------------------------
+# Pipeline configuration
+# ---------------------------------------------------------
+def build_default_pipeline(app, max_workers=4):
+    """
+    The standard touchless-control pipeline:
+    source -> motion_gate -> inference[face | hands | presence]
+           -> interpretation -> actuation -> presentation
+    
+    Each frame computes only the units the activation graph resolves for
+    the current state and feature toggles (see core.activation); in
+    low-power mode only the presence branch runs inference.
+    """
+    return Pipeline([
+        Stage("source", partial(_source_stage, app), blocking=True),
+        Stage("motion_gate", partial(_motion_gate_stage, app)),
+        ParallelStage("inference", [
+            Stage("face", partial(_face_inference_stage, app), blocking=True,
+                  requires=activation.FACE_MESH),
+            Stage("hands", partial(_hand_inference_stage, app), blocking=True,
+                  requires=activation.HANDS),
+            Stage("presence", partial(_presence_stage, app), blocking=True,
+                  requires=activation.PRESENCE),
+        ]),
+        Stage("interpretation", partial(_interpretation_stage, app)),
+        Stage("actuation", partial(_actuation_stage, app), blocking=True),
+        Stage("presentation", partial(_presentation_stage, app)),
+    ], max_workers=max_workers)
+
+
+def _source_stage(app, ctx):
+    """Read a frame from the camera and mirror it."""
+    if app.low_power is not None and app.low_power.active:
+        # Presence-only frames: capture at the low-power rate
+        app.low_power.throttle()
+        ctx.low_power = True
+    
+    # Decide what this frame computes
+    state = app.state_manager.get_state()
+    features = _active_features(app)
+    ctx.active = app.activation.resolve(state, features, low_power=ctx.low_power)
+    if ctx.active != app.last_active:
+        print(f"[Activation] {format_active(state, features, ctx.active)}")
+        # Results of units that were off are stale
+        app.motion_gate.reset()
+        app.last_active = ctx.active
+    
+    frame = app.camera.read()
+    if frame is None:
+        print("Failed to read frame")
+        ctx.stop = True
+        return
+    ctx.capture_time = time.time()
+    
+    # Flip frame horizontally for mirror effect
+    ctx.frame = cv2.flip(frame, 1)
+    ctx.h, ctx.w = ctx.frame.shape[:2]
+
+
+def _active_features(app):
+    """Names of the enabled feature toggles (keys of activation.FEATURE_UNITS)."""
+    features = []
+    if app.air_keyboard.enabled:
+        features.append("keyboard")
+    if app.gesture_actions.enabled:
+        features.append("gestures")
+    if app.calibrate_requested:
+        features.append("calibration")
+    return features
+
+
+def _motion_gate_stage(app, ctx):
+    """Skip inference on frames where the face and hands did not move."""
+    if ctx.low_power:
+        return
+    eyes = None
+    if ctx.runs(activation.BLINK):
+        if app.blink_detector.eye_closed:
+            # A wink is being timed: every frame counts until the eye reopens
+            app.motion_gate.reset()
+        eyes = app.last_eyes
+    # The reference is committed by the inference stage, because this frame
+    # can still be dropped by the latest-wins queue before inference runs
+    ctx.landmarks_reused = not app.motion_gate.should_infer(
+        ctx.frame, app.last_rois, commit=False, eyes=eyes
+    )
+    ctx.gate_thumbnail = app.motion_gate.last_thumbnail
+
+
+def _face_inference_stage(app, ctx):
+    if ctx.landmarks_reused:
+        ctx.face_result = app.last_face_result
+        return
+    ctx.face_result = app.face_detector.process(ctx.frame)
+    app.last_face_result = ctx.face_result
+    if ctx.gate_thumbnail is not None:
+        app.motion_gate.commit(ctx.gate_thumbnail)
+
+
+def _hand_inference_stage(app, ctx):
+    # The air keyboard needs the right hand (dial) and the left hand (pinches) together
+    if ctx.runs(activation.TWO_HANDS):
+        if ctx.landmarks_reused:
+            ctx.tracked_hands = app.hand_tracker.hands()
+        else:
+            ctx.tracked_hands = app.hand_tracker.process(ctx.frame)
+        return
+    
+    if ctx.landmarks_reused:
+        ctx.hand_result = app.last_hand_result
+        return
+    ctx.hand_result = app.hand_detector.detect_hands(ctx.frame)
+    app.last_hand_result = ctx.hand_result
+
+
+def _presence_stage(app, ctx):
+    """Cheap face-presence check, run instead of FaceMesh/Hands in low power."""
+    ctx.face_detected = app.low_power.detect_presence(ctx.frame)
+
+
+def _interpretation_stage(app, ctx):
+    """Turn raw model output into face presence, head pose and hand roles."""
+    if ctx.low_power:
+        was_paused = app.state_manager.is_paused()
+        app.state_manager.update_face_presence(ctx.face_detected)
+        if was_paused and ctx.face_detected:
+            # Face is back: run the full pipeline from the next frame on,
+            # without reusing landmarks from before the pause
+            app.low_power.wake()
+            app.motion_gate.reset()
+            app.last_face_result = None
+            app.last_hand_result = None
+            app.last_rois = []
+            app.last_eyes = None
+        return
+    
+    result = ctx.face_result
+    ctx.face_detected = result is not None and result.multi_face_landmarks is not None
+    
+    ctx.landmarks = None
+    ctx.pose = None
+    if app.user_lock is not None:
+        # Track every face, estimate all poses in one batch, keep only the user's
+        faces = [face.landmark for face in result.multi_face_landmarks] if ctx.face_detected else []
+        estimate_pose = ctx.runs(activation.HEAD_POSE)
+        # While the cursor is ON only C hands control to someone else
+        active = app.user_lock.update(faces, ctx.w, ctx.h, ctx.capture_time, estimate_pose,
+                                      auto_enroll=not app.state_manager.is_active())
+        # Bystanders do not keep the system awake for a user who left
+        app.state_manager.update_face_presence(active is not None)
+        if active is not None:
+            ctx.landmarks = active.landmarks
+            if estimate_pose:
+                ctx.pose = active.pose
+                app.raw_pitch, app.raw_yaw = ctx.pose[0], ctx.pose[1]
+    else:
+        app.state_manager.update_face_presence(ctx.face_detected)
+        if ctx.face_detected:
+            ctx.landmarks = result.multi_face_landmarks[0].landmark
+    
+    if app.user_lock is None and ctx.landmarks is not None and ctx.runs(activation.HEAD_POSE):
+        # Estimate head orientation
+        ctx.pose = app.head_pose.estimate(ctx.landmarks, ctx.w, ctx.h)
+        app.raw_pitch, app.raw_yaw = ctx.pose[0], ctx.pose[1]
+    
+    # Identify left / right hand
+    ctx.hands = []
+    ctx.right_hand = None
+    ctx.left_hand = None
+    hand_result = ctx.hand_result
+    if ctx.tracked_hands is not None:
+        # Snapshots taken by the hands stage; the tracker itself may
+        # already be working on the next frame
+        ctx.hands = list(ctx.tracked_hands)
+        for hand in ctx.hands:
+            if hand.label == "Right":
+                ctx.right_hand = hand.landmark
+            elif hand.label == "Left":
+                ctx.left_hand = hand.landmark
+    elif hand_result is not None and hand_result.multi_hand_landmarks:
+        for i, hand_landmarks in enumerate(hand_result.multi_hand_landmarks):
+            ctx.hands.append(hand_landmarks)
+            if hand_result.multi_handedness:
+                label = hand_result.multi_handedness[i].classification[0].label
+                if label == "Right":
+                    ctx.right_hand = hand_landmarks.landmark
+                elif label == "Left":
+                    ctx.left_hand = hand_landmarks.landmark
+    
+    # Regions the motion gate watches on the next frame
+    if not ctx.landmarks_reused:
+        rois = [bounding_box(hand.landmark) for hand in ctx.hands]
+        if ctx.landmarks is not None:
+            rois.append(bounding_box(ctx.landmarks))
+        if app.user_lock is not None:
+            # Bystanders move too; their tracks need fresh boxes
+            rois.extend(tuple(t.box) for t in app.user_lock.tracks if t.landmarks is not ctx.landmarks)
+        app.last_rois = rois
+        app.last_eyes = eye_corners(ctx.landmarks) if ctx.landmarks is not None else None
+
+
+def _actuation_stage(app, ctx):
+    """Drive the cursor, clicks, gestures and the air keyboard."""
+    # Apply tuning changes between frames, before any tuned component runs
+    app.tuning_watcher.poll()
+    
+    if app.user_lock is not None and app.user_lock.enrollments != app.blink_enrollment:
+        # Someone new enrolled: relearn the per-eye blink thresholds
+        app.blink_detector.reset()
+        app.blink_enrollment = app.user_lock.enrollments
+    
+    if ctx.landmarks is not None and ctx.runs(activation.BLINK) and not ctx.landmarks_reused:
+        # Wink clicks (left eye → left click, right eye → right click),
+        # only while the cursor is in use. Reused landmarks are not new
+        # samples: the gate only reuses them while both eyes look unchanged
+        app.blink_detector.process(ctx.landmarks, ctx.w, ctx.h, ctx.capture_time)
+    
+    if ctx.pose is not None:
+        # Update cursor if state is active
+        if ctx.runs(activation.CURSOR) and app.state_manager.is_active():
+            x, y = app.cursor_source.target(
+                app.cursor_controller, ctx.pose, ctx.landmarks, ctx.w, ctx.h
+            )
+            app.cursor_controller.set_target(x, y)
+        
+        # Deferred 'C' press: head pose ran for this frame because of it
+        if app.calibrate_requested:
+            app.cursor_controller.calibrate(app.raw_yaw, app.raw_pitch)
+            app.cursor_source.calibrate(ctx.landmarks, ctx.w, ctx.h)
+            app.calibrate_requested = False
+    
+    # Gesture-based actions (zoom / volume, swipes and scrolling)
+    if ctx.runs(activation.GESTURES):
+        for hand_landmarks in ctx.hands:
+            hand = "Left" if hand_landmarks.landmark is ctx.left_hand else "Right"
+            app.gesture_actions.perform_actions(
+                hand_landmarks, ctx.capture_time, hand=hand, aspect=ctx.w / ctx.h
+            )
+    
+    # ---------------- AIR KEYBOARD ----------------
+    if ctx.runs(activation.KEYBOARD):
+        app.air_keyboard.process(ctx.right_hand, ctx.left_hand, ctx.frame)
+
+
+def _presentation_stage(app, ctx):
+    """Draw overlays, show the preview and handle key input."""
+    frame = ctx.frame
+    
+    # Draw hand landmarks
+    for hand_landmarks in ctx.hands:
+        if ctx.tracked_hands is not None:
+            app.hand_tracker.draw(frame, hand_landmarks)
+        else:
+            app.hand_detector.draw_landmarks(frame, hand_landmarks)
+    
+    # Optional: Draw face mesh for debugging
+    # app.face_detector.draw(frame, ctx.face_result)
+    
+    # Face IDs, with the enrolled user in green
+    if app.user_lock is not None and not ctx.low_power:
+        _draw_faces(frame, app.user_lock)
+    
+    # Get current FPS
+    current_fps = app.fps_counter.tick()
+    
+    # Draw UI overlays
+    _draw_ui(frame, app.state_manager, app.cursor_controller, current_fps, ctx.face_detected,
+             cursor_source=f"{app.cursor_source.name}, {app.cursor_controller.mode}",
+             quality_level="low-power" if ctx.low_power else app.quality_controller.level.name,
+             gated_fraction=app.motion_gate.gated_fraction,
+             tuning_status=app.tuning_watcher.visible_status())
+    
+    # Display frame (the quality controller may thin out previews)
+    if app.preview_count % app.quality_controller.preview_interval == 0:
+        cv2.imshow("Touchless Device Control", frame)
+    app.preview_count += 1
+    
+    # Feed the frame interval back to the quality controller
+    # (throttled low-power frames would only make it step down)
+    now = time.perf_counter()
+    if ctx.low_power:
+        app.last_present_time = None
+    else:
+        if app.last_present_time is not None:
+            app.quality_controller.record(now - app.last_present_time)
+        app.last_present_time = now
+    
+    if app.profiler is not None:
+        app.profiler.on_frame()
+    
+    # Handle keyboard input
+    key = cv2.waitKey(1) & 0xFF
+    
+    # ESC to exit
+    if key == 27:
+        print("\nExiting...")
+        ctx.stop = True
+        return
+    
+    # 'C' to calibrate
+    elif key == ord('c') or key == ord('C'):
+        # Head pose may be off in this state; calibrate once it has run
+        app.calibrate_requested = True
+        if app.user_lock is not None:
+            # Whoever calibrates becomes the user
+            app.user_lock.enroll()
+    
+    # 'K' to toggle the air keyboard
+    elif key == ord('k') or key == ord('K'):
+        app.air_keyboard.toggle()
+    
+    # 'G' to toggle hand gestures
+    elif key == ord('g') or key == ord('G'):
+        app.gesture_actions.toggle()
+    
+    # 'E' to switch between head-only and gaze-fused cursor targets
+    elif key == ord('e') or key == ord('E'):
+        _switch_cursor_source(app)
+    
+    # 'V' to switch between absolute and velocity (joystick) mapping
+    elif key == ord('v') or key == ord('V'):
+        app.cursor_controller.toggle_mode()
+        app.cursor_source.reset()
+    
+    # t to toggle (using keyboard library, debounced without blocking the loop)
+    if keyboard.is_pressed('t') and time.time() - app.last_toggle_time > 0.3:
+        app.last_toggle_time = time.time()
+        was_enabled = app.cursor_controller.toggle()
+        # Sync state manager with cursor controller
+        if was_enabled:
+            app.state_manager.state = app.state_manager.state.ON
+        else:
+            app.state_manager.state = app.state_manager.state.OFF
+    
+    # Decide whether the next frame can run presence-only
+    if app.low_power is not None:
+        hands_needed = activation.HANDS in app.activation.resolve(
+            app.state_manager.get_state(), _active_features(app)
+        )
+        app.low_power.update(app.state_manager.get_state(), hands_needed, ctx.face_detected)
+
+
+def _switch_cursor_source(app):
+    sources = app.cursor_sources
+    app.cursor_source = sources[(sources.index(app.cursor_source) + 1) % len(sources)]
+    app.cursor_source.reset()
+    # Gaze needs the iris landmarks: keep them on whatever the quality level
+    gaze = isinstance(app.cursor_source, GazeFusionSource)
+    app.quality_controller.pin(refine_landmarks=True if gaze else None)
+    print(f"[Cursor] Target source: {app.cursor_source.name}")
+
+
+def _draw_faces(frame, user_lock):
+    """Draw a box and ID for every tracked face."""
+    h, w = frame.shape[:2]
+    for track in user_lock.tracks:
+        x0, y0, x1, y1 = track.box
+        color = (0, 255, 0) if track.id == user_lock.user_id else (128, 128, 128)
+        cv2.rectangle(frame, (int(x0 * w), int(y0 * h)), (int(x1 * w), int(y1 * h)), color, 2)
+        cv2.putText(
+            frame,
+            f"#{track.id}",
+            (int(x0 * w), max(int(y0 * h) - 8, 15)),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            0.6,
+            color,
+            2
+        )
+
+
+def _draw_ui(frame, state_manager, cursor_controller, fps, face_detected,
+             quality_level=None, tuning_status=None, gated_fraction=None, cursor_source=None):
     """Draw UI overlays on the frame."""
     h, w = frame.shape[:2]
     
-    # Draw FPS
+    # Draw FPS (and the active quality level)
+    fps_text = f"FPS: {fps}"
+    if quality_level is not None:
+        fps_text += f"  Quality: {quality_level}"
+    if gated_fraction is not None:
+        fps_text += f"  Gated: {gated_fraction:.0%}"
     cv2.putText(
         frame,
-        f"FPS: {fps}",
+        fps_text,
         (10, 30),
         cv2.FONT_HERSHEY_SIMPLEX,
         0.7,
@@ -247,6 +750,8 @@ def _draw_ui(frame, state_manager, cursor_controller, fps, face_detected):
     if cursor_controller.is_enabled():
         cursor_x, cursor_y = cursor_controller.get_position()
         cursor_text = f"Cursor: ({cursor_x}, {cursor_y})"
+        if cursor_source is not None:
+            cursor_text += f" [{cursor_source}]"
         cv2.putText(
             frame,
             cursor_text,
@@ -257,8 +762,21 @@ def _draw_ui(frame, state_manager, cursor_controller, fps, face_detected):
             2
         )
     
+    # Draw the result of the last tuning reload
+    if tuning_status is not None:
+        text, ok = tuning_status
+        cv2.putText(
+            frame,
+            text,
+            (10, 150),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            0.5,
+            (0, 255, 0) if ok else (0, 0, 255),
+            1
+        )
+    
     # Draw help text at bottom
-    help_text = "t: Toggle | C: Calibrate | ESC: Exit"
+    help_text = "t: Toggle | C: Calibrate | K: Keyboard | G: Gestures | E: Gaze | V: Velocity | ESC: Exit"
     text_size = cv2.getTextSize(help_text, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)[0]
     text_x = (w - text_size[0]) // 2
     cv2.putText(
@@ -0,0 +1 @@
+# Split vision host / input agent over a local socket protocol
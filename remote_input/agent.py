@@ -0,0 +1,260 @@
+"""
+Input agent: runs on the machine being controlled and performs the
+cursor, click, scroll, key and text events sent by the vision host.
+
+It only needs PyAutoGUI (no OpenCV or MediaPipe work), so the host
+doing the vision keeps the CPU and the controlled machine does not.
+
+The agent has no encryption. Listen on a Unix socket or on a trusted
+local network, and set a shared token (--token or
+$TOUCHLESS_AGENT_TOKEN) that the host must send before any event is
+accepted.
+
+Usage:
+    python -m remote_input.agent --listen tcp://0.0.0.0:7345 --token SECRET
+    python -m remote_input.agent --listen unix:///tmp/touchless-input.sock --dry-run
+"""
+
+import argparse
+import hmac
+import os
+import socket
+import tempfile
+import threading
+from collections import deque
+
+from core.screen_geometry import VirtualDesktop
+from remote_input.protocol import (
+    DEFAULT_PORT, MessageReader, MessageType, ProtocolError, SEQ_MODULO, encode, listen,
+)
+from utils.input_backend import PyAutoGUIBackend, RecordingBackend
+
+
+class InputAgent:
+    """
+    Serves one vision host at a time.
+
+    A receive thread decodes messages and answers PINGs right away, so
+    the measured round trip does not include slow input calls. Events go
+    to an apply thread; a cursor move that is still queued when a newer
+    one arrives is dropped (latest wins), other events are applied in
+    order.
+    """
+
+    def __init__(self, address, backend=None, desktop=None, token=None, verbose=False):
+        """
+        Args:
+            address: Listen address ('tcp://host:port' or 'unix:///path')
+            backend: Where events go (default: PyAutoGUIBackend)
+            desktop: VirtualDesktop reported to the host (default: detected)
+            token: Shared secret the host must send first (default: $TOUCHLESS_AGENT_TOKEN)
+            verbose: Print every applied event
+        """
+        self.backend = backend or PyAutoGUIBackend()
+        self.desktop = desktop or VirtualDesktop.from_system(
+            fallback_size=self.backend.screen_size()
+        )
+        self.token = token if token is not None else os.environ.get("TOUCHLESS_AGENT_TOKEN")
+        self.verbose = verbose
+        self.listener = listen(address)
+        family = self.listener.family
+        if family in (socket.AF_INET, socket.AF_INET6):
+            host, port = self.listener.getsockname()[:2]
+            self.address = f"tcp://{host}:{port}"
+        else:
+            self.address = address
+        self.running = False
+        self._thread = None
+
+        self.received = 0
+        self.applied = 0
+        self.coalesced_moves = 0
+        self.sequence_gaps = 0
+        self.applied_seq = 0
+
+    # -----------------------------------------------------
+    # Serving
+    # -----------------------------------------------------
+    def serve_forever(self):
+        self.running = True
+        print(f"[Agent] Listening on {self.address} ({self.desktop.describe()})")
+        while self.running:
+            try:
+                conn, peer = self.listener.accept()
+            except OSError:
+                break
+            print(f"[Agent] Host connected {peer or ''}".rstrip())
+            self._serve(conn)
+            print(f"[Agent] Host disconnected ({self.describe()})")
+
+    def start(self):
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, name="input-agent", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.running = False
+        try:
+            self.listener.close()
+        except OSError:
+            pass
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        if self.listener.family == socket.AF_UNIX and os.path.exists(self.address[len("unix://"):]):
+            os.unlink(self.address[len("unix://"):])
+
+    def _serve(self, conn):
+        if conn.family in (socket.AF_INET, socket.AF_INET6):
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        queue = deque()
+        cond = threading.Condition()
+        state = {"open": True}
+        applier = threading.Thread(target=self._apply_loop, args=(queue, cond, state),
+                                   name="input-agent-apply", daemon=True)
+        applier.start()
+
+        reader = MessageReader()
+        authenticated = not self.token
+        expected_seq = None
+        try:
+            conn.sendall(encode(MessageType.HELLO, 0, self.desktop))
+            while self.running:
+                data = conn.recv(65536)
+                if not data:
+                    break
+                for msg_type, seq, args in reader.feed(data):
+                    self.received += 1
+                    if expected_seq is not None and seq != expected_seq:
+                        self.sequence_gaps += 1
+                    expected_seq = (seq + 1) % SEQ_MODULO
+
+                    if not authenticated:
+                        if msg_type != MessageType.AUTH or not hmac.compare_digest(
+                                args[0].encode("utf-8"), self.token.encode("utf-8")):
+                            print("[Agent] Rejected host: missing or wrong token")
+                            return
+                        authenticated = True
+                        continue
+                    if msg_type == MessageType.PING:
+                        conn.sendall(encode(MessageType.PONG, seq, args[0], self.applied_seq))
+                    elif msg_type in (MessageType.HELLO, MessageType.PONG, MessageType.AUTH):
+                        continue
+                    else:
+                        with cond:
+                            if (msg_type == MessageType.MOVE and queue
+                                    and queue[-1][0] == MessageType.MOVE):
+                                # Not applied yet and already stale
+                                queue.pop()
+                                self.coalesced_moves += 1
+                            queue.append((msg_type, seq, args))
+                            cond.notify()
+        except (OSError, ProtocolError) as e:
+            print(f"[Agent] Connection error: {e}")
+        finally:
+            with cond:
+                state["open"] = False
+                cond.notify()
+            applier.join(timeout=1.0)
+            conn.close()
+
+    def _apply_loop(self, queue, cond, state):
+        while True:
+            with cond:
+                cond.wait_for(lambda: queue or not state["open"])
+                if not queue:
+                    return
+                msg_type, seq, args = queue.popleft()
+            try:
+                self._apply(msg_type, args)
+            except Exception as e:  # A failed input call must not kill the agent
+                print(f"[Agent] {msg_type.name} failed: {e}")
+            self.applied += 1
+            self.applied_seq = seq
+
+    def _apply(self, msg_type, args):
+        if self.verbose:
+            print(f"[Agent] {msg_type.name} {' '.join(map(str, args))}")
+        if msg_type == MessageType.MOVE:
+            self.backend.move_to(*args)
+        elif msg_type == MessageType.CLICK:
+            self.backend.click(*args)
+        elif msg_type == MessageType.SCROLL:
+            self.backend.scroll(*args)
+        elif msg_type == MessageType.HOTKEY:
+            self.backend.hotkey(*args)
+        elif msg_type == MessageType.PRESS:
+            self.backend.press(*args)
+        elif msg_type == MessageType.WRITE:
+            self.backend.write(*args)
+
+    def describe(self):
+        return (f"{self.received} received, {self.applied} applied, "
+                f"{self.coalesced_moves} moves coalesced, {self.sequence_gaps} sequence gaps")
+
+
+class LoopbackAgent(InputAgent):
+    """
+    Agent on this machine that records events instead of performing them
+    (RecordingBackend). Stand-in for a real agent in tests and benchmarks:
+
+        with LoopbackAgent() as agent:
+            backend = RemoteInputBackend(agent.address)
+            ...
+            agent.backend.events
+    """
+
+    def __init__(self, transport="tcp", screen_size=(1920, 1080), token=None):
+        """
+        Args:
+            transport: "tcp" (127.0.0.1, free port) or "unix" (temporary socket)
+        """
+        if transport == "unix":
+            self._tmpdir = tempfile.mkdtemp(prefix="touchless-")
+            address = f"unix://{os.path.join(self._tmpdir, 'agent.sock')}"
+        else:
+            self._tmpdir = None
+            address = "tcp://127.0.0.1:0"
+        super().__init__(address, backend=RecordingBackend(screen_size=screen_size),
+                         desktop=VirtualDesktop.single(*screen_size), token=token or "")
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+        if self._tmpdir is not None:
+            try:
+                os.rmdir(self._tmpdir)
+            except OSError:
+                pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Touchless input agent")
+    parser.add_argument("--listen", default=f"tcp://127.0.0.1:{DEFAULT_PORT}",
+                        help="tcp://host:port or unix:///path (default: localhost only)")
+    parser.add_argument("--token", default=None, help="Shared secret (default: $TOUCHLESS_AGENT_TOKEN)")
+    parser.add_argument("--monitors", default=None,
+                        help="Monitor layout 'WxH+X+Y[@scale],...' reported to the host (default: detected)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Print events instead of performing them")
+    args = parser.parse_args()
+
+    backend = RecordingBackend() if args.dry_run else PyAutoGUIBackend()
+    desktop = VirtualDesktop.parse(args.monitors) if args.monitors else None
+    agent = InputAgent(args.listen, backend=backend, desktop=desktop, token=args.token,
+                       verbose=args.dry_run)
+    if not agent.token and agent.address.startswith("tcp://") and \
+            not agent.address.startswith("tcp://127."):
+        print("[Agent] Warning: listening on the network without a token")
+    try:
+        agent.serve_forever()
+    except KeyboardInterrupt:
+        print("\nInterrupted by user")
+    finally:
+        agent.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+import os
+import statistics
+import threading
+import time
+from collections import deque
+
+from remote_input.protocol import (
+    MessageReader, MessageType, ProtocolError, SEQ_MODULO, connect, encode, split_text,
+)
+
+
+class RemoteInputBackend:
+    """
+    Input backend that forwards events to an InputAgent on another machine
+    (same interface as PyAutoGUIBackend and RecordingBackend).
+
+    Events are sent by a background thread, so the pipeline never waits
+    on the network. Cursor moves are coalesced: while a send is in
+    progress only the newest target is kept, and a repeated target is
+    not sent at all. Discrete events (clicks, keys, text) are never
+    dropped and keep their order relative to moves. A PING every
+    `ping_interval` seconds measures the round trip and how far the
+    agent is behind (sent seq - applied seq).
+
+    While the agent is unreachable events are discarded and the
+    connection is retried every `reconnect_interval` seconds.
+    """
+
+    def __init__(self, address, token=None, connect_timeout=5.0,
+                 ping_interval=1.0, reconnect_interval=2.0):
+        """
+        Args:
+            address: 'tcp://host:port', 'host:port' or 'unix:///path'
+            token: Shared secret the agent requires (default: $TOUCHLESS_AGENT_TOKEN)
+            connect_timeout: Seconds to wait for the agent and its HELLO
+            ping_interval: Seconds between round-trip measurements
+            reconnect_interval: Seconds between reconnection attempts
+
+        Raises:
+            OSError: if the agent cannot be reached
+        """
+        self.address = address
+        self.token = token if token is not None else os.environ.get("TOUCHLESS_AGENT_TOKEN")
+        self.connect_timeout = connect_timeout
+        self.ping_interval = ping_interval
+        self.reconnect_interval = reconnect_interval
+
+        self.desktop = None          # VirtualDesktop reported by the agent
+        self.sock = None
+        self.seq = 0                 # Last sequence number sent
+        self.acked_seq = 0           # Last sequence number the agent applied
+        self.sent_messages = 0
+        self.sent_bytes = 0
+        self.coalesced_moves = 0
+        self.dropped_events = 0
+        self.rtts = deque(maxlen=100)
+
+        self._cond = threading.Condition()
+        self._events = []            # (MessageType, args) in order
+        self._pending_move = None
+        self._last_move = None
+        self._next_ping = 0.0
+        self._last_attempt = 0.0
+        self.running = True
+
+        self._connect()
+        self._sender = threading.Thread(target=self._send_loop, name="remote-input", daemon=True)
+        self._sender.start()
+
+    # -----------------------------------------------------
+    # Input backend interface
+    # -----------------------------------------------------
+    def move_to(self, x, y):
+        target = (int(x), int(y))
+        with self._cond:
+            if target == self._last_move:
+                return
+            self._last_move = target
+            if self._pending_move is not None:
+                self.coalesced_moves += 1
+            self._pending_move = target
+            self._cond.notify()
+
+    def click(self, button="left"):
+        self._queue(MessageType.CLICK, button)
+
+    def scroll(self, amount):
+        self._queue(MessageType.SCROLL, amount)
+
+    def hotkey(self, *keys):
+        self._queue(MessageType.HOTKEY, *keys)
+
+    def press(self, key):
+        self._queue(MessageType.PRESS, key)
+
+    def write(self, text):
+        for piece in split_text(text):
+            self._queue(MessageType.WRITE, piece)
+
+    def screen_size(self):
+        return self.desktop.width, self.desktop.height
+
+    def _queue(self, msg_type, *args):
+        with self._cond:
+            # The event applies where the cursor is now, so flush the move first
+            if self._pending_move is not None:
+                self._events.append((MessageType.MOVE, self._pending_move))
+                self._pending_move = None
+            self._events.append((msg_type, args))
+            self._cond.notify()
+
+    # -----------------------------------------------------
+    # Connection
+    # -----------------------------------------------------
+    def _connect(self):
+        self._last_attempt = time.monotonic()
+        sock = connect(self.address, timeout=self.connect_timeout)
+        try:
+            reader = MessageReader()
+            messages = []
+            while not messages:
+                data = sock.recv(4096)
+                if not data:
+                    raise ConnectionError("Agent closed the connection")
+                messages = reader.feed(data)
+            msg_type, _, args = messages[0]
+            if msg_type != MessageType.HELLO:
+                raise ProtocolError(f"Expected HELLO, got {msg_type.name}")
+            self.desktop = args[0]
+            if self.token:
+                self.seq = (self.seq + 1) % SEQ_MODULO
+                sock.sendall(encode(MessageType.AUTH, self.seq, self.token))
+            sock.settimeout(None)
+        except (OSError, ProtocolError):
+            sock.close()
+            raise
+        self.sock = sock
+        self._next_ping = 0.0
+        with self._cond:
+            # Resend the current target after a reconnect
+            self._last_move = None
+        threading.Thread(target=self._receive_loop, args=(sock, reader),
+                         name="remote-input-rx", daemon=True).start()
+        print(f"[Remote Input] Connected to {self.address} ({self.desktop.describe()})")
+
+    def _disconnect(self, reason):
+        if self.sock is not None:
+            print(f"[Remote Input] Connection lost: {reason}")
+            try:
+                self.sock.close()
+            except OSError:
+                pass
+            self.sock = None
+
+    def _receive_loop(self, sock, reader):
+        try:
+            while True:
+                data = sock.recv(4096)
+                if not data:
+                    break
+                for msg_type, _, args in reader.feed(data):
+                    if msg_type == MessageType.PONG:
+                        sent, applied_seq = args
+                        self.rtts.append(time.perf_counter() - sent)
+                        self.acked_seq = applied_seq
+        except (OSError, ProtocolError):
+            pass
+
+    # -----------------------------------------------------
+    # Sending
+    # -----------------------------------------------------
+    def _send_loop(self):
+        while True:
+            with self._cond:
+                if not (self._events or self._pending_move):
+                    if not self.running:
+                        return
+                    self._cond.wait(max(0.0, self._next_ping - time.monotonic()))
+                events, self._events = self._events, []
+                if self._pending_move is not None:
+                    events.append((MessageType.MOVE, self._pending_move))
+                    self._pending_move = None
+
+            if self.sock is None:
+                self.dropped_events += len(events)
+                if not self.running:
+                    return
+                if time.monotonic() - self._last_attempt >= self.reconnect_interval:
+                    try:
+                        self._connect()
+                    except (OSError, ProtocolError):
+                        pass
+                else:
+                    time.sleep(0.05)
+                continue
+
+            if self.running and time.monotonic() >= self._next_ping:
+                events.append((MessageType.PING, (time.perf_counter(),)))
+                self._next_ping = time.monotonic() + self.ping_interval
+            if not events:
+                continue
+
+            parts = []
+            for msg_type, args in events:
+                self.seq = (self.seq + 1) % SEQ_MODULO
+                parts.append(encode(msg_type, self.seq, *args))
+            data = b"".join(parts)
+            try:
+                # One write per batch; moves queued meanwhile coalesce
+                self.sock.sendall(data)
+            except OSError as e:
+                self.dropped_events += len(events)
+                self._disconnect(e)
+                continue
+            self.sent_messages += len(parts)
+            self.sent_bytes += len(data)
+
+    # -----------------------------------------------------
+    # Stats
+    # -----------------------------------------------------
+    def stats(self):
+        """Round-trip time (ms), agent backlog (messages) and traffic counters."""
+        rtts = sorted(self.rtts)
+        return {
+            "connected": self.sock is not None,
+            "rtt_ms": statistics.fmean(rtts) * 1000.0 if rtts else None,
+            "rtt_p95_ms": rtts[min(len(rtts) - 1, int(0.95 * len(rtts)))] * 1000.0 if rtts else None,
+            "backlog": (self.seq - self.acked_seq) % SEQ_MODULO,
+            "sent_messages": self.sent_messages,
+            "sent_bytes": self.sent_bytes,
+            "coalesced_moves": self.coalesced_moves,
+            "dropped_events": self.dropped_events,
+        }
+
+    def describe(self):
+        s = self.stats()
+        rtt = f"rtt {s['rtt_ms']:.1f} ms (p95 {s['rtt_p95_ms']:.1f})" if self.rtts else "rtt n/a"
+        return (f"{self.address}: {rtt}, backlog {s['backlog']}, "
+                f"{s['sent_messages']} messages / {s['sent_bytes']} bytes, "
+                f"{s['coalesced_moves']} moves coalesced, {s['dropped_events']} dropped")
+
+    def close(self):
+        """Send what is queued, then disconnect."""
+        with self._cond:
+            self.running = False
+            self._cond.notify()
+        self._sender.join(timeout=1.0)
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
@@ -0,0 +1,254 @@
+"""
+Binary protocol between the vision host and the input agent.
+
+Every message is a 7-byte header followed by its payload, in network
+byte order:
+
+    length  u16   payload size in bytes
+    type    u8    MessageType
+    seq     u32   sender's sequence number (consecutive, wraps at 2**32)
+
+Payloads:
+
+    HELLO   agent -> host   version u8, monitor count u8,
+                            then per monitor x i32, y i32, width i32,
+                            height i32, scale*100 u16, primary u8
+    AUTH    host -> agent   shared token (UTF-8), first message when required
+    MOVE    host -> agent   x i32, y i32 (virtual-desktop pixels)
+    CLICK   host -> agent   button u8 (see BUTTONS)
+    SCROLL  host -> agent   amount i32
+    HOTKEY  host -> agent   key names (UTF-8), NUL-separated
+    PRESS   host -> agent   key name (UTF-8)
+    WRITE   host -> agent   text (UTF-8)
+    PING    host -> agent   host clock f64
+    PONG    agent -> host   echoed host clock f64, last applied seq u32
+
+A cursor move is 15 bytes on the wire.
+"""
+
+import enum
+import os
+import socket
+import struct
+
+from core.screen_geometry import Monitor, VirtualDesktop
+
+VERSION = 1
+HEADER = struct.Struct("!HBI")
+MAX_PAYLOAD = 0xFFFF
+SEQ_MODULO = 1 << 32
+BUTTONS = ("left", "right", "middle")
+
+_MONITOR = struct.Struct("!iiiiHB")
+_HELLO = struct.Struct("!BB")
+_POINT = struct.Struct("!ii")
+_BUTTON = struct.Struct("!B")
+_AMOUNT = struct.Struct("!i")
+_PING = struct.Struct("!d")
+_PONG = struct.Struct("!dI")
+
+
+class MessageType(enum.IntEnum):
+    """Wire values are fixed; only append new types."""
+    HELLO = 1
+    AUTH = 2
+    MOVE = 3
+    CLICK = 4
+    SCROLL = 5
+    HOTKEY = 6
+    PRESS = 7
+    WRITE = 8
+    PING = 9
+    PONG = 10
+
+
+class ProtocolError(ValueError):
+    """Malformed or unknown message."""
+
+
+# ---------------------------------------------------------
+# Payloads
+# ---------------------------------------------------------
+def _pack_hello(desktop):
+    parts = [_HELLO.pack(VERSION, len(desktop.monitors))]
+    for m in desktop.monitors:
+        parts.append(_MONITOR.pack(m.x, m.y, m.width, m.height,
+                                   int(round(m.scale * 100)), int(m.primary)))
+    return b"".join(parts)
+
+
+def _unpack_hello(payload):
+    version, count = _HELLO.unpack_from(payload)
+    if version != VERSION:
+        raise ProtocolError(f"Agent speaks protocol version {version}, expected {VERSION}")
+    monitors = []
+    for i in range(count):
+        x, y, w, h, scale, primary = _MONITOR.unpack_from(payload, _HELLO.size + i * _MONITOR.size)
+        monitors.append(Monitor(x, y, w, h, scale / 100.0, bool(primary), name=f"remote{i + 1}"))
+    return (VirtualDesktop(monitors),)
+
+
+def _pack_text(text):
+    return text.encode("utf-8")
+
+
+def _unpack_text(payload):
+    return (payload.decode("utf-8"),)
+
+
+_PACKERS = {
+    MessageType.HELLO: _pack_hello,
+    MessageType.AUTH: _pack_text,
+    MessageType.MOVE: lambda x, y: _POINT.pack(int(x), int(y)),
+    MessageType.CLICK: lambda button="left": _BUTTON.pack(BUTTONS.index(button)),
+    MessageType.SCROLL: lambda amount: _AMOUNT.pack(int(amount)),
+    MessageType.HOTKEY: lambda *keys: "\0".join(keys).encode("utf-8"),
+    MessageType.PRESS: _pack_text,
+    MessageType.WRITE: _pack_text,
+    MessageType.PING: lambda sent: _PING.pack(sent),
+    MessageType.PONG: lambda sent, applied_seq: _PONG.pack(sent, applied_seq % SEQ_MODULO),
+}
+
+_UNPACKERS = {
+    MessageType.HELLO: _unpack_hello,
+    MessageType.AUTH: _unpack_text,
+    MessageType.MOVE: _POINT.unpack,
+    MessageType.CLICK: lambda p: (BUTTONS[_BUTTON.unpack(p)[0]],),
+    MessageType.SCROLL: _AMOUNT.unpack,
+    MessageType.HOTKEY: lambda p: tuple(p.decode("utf-8").split("\0")),
+    MessageType.PRESS: _unpack_text,
+    MessageType.WRITE: _unpack_text,
+    MessageType.PING: _PING.unpack,
+    MessageType.PONG: _PONG.unpack,
+}
+
+
+def encode(msg_type, seq, *args):
+    """
+    Encode one message.
+
+    Raises:
+        ProtocolError: if the payload does not fit in a message
+    """
+    payload = _PACKERS[msg_type](*args)
+    if len(payload) > MAX_PAYLOAD:
+        raise ProtocolError(f"{msg_type.name} payload too large ({len(payload)} bytes)")
+    return HEADER.pack(len(payload), msg_type, seq % SEQ_MODULO) + payload
+
+
+def split_text(text, limit=MAX_PAYLOAD):
+    """Split text into pieces whose UTF-8 encoding fits in one WRITE."""
+    pieces, current, size = [], [], 0
+    for ch in text:
+        n = len(ch.encode("utf-8"))
+        if size + n > limit:
+            pieces.append("".join(current))
+            current, size = [], 0
+        current.append(ch)
+        size += n
+    if current:
+        pieces.append("".join(current))
+    return pieces
+
+
+class MessageReader:
+    """Incremental decoder for a byte stream."""
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def feed(self, data):
+        """
+        Add received bytes.
+
+        Returns:
+            List of complete (MessageType, seq, args) messages
+        """
+        self.buffer += data
+        messages = []
+        offset = 0
+        while len(self.buffer) - offset >= HEADER.size:
+            length, raw_type, seq = HEADER.unpack_from(self.buffer, offset)
+            end = offset + HEADER.size + length
+            if len(self.buffer) < end:
+                break
+            try:
+                msg_type = MessageType(raw_type)
+            except ValueError:
+                raise ProtocolError(f"Unknown message type {raw_type}") from None
+            payload = bytes(self.buffer[offset + HEADER.size:end])
+            try:
+                args = _UNPACKERS[msg_type](payload)
+            except (struct.error, UnicodeDecodeError, IndexError) as e:
+                raise ProtocolError(f"Bad {msg_type.name} payload: {e}") from None
+            messages.append((msg_type, seq, args))
+            offset = end
+        del self.buffer[:offset]
+        return messages
+
+
+# ---------------------------------------------------------
+# Addresses
+# ---------------------------------------------------------
+DEFAULT_PORT = 7345
+
+
+def parse_address(spec):
+    """
+    'tcp://host:port', 'host:port' or 'unix:///path/to/socket'.
+
+    Returns:
+        ("tcp", (host, port)) or ("unix", path)
+    """
+    if spec.startswith("unix://"):
+        path = spec[len("unix://"):]
+        if not path:
+            raise ValueError(f"Missing socket path in '{spec}'")
+        return "unix", path
+    if spec.startswith("tcp://"):
+        spec = spec[len("tcp://"):]
+    host, _, port = spec.rpartition(":")
+    if not host:
+        host, port = port, DEFAULT_PORT
+    try:
+        return "tcp", (host.strip("[]"), int(port))
+    except ValueError:
+        raise ValueError(f"Bad agent address '{spec}' (expected tcp://host:port or unix:///path)") from None
+
+
+def connect(spec, timeout=5.0):
+    """Connected socket for an agent address (TCP_NODELAY on TCP)."""
+    family, address = parse_address(spec)
+    if family == "unix":
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    else:
+        sock = socket.socket(socket.AF_INET6 if ":" in address[0] else socket.AF_INET,
+                             socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(address)
+    except OSError:
+        sock.close()
+        raise
+    if family == "tcp":
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return sock
+
+
+def listen(spec, backlog=1):
+    """
+    Listening socket for an agent address. A stale Unix socket file is
+    replaced; TCP port 0 picks a free port (see sock.getsockname()).
+    """
+    family, address = parse_address(spec)
+    if family == "unix":
+        if os.path.exists(address):
+            os.unlink(address)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    else:
+        sock = socket.socket(socket.AF_INET6 if ":" in address[0] else socket.AF_INET,
+                             socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(address)
+    sock.listen(backlog)
+    return sock
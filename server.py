@@ -0,0 +1,532 @@
+"""
+Multi-stream server mode for hosts with several camera stations.
+
+One process serves N sources (camera indices or video files). Frames from
+all streams are scheduled fairly (core.stream_scheduler.FairScheduler)
+across a shared pool of inference workers: any free worker runs the next
+stream's frame. Each stream has its own FaceMesh and Hands graphs, so
+MediaPipe keeps tracking per camera whichever worker runs them, while
+the pool size bounds how many inferences run at once. Every stream
+keeps its own StateManager, CursorController, blink/gesture/keyboard
+state and input sink, so each station drives its own screen.
+
+Kiosk behaviour: there is no preview window or key handling. When a face
+(re)appears on a stream, the stream calibrates on it and turns cursor
+control on; after the face has been gone for the pause timeout it pauses.
+
+Usage:
+    python server.py --stream 0@local --stream 1 --stream 2 --workers 2
+    python server.py --stream 0@tcp://kiosk1:7345 --stream 1@unix:///run/touchless/kiosk2.sock
+    python server.py --stream lobby.mp4 --stream desk.mp4 --no-realtime --duration 60
+    python server.py --stream 0@local --max-faces 3
+"""
+
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+
+from core import activation
+from core.activation import ActivationGraph
+from core.blink_detector import BlinkDetector
+from core.cursor_controller import CursorController
+from core.face_detector import FaceDetector
+from core.gaze_fusion import HeadPoseSource
+from core.head_pose import HeadPoseEstimator
+from core.face_tracker import ActiveUserLock
+from core.model_profiles import DEFAULT_PROFILE, PROFILES, get_profile
+from core.pipeline import FrameContext
+from core.state import SystemState
+from core.state_manager import StateManager
+from core.stream_scheduler import FairScheduler
+from hand_gestures.gesture_actions import GestureActions
+from hand_gestures.hand_detector import HandDetector
+from hand_gestures.motion_gestures import MotionGestures
+from keyboard_control.air_keyboard import AirKeyboard
+from keyboard_control.word_completion import CompletionTrie, WordTracker
+from remote_input.backend import RemoteInputBackend
+from utils.input_backend import PyAutoGUIBackend, RecordingBackend
+from utils.resource_governor import PLANS as RESOURCE_PLANS, DEFAULT_PLAN, ResourceGovernor, get_plan
+
+
+# ---------------------------------------------------------
+# Input sinks
+# ---------------------------------------------------------
+def _local_sink(spec):
+    return PyAutoGUIBackend()
+
+
+def _record_sink(spec):
+    # Kiosk runs last for days: keep recent events and per-kind counts only
+    return RecordingBackend(max_events=1000)
+
+
+def _remote_sink(spec):
+    # The station's own machine runs remote_input.agent
+    return RemoteInputBackend(spec)
+
+
+# Sink name (the part of a stream spec after '@', up to ':') -> factory(spec)
+SINKS = {
+    "local": _local_sink,
+    "record": _record_sink,
+    "tcp": _remote_sink,
+    "unix": _remote_sink,
+}
+
+
+def make_sink(spec):
+    """Build the input backend for a sink spec such as 'local', 'record' or 'tcp://host:port'."""
+    kind = spec.split(":", 1)[0]
+    factory = SINKS.get(kind)
+    if factory is None:
+        raise ValueError(f"Unknown sink '{spec}' (choose from {', '.join(SINKS)})")
+    return factory(spec)
+
+
+# ---------------------------------------------------------
+# Sources
+# ---------------------------------------------------------
+class StreamSource:
+    """
+    A camera index or a video file.
+
+    Files are paced at their own frame rate like a live camera unless
+    realtime=False, in which case they are read as fast as the pool
+    consumes them and no frame is dropped.
+    """
+
+    def __init__(self, spec, width=640, height=480, realtime=True):
+        self.spec = spec
+        self.is_file = not spec.isdigit()
+        self.cap = cv2.VideoCapture(spec if self.is_file else int(spec))
+        if not self.cap.isOpened():
+            raise RuntimeError(f"Could not open source '{spec}'")
+        if not self.is_file:
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        self.realtime = realtime or not self.is_file
+        self.frame_interval = 1.0 / (self.cap.get(cv2.CAP_PROP_FPS) or 30.0)
+        self._next_time = None
+        self.capture_time = None     # When read() got the latest frame
+
+    def read(self):
+        """Next mirrored frame, or None at the end of a file / on camera failure."""
+        if self.is_file and self.realtime:
+            now = time.perf_counter()
+            if self._next_time is not None and now < self._next_time:
+                time.sleep(self._next_time - now)
+            self._next_time = max(now, self._next_time or now) + self.frame_interval
+        ok, frame = self.cap.read()
+        if not ok:
+            return None
+        self.capture_time = time.time()
+        return cv2.flip(frame, 1)
+
+    def release(self):
+        self.cap.release()
+
+
+# ---------------------------------------------------------
+# Per-stream state
+# ---------------------------------------------------------
+class StreamStats:
+    """Processed/dropped frames and capture-to-actuation latency of one stream."""
+
+    def __init__(self, window=300):
+        self.frames = 0
+        self.started = time.perf_counter()
+        self.latencies = deque(maxlen=window)
+        self._window_frames = 0
+        self._window_start = self.started
+
+    def record(self, latency):
+        self.frames += 1
+        self._window_frames += 1
+        self.latencies.append(latency)
+
+    def window_fps(self):
+        """FPS since the previous call (for periodic reports)."""
+        now = time.perf_counter()
+        fps = self._window_frames / max(now - self._window_start, 1e-6)
+        self._window_frames = 0
+        self._window_start = now
+        return fps
+
+    def fps(self):
+        return self.frames / max(time.perf_counter() - self.started, 1e-6)
+
+
+def latency_summary(latencies):
+    """(mean, p95) in milliseconds, or (0, 0) without samples."""
+    if not latencies:
+        return 0.0, 0.0
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+    return statistics.fmean(ordered) * 1000.0, p95 * 1000.0
+
+
+class StreamSession:
+    """
+    Everything that belongs to one camera station: its source, MediaPipe
+    graphs, state machine, cursor, click/gesture/keyboard state and input
+    sink.
+    """
+
+    def __init__(self, name, source, sink, graphs, features=(), trie=None, auto_start=True,
+                 max_faces=1):
+        """
+        Args:
+            graphs: StreamGraphs of this stream
+        """
+        self.name = name
+        self.source = source
+        self.graphs = graphs
+        self.sink = sink
+        self.features = set(features)
+        self.auto_start = auto_start
+
+        self.state_manager = StateManager(pause_timeout=0.5)
+        self.head_pose = HeadPoseEstimator()
+        # With several faces in view, only the enrolled user drives this station
+        self.user_lock = ActiveUserLock(head_pose=self.head_pose) if max_faces > 1 else None
+        self.blink_detector = BlinkDetector(input_backend=sink)
+        self.blink_enrollment = 0
+        self.cursor_controller = CursorController(
+            sensitivity_x=20, sensitivity_y=10, filter_length=8, input_backend=sink,
+            # The local desktop detects its monitors, a remote agent reports its
+            # own; other sinks report their screen
+            screen_size=(None if isinstance(sink, (PyAutoGUIBackend, RemoteInputBackend))
+                         else sink.screen_size()),
+            desktop=getattr(sink, "desktop", None)
+        )
+        self.cursor_source = HeadPoseSource()
+        self.gesture_actions = GestureActions(input_backend=sink, motion=MotionGestures(sink))
+        self.gesture_actions.enabled = "gestures" in self.features
+        word_tracker = WordTracker(trie, k=3) if trie is not None else None
+        self.air_keyboard = AirKeyboard(word_tracker=word_tracker, input_backend=sink)
+        self.air_keyboard.enabled = "keyboard" in self.features
+
+        self.activation = ActivationGraph()
+        self.stats = StreamStats()
+        self.frame_index = 0
+
+    def _wants_start(self):
+        return self.auto_start and self.state_manager.get_state() == SystemState.OFF
+
+    def next_context(self, frame, capture_time):
+        """FrameContext for a freshly captured frame, with its compute units."""
+        ctx = FrameContext(self.frame_index, capture_time)
+        self.frame_index += 1
+        ctx.frame = frame
+        ctx.h, ctx.w = frame.shape[:2]
+        features = set(self.features)
+        if self._wants_start():
+            # Head pose is needed to calibrate when a user arrives
+            features.add("calibration")
+        ctx.active = self.activation.resolve(self.state_manager.get_state(), features)
+        return ctx
+
+    def handle(self, ctx):
+        """Interpretation and actuation for one inferred frame (main.py's stages)."""
+        result = ctx.face_result
+        ctx.face_detected = result is not None and result.multi_face_landmarks is not None
+        if self.user_lock is not None:
+            faces = [face.landmark for face in result.multi_face_landmarks] if ctx.face_detected else []
+            estimate_pose = ctx.runs(activation.HEAD_POSE)
+            # A new user enrolls only once the previous one's session has paused
+            active = self.user_lock.update(faces, ctx.w, ctx.h, ctx.capture_time, estimate_pose,
+                                           auto_enroll=not self.state_manager.is_active())
+            self.state_manager.update_face_presence(active is not None)
+            if active is not None:
+                ctx.landmarks = active.landmarks
+                ctx.pose = active.pose
+        else:
+            self.state_manager.update_face_presence(ctx.face_detected)
+        if self.user_lock is None and ctx.face_detected:
+            ctx.landmarks = result.multi_face_landmarks[0].landmark
+            if ctx.runs(activation.HEAD_POSE):
+                ctx.pose = self.head_pose.estimate(ctx.landmarks, ctx.w, ctx.h)
+
+        hand_result = ctx.hand_result
+        if hand_result is not None and hand_result.multi_hand_landmarks:
+            for i, hand_landmarks in enumerate(hand_result.multi_hand_landmarks):
+                ctx.hands.append(hand_landmarks)
+                if hand_result.multi_handedness:
+                    label = hand_result.multi_handedness[i].classification[0].label
+                    if label == "Right":
+                        ctx.right_hand = hand_landmarks.landmark
+                    elif label == "Left":
+                        ctx.left_hand = hand_landmarks.landmark
+
+        if ctx.pose is not None and self._wants_start():
+            pitch, yaw, _ = ctx.pose
+            self.cursor_controller.calibrate(yaw, pitch)
+            self.cursor_source.calibrate(ctx.landmarks, ctx.w, ctx.h)
+            self.cursor_controller.enable()
+            self.state_manager.state = SystemState.ON
+            print(f"[{self.name}] User detected - calibrated, cursor ON")
+
+        if self.user_lock is not None and self.user_lock.enrollments != self.blink_enrollment:
+            self.blink_detector.reset()
+            self.blink_enrollment = self.user_lock.enrollments
+
+        if ctx.landmarks is not None and ctx.runs(activation.BLINK):
+            self.blink_detector.process(ctx.landmarks, ctx.w, ctx.h, ctx.capture_time)
+
+        if ctx.pose is not None and ctx.runs(activation.CURSOR) and self.state_manager.is_active():
+            x, y = self.cursor_source.target(
+                self.cursor_controller, ctx.pose, ctx.landmarks, ctx.w, ctx.h
+            )
+            self.cursor_controller.set_target(x, y)
+
+        if ctx.runs(activation.GESTURES):
+            for hand_landmarks in ctx.hands:
+                hand = "Left" if hand_landmarks.landmark is ctx.left_hand else "Right"
+                self.gesture_actions.perform_actions(
+                    hand_landmarks, ctx.capture_time, hand=hand, aspect=ctx.w / ctx.h
+                )
+
+        if ctx.runs(activation.KEYBOARD):
+            self.air_keyboard.process(ctx.right_hand, ctx.left_hand, None)
+
+    def close(self):
+        self.cursor_controller.cleanup()
+        if isinstance(self.sink, RemoteInputBackend):
+            self.sink.close()
+        self.source.release()
+
+
+# ---------------------------------------------------------
+# Shared inference pool
+# ---------------------------------------------------------
+class StreamGraphs:
+    """
+    One stream's FaceMesh and Hands graphs.
+
+    MediaPipe keeps tracking state inside a graph, so the graphs belong
+    to the stream, not to the worker that happens to run them. The lock
+    makes sure only one worker uses them at a time (the scheduler already
+    never hands a stream to two workers).
+    """
+
+    def __init__(self, profile, max_faces=1):
+        self.face_detector = FaceDetector(
+            refine_landmarks=profile.refine_landmarks, input_scale=profile.input_scale,
+            max_faces=max_faces
+        )
+        # Two hands, so any stream can use the air keyboard
+        self.hand_detector = HandDetector(
+            max_hands=2, model_complexity=profile.model_complexity,
+            input_scale=profile.input_scale
+        )
+        self.lock = threading.Lock()
+
+    def infer(self, ctx):
+        with self.lock:
+            if ctx.runs(activation.FACE_MESH):
+                ctx.face_result = self.face_detector.process(ctx.frame)
+            if ctx.runs(activation.HANDS):
+                ctx.hand_result = self.hand_detector.detect_hands(ctx.frame)
+
+
+class InferenceWorker:
+    """One slot of the shared pool; runs whichever stream it is handed."""
+
+    def __init__(self, name):
+        self.name = name
+        self.frames = 0
+        self.busy_time = 0.0
+
+    def process(self, session, ctx):
+        start = time.perf_counter()
+        session.graphs.infer(ctx)
+        session.handle(ctx)
+        self.frames += 1
+        self.busy_time += time.perf_counter() - start
+
+
+class StreamServer:
+    """Runs the capture loops, the worker pool and the periodic report."""
+
+    def __init__(self, sessions, workers, report_interval=5.0):
+        self.sessions = {session.name: session for session in sessions}
+        self.workers = workers
+        self.report_interval = report_interval
+        self.scheduler = FairScheduler()
+        for name in self.sessions:
+            self.scheduler.add_stream(name)
+        self.started = None
+        self._stop = None
+
+    async def _capture(self, session, loop, executor):
+        while not self._stop.is_set():
+            frame = await loop.run_in_executor(executor, session.source.read)
+            if frame is None:
+                print(f"[{session.name}] Source ended")
+                return
+            ctx = session.next_context(frame, session.source.capture_time)
+            await self.scheduler.put(session.name, ctx, wait=not session.source.realtime)
+
+    async def _work(self, worker, loop, executor):
+        while True:
+            job = await self.scheduler.get(worker.name)
+            if job is None:
+                return
+            name, ctx = job
+            session = self.sessions[name]
+            try:
+                await loop.run_in_executor(executor, worker.process, session, ctx)
+                session.stats.record(time.time() - ctx.capture_time)
+            finally:
+                await self.scheduler.done(worker.name, name)
+
+    async def _report(self):
+        while True:
+            await asyncio.sleep(self.report_interval)
+            print(self.report(window=True))
+
+    def report(self, window=False):
+        """Aggregate and per-stream fps, drops and latency."""
+        elapsed = max(time.perf_counter() - self.started, 1e-6)
+        total = sum(s.stats.frames for s in self.sessions.values())
+        all_latencies = [l for s in self.sessions.values() for l in s.stats.latencies]
+        mean, p95 = latency_summary(all_latencies)
+        lines = [f"[Server] {total / elapsed:.1f} fps total, latency {mean:.0f} ms "
+                 f"(p95 {p95:.0f} ms), {len(self.workers)} workers"]
+        for name, session in self.sessions.items():
+            stats = session.stats
+            fps = stats.window_fps() if window else stats.fps()
+            mean, p95 = latency_summary(stats.latencies)
+            lines.append(
+                f"  {name:12s} {fps:6.1f} fps  latency {mean:5.0f} ms (p95 {p95:4.0f})  "
+                f"dropped {self.scheduler.dropped[name]:5d}  "
+                f"{session.state_manager.get_state().name}"
+            )
+        for worker in self.workers:
+            lines.append(f"  worker {worker.name}: {worker.frames} frames, "
+                         f"{worker.busy_time / elapsed:.0%} busy")
+        return "\n".join(lines)
+
+    async def run(self, duration=None):
+        loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        self.started = time.perf_counter()
+        executor = ThreadPoolExecutor(
+            max_workers=len(self.workers) + len(self.sessions), thread_name_prefix="server"
+        )
+        captures = [asyncio.create_task(self._capture(s, loop, executor))
+                    for s in self.sessions.values()]
+        work = [asyncio.create_task(self._work(w, loop, executor)) for w in self.workers]
+        reporter = asyncio.create_task(self._report())
+        try:
+            if duration is not None:
+                await asyncio.wait(captures, timeout=duration)
+                self._stop.set()
+            await asyncio.gather(*captures)
+            await self.scheduler.close()
+            await asyncio.gather(*work)
+        finally:
+            self._stop.set()
+            for task in captures + work + [reporter]:
+                task.cancel()
+            await asyncio.gather(*captures, *work, reporter, return_exceptions=True)
+            executor.shutdown(wait=True)
+
+
+# ---------------------------------------------------------
+# CLI
+# ---------------------------------------------------------
+def parse_stream(spec):
+    """'SOURCE[@SINK]' -> (source, sink); the sink defaults to 'record'."""
+    source, _, sink = spec.partition("@")
+    return source, sink or "record"
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Multi-stream touchless control server")
+    parser.add_argument("--stream", action="append", required=True, metavar="SOURCE[@SINK]",
+                        help="Camera index or video file, optionally with an input sink "
+                             "(local, record, or an input agent at tcp://host:port or "
+                             "unix:///path; default: record). Repeat per station.")
+    parser.add_argument("--workers", type=int, default=2,
+                        help="Inference workers shared by all streams (each stream has "
+                             "its own FaceMesh + Hands graphs)")
+    parser.add_argument("--model-profile", default=DEFAULT_PROFILE, choices=list(PROFILES))
+    parser.add_argument("--resource-plan", default=DEFAULT_PLAN, choices=list(RESOURCE_PLANS),
+                        help="OpenCV threads and core pinning (the pool size is --workers)")
+    parser.add_argument("--keyboard", action="store_true", help="Enable the air keyboard on every stream")
+    parser.add_argument("--gestures", action="store_true", help="Enable hand gestures on every stream")
+    parser.add_argument("--word-list", default="keyboard_control/words.txt")
+    parser.add_argument("--no-realtime", action="store_true",
+                        help="Read video files as fast as possible instead of at their frame rate")
+    parser.add_argument("--duration", type=float, default=None, help="Stop after this many seconds")
+    parser.add_argument("--report-interval", type=float, default=5.0)
+    parser.add_argument("--max-faces", type=int, default=1,
+                        help="Faces tracked per stream; with more than one, each station "
+                             "locks onto one enrolled user (default: 1)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    profile = get_profile(args.model_profile)
+    governor = ResourceGovernor(get_plan(args.resource_plan)).apply()
+    print(f"✓ Resource plan '{governor.plan.name}': {governor.describe()}")
+
+    features = []
+    if args.keyboard:
+        features.append("keyboard")
+    if args.gestures:
+        features.append("gestures")
+    trie = None
+    if args.keyboard:
+        try:
+            trie = CompletionTrie.load(args.word_list)
+        except OSError as e:
+            print(f"✗ Word completion disabled: {e}")
+
+    sessions = []
+    try:
+        for i, spec in enumerate(args.stream):
+            source_spec, sink_spec = parse_stream(spec)
+            source = StreamSource(source_spec, profile.capture_width, profile.capture_height,
+                                  realtime=not args.no_realtime)
+            sessions.append(StreamSession(f"stream{i}", source, make_sink(sink_spec),
+                                          StreamGraphs(profile, max_faces=args.max_faces),
+                                          features=features, trie=trie,
+                                          max_faces=args.max_faces))
+            print(f"✓ stream{i}: {source_spec} -> {sink_spec}")
+    except (RuntimeError, ValueError, OSError) as e:
+        print(f"✗ {e}")
+        for session in sessions:
+            session.close()
+        return 1
+
+    # A stream runs on one worker at a time, so more workers than streams would idle
+    workers = [InferenceWorker(str(i)) for i in range(min(args.workers, len(sessions)))]
+    print(f"✓ {len(workers)} inference workers ('{profile.name}' profile) "
+          f"for {len(sessions)} streams")
+
+    server = StreamServer(sessions, workers, report_interval=args.report_interval)
+    governor.start()
+    try:
+        asyncio.run(server.run(duration=args.duration))
+    except KeyboardInterrupt:
+        print("\nInterrupted by user")
+    finally:
+        governor.stop()
+        print(server.report())
+        print(governor.monitor.report())
+        for session in sessions:
+            session.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,53 @@
+import pytest
+
+from core import activation
+from core.activation import ActivationGraph
+from core.state import SystemState
+
+
+def test_off_runs_only_face_mesh():
+    units = ActivationGraph().resolve(SystemState.OFF)
+    assert units == {activation.FACE_MESH}
+
+
+def test_features_add_their_units_to_the_state():
+    graph = ActivationGraph()
+    units = graph.resolve(SystemState.ON, ["gestures", "keyboard"])
+    assert {activation.HEAD_POSE, activation.CURSOR, activation.BLINK} <= units
+    assert {activation.HANDS, activation.TWO_HANDS, activation.GESTURES,
+            activation.KEYBOARD} <= units
+
+    frozen = graph.resolve(SystemState.FROZEN, ["gestures"])
+    assert activation.CURSOR not in frozen
+    assert activation.TWO_HANDS not in frozen
+
+
+def test_calibration_enables_head_pose_in_any_state():
+    units = ActivationGraph().resolve(SystemState.PAUSED, ["calibration"])
+    assert activation.HEAD_POSE in units
+
+
+def test_low_power_replaces_everything():
+    units = ActivationGraph().resolve(SystemState.ON, ["gestures"], low_power=True)
+    assert units == {activation.PRESENCE}
+
+
+def test_feature_order_does_not_matter_and_results_are_cached():
+    graph = ActivationGraph()
+    a = graph.resolve(SystemState.ON, ["keyboard", "gestures"])
+    b = graph.resolve(SystemState.ON, ("gestures", "keyboard"))
+    assert a is b
+
+
+def test_unknown_feature_is_rejected():
+    with pytest.raises(ValueError, match="Unknown feature"):
+        ActivationGraph().resolve(SystemState.ON, ["teleport"])
+
+
+def test_custom_maps_override_defaults():
+    graph = ActivationGraph(
+        state_units={SystemState.ON: {activation.CURSOR}},
+        feature_units={"gestures": {activation.GESTURES}},
+    )
+    assert graph.resolve(SystemState.ON, ["gestures"]) == {activation.CURSOR, activation.GESTURES}
+    assert graph.resolve(SystemState.OFF) == frozenset()
@@ -0,0 +1,40 @@
+import os
+
+import numpy as np
+
+from batch_process import Manifest, chunk_key, load_results, write_columns
+
+
+def chunk(start, video="/videos/a.mp4"):
+    return dict(video=video, video_id="a-0123456789", start=start, end=start + 10, fps=30.0)
+
+
+def test_failed_chunk_is_recorded_and_cleared_on_success(tmp_path):
+    manifest = Manifest(str(tmp_path))
+    manifest.mark_failed(chunk(0), "ValueError: bad frame")
+
+    reloaded = Manifest(str(tmp_path))
+    assert reloaded.failed[chunk_key(chunk(0))]["error"] == "ValueError: bad frame"
+    assert not reloaded.is_done(chunk(0), str(tmp_path))
+
+    (tmp_path / "part.npz").write_bytes(b"")
+    reloaded.mark_done(chunk(0), "part.npz", 10, 1.0)
+    reloaded = Manifest(str(tmp_path))
+    assert reloaded.failed == {}
+    assert reloaded.is_done(chunk(0), str(tmp_path))
+
+
+def test_chunks_load_back_in_frame_order(tmp_path):
+    manifest = Manifest(str(tmp_path))
+    for start in (10, 0):
+        frames = np.arange(start, start + 10)
+        path = write_columns(str(tmp_path / f"chunk_{start:08d}"), {
+            "frame": frames,
+            "yaw": frames.astype(np.float32),
+            "right_hand": np.zeros((10, 21, 3), np.float32),
+        }, "npz")
+        manifest.mark_done(chunk(start), os.path.basename(path), 10, 0.1)
+
+    data = load_results(str(tmp_path))
+    assert data["frame"].tolist() == list(range(20))
+    assert data["right_hand"].shape == (20, 21, 3)
@@ -0,0 +1,74 @@
+from types import SimpleNamespace
+
+from core.blink_detector import BlinkDetector
+from utils.input_backend import RecordingBackend
+
+FPS = 30
+
+
+def _face(left_ear, right_ear):
+    """Landmarks with both eyes 0.1 wide and open to the given EAR."""
+    points = [SimpleNamespace(x=0.5, y=0.5) for _ in range(468)]
+    for eye, cx, ear in ((BlinkDetector.LEFT_EYE, 0.4, left_ear),
+                         (BlinkDetector.RIGHT_EYE, 0.6, right_ear)):
+        half = ear * 0.1 / 2
+        corner, up1, up2, corner2, low1, low2 = eye
+        points[corner] = SimpleNamespace(x=cx - 0.05, y=0.4)
+        points[corner2] = SimpleNamespace(x=cx + 0.05, y=0.4)
+        for up, low in ((up1, low2), (up2, low1)):
+            points[up] = SimpleNamespace(x=cx, y=0.4 - half)
+            points[low] = SimpleNamespace(x=cx, y=0.4 + half)
+    return points
+
+
+def _play(detector, frames, start=0.0):
+    events = []
+    for i, (left, right) in enumerate(frames):
+        event = detector.process(_face(left, right), 1, 1, start + i / FPS)
+        if event:
+            events.append(event)
+    return events
+
+
+def _detector(**kwargs):
+    backend = RecordingBackend()
+    return BlinkDetector(input_backend=backend, **kwargs), backend
+
+
+def test_eye_aspect_ratios_of_both_eyes():
+    detector, _ = _detector()
+    ear = detector.eye_aspect_ratios(_face(0.3, 0.1), 640, 480)
+    assert ear[0] > ear[1] > 0
+
+
+def test_held_wink_clicks_once_with_that_eye():
+    detector, backend = _detector(adaptive=False)
+    events = _play(detector, [(0.3, 0.3)] * 5 + [(0.05, 0.3)] * 20 + [(0.3, 0.3)] * 5
+                   + [(0.3, 0.05)] * 20)
+    assert events == ["left_click", "right_click"]
+    assert [args for _, kind, args in backend.events if kind == "click"] == [("left",), ("right",)]
+
+
+def test_blink_and_short_wink_do_not_click():
+    detector, backend = _detector(adaptive=False)
+    events = _play(detector, [(0.3, 0.3)] * 5 + [(0.05, 0.05)] * 20
+                   + [(0.05, 0.3)] * 3 + [(0.3, 0.3)] * 5)
+    assert events == []
+    assert "click" not in backend.counts
+
+
+def test_wink_across_tracking_gap_is_not_timed():
+    detector, _ = _detector(adaptive=False)
+    _play(detector, [(0.05, 0.3)] * 5)
+    assert _play(detector, [(0.05, 0.3)] * 5, start=1.0) == []
+
+
+def test_learned_threshold_fits_narrow_eyes():
+    narrow = [(0.18, 0.17)] * 90 + [(0.05, 0.17)] * 20
+
+    fixed, _ = _detector(adaptive=False)
+    assert _play(fixed, narrow) == []          # Always "closed" below 0.2
+
+    adaptive, _ = _detector()
+    assert _play(adaptive, narrow) == ["left_click"]
+    assert (adaptive.thresholds < 0.17).all()
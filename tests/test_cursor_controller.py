@@ -0,0 +1,50 @@
+from core.cursor_controller import CursorController
+from core.screen_geometry import VirtualDesktop
+from utils.input_backend import RecordingBackend
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_controller(**kwargs):
+    desktop = VirtualDesktop.parse("1920x1080+0+0,1920x1080+1920+0")
+    controller = CursorController(input_backend=RecordingBackend(), desktop=desktop,
+                                  start_thread=False, **kwargs)
+    controller.enable()
+    return controller
+
+
+def test_absolute_mode_spans_one_monitor():
+    c = make_controller(sensitivity_x=20, sensitivity_y=10)
+    assert c.map_angles(180, 180) == (960, 540)
+    # Full yaw range reaches the edge of the primary monitor, not the desktop
+    assert c.map_angles(180, 200) == (1909, 540)
+    assert c.map_angles(180, 170)[0] == 480
+
+
+def test_velocity_mode_crosses_monitors_and_absolute_follows():
+    clock = Clock()
+    c = make_controller(mode="velocity", clock=clock)
+    c.set_target(*c.head_target(180, 180))
+    for _ in range(60):
+        clock.now += 0.05
+        c.set_target(*c.head_target(180, 195))   # Turned right
+    x, _ = c.get_position()
+    assert x > 1920
+
+    c.set_mode("absolute")
+    assert c.monitor.name == "display2"
+    assert c.map_angles(180, 180) == (1920 + 960, 540)
+
+
+def test_warp_only_in_velocity_mode():
+    c = make_controller()
+    assert not c.warp(100, 100)
+    c.set_mode("velocity")
+    assert c.warp(3000, 100)
+    assert c.velocity.position == [3000.0, 100.0]
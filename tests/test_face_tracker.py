@@ -0,0 +1,89 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from core.face_tracker import ActiveUserLock
+from core.head_pose import HeadPoseEstimator
+
+W, H = 640, 480
+
+
+def _face(cx, cy, size, turn=0.0, depth=0.5):
+    """Face landmarks with only the head-pose key points placed."""
+    points = [SimpleNamespace(x=cx, y=cy, z=0.0) for _ in range(468)]
+    points[234] = SimpleNamespace(x=cx - size, y=cy, z=turn * size)
+    points[454] = SimpleNamespace(x=cx + size, y=cy, z=-turn * size)
+    points[10] = SimpleNamespace(x=cx, y=cy - size, z=0.0)
+    points[152] = SimpleNamespace(x=cx, y=cy + size, z=0.0)
+    points[1] = SimpleNamespace(x=cx, y=cy, z=-depth * size)
+    return points
+
+
+def test_estimate_batch_matches_estimate():
+    rng = np.random.default_rng(1)
+    faces = [_face(*rng.uniform(0.3, 0.7, 2), rng.uniform(0.05, 0.15),
+                   turn=rng.uniform(-1, 1)) for _ in range(8)]
+    for face in faces:
+        for i in HeadPoseEstimator.KEY_POINTS:
+            face[i].z += rng.normal(0, 0.01)
+            face[i].y += rng.normal(0, 0.01)
+
+    estimator = HeadPoseEstimator()
+    pitch, yaw, forward = estimator.estimate_batch(HeadPoseEstimator.key_points(faces), W, H)
+    for i, face in enumerate(faces):
+        p, y, f = estimator.estimate(face, W, H)
+        assert pitch[i] == pytest.approx(p, abs=1e-9)
+        assert yaw[i] == pytest.approx(y, abs=1e-9)
+        assert np.allclose(forward[i], f)
+
+
+def _run(lock, frames, start=0.0, **kwargs):
+    active = None
+    for i, faces in enumerate(frames):
+        active = lock.update(faces, W, H, start + i / 30, **kwargs)
+    return active
+
+
+def test_enrolls_largest_steady_face_facing_the_screen():
+    lock = ActiveUserLock(enroll_frames=3)
+    frames = [[_face(0.3, 0.5, 0.05), _face(0.7, 0.5, 0.12, turn=1.0),
+               _face(0.5, 0.5, 0.08)]] * 3
+    active = _run(lock, frames)
+    assert active is not None
+    assert active.center[0] == pytest.approx(0.5)
+    assert lock.enrollments == 1
+
+
+def test_bystander_does_not_take_over_when_auto_enroll_is_off():
+    lock = ActiveUserLock(enroll_frames=3, release_after=1.0)
+    _run(lock, [[_face(0.3, 0.5, 0.1)]] * 3)
+    user = lock.user_id
+
+    bystander = [[_face(0.75, 0.5, 0.1)]] * 60
+    assert _run(lock, bystander, start=1.0, auto_enroll=False) is None
+    assert lock.user_id is None
+    assert lock.enrollments == 1
+
+    active = _run(lock, bystander[:3], start=3.0, auto_enroll=True)
+    assert active is not None and active.id != user
+    assert lock.enrollments == 2
+
+
+def test_explicit_enroll_switches_user_even_without_auto_enroll():
+    lock = ActiveUserLock(enroll_frames=3)
+    _run(lock, [[_face(0.3, 0.5, 0.1)]] * 3)
+    lock.enroll()
+    active = _run(lock, [[_face(0.75, 0.5, 0.12)]], start=1.0, auto_enroll=False)
+    assert active is not None
+    assert active.center[0] == pytest.approx(0.75)
+    assert lock.enrollments == 2
+
+
+def test_user_reappearing_in_place_is_reacquired():
+    lock = ActiveUserLock(enroll_frames=3, release_after=2.0)
+    _run(lock, [[_face(0.3, 0.5, 0.1)]] * 3)
+    _run(lock, [[]] * 15, start=1.0)
+    active = _run(lock, [[_face(0.31, 0.5, 0.1)]], start=1.6, auto_enroll=False)
+    assert active is not None
+    assert lock.enrollments == 1
@@ -0,0 +1,46 @@
+from types import SimpleNamespace
+
+from hand_gestures.gesture_actions import GestureActions
+from hand_gestures.motion_gestures import MotionGestures
+from utils.input_backend import RecordingBackend
+
+
+def _hand(scroll_pose=True):
+    points = dict.fromkeys(range(21), (0.5, 0.8))
+    points[4] = (0.3, 0.6)                    # thumb tip, far from the index tip
+    points[6], points[8] = (0.5, 0.5), (0.5, 0.3)     # index extended
+    points[10], points[12] = (0.55, 0.5), (0.55, 0.3) # middle extended
+    ring_tip = 0.6 if scroll_pose else 0.3         # ring folded or extended
+    points[14], points[16] = (0.6, 0.5), (0.6, ring_tip)
+    points[18], points[20] = (0.65, 0.5), (0.65, 0.6)
+    return SimpleNamespace(landmark=[SimpleNamespace(x=x, y=y, z=0.0)
+                                     for x, y in (points[i] for i in range(21))])
+
+
+def _actions(with_motion):
+    backend = RecordingBackend()
+    motion = MotionGestures(input_backend=backend) if with_motion else None
+    actions = GestureActions(input_backend=backend, motion=motion)
+    actions.action_delay = 0.0
+    return actions, backend
+
+
+def test_scroll_pose_does_not_zoom_or_change_volume():
+    actions, backend = _actions(with_motion=True)
+    for i in range(5):
+        actions.perform_actions(_hand(scroll_pose=True), timestamp=i / 30)
+    assert "hotkey" not in backend.counts
+    assert "press" not in backend.counts
+
+
+def test_pose_actions_run_outside_motion_gestures():
+    actions, backend = _actions(with_motion=True)
+    actions.perform_actions(_hand(scroll_pose=False), timestamp=0.0)
+    assert backend.counts.get("hotkey") == 1
+    assert backend.counts.get("press") == 1
+
+
+def test_pose_actions_without_motion_gestures():
+    actions, backend = _actions(with_motion=False)
+    actions.perform_actions(_hand(scroll_pose=True))
+    assert backend.counts.get("hotkey") == 1
@@ -0,0 +1,61 @@
+from hand_gestures.hand_tracker import TrackedHand, TwoHandTracker
+from utils.landmarks import Point
+
+
+def hand_at(x, y, label=None):
+    return TrackedHand(label, [Point(x + 0.01 * (i % 3), y + 0.01 * (i // 3)) for i in range(21)])
+
+
+def make_tracker():
+    # The MediaPipe graph is never called: update() takes detections directly
+    tracker = TwoHandTracker.__new__(TwoHandTracker)
+    tracker.tracks = {slot: None for slot in TwoHandTracker.SLOTS}
+    tracker.max_misses = 3
+    tracker.max_jump = 0.2
+    tracker.acquisitions = 0
+    tracker.frames = 0
+    return tracker
+
+
+def test_two_new_hands_are_assigned_by_position():
+    tracker = make_tracker()
+    tracker.update([hand_at(0.2, 0.5, "Right"), hand_at(0.7, 0.5, "Right")])
+    assert tracker.right.center[0] > 0.6
+    assert tracker.left.center[0] < 0.3
+
+
+def test_identity_follows_position_not_label():
+    tracker = make_tracker()
+    tracker.update([hand_at(0.2, 0.5), hand_at(0.7, 0.5)])
+    # Hands move and MediaPipe swaps the handedness labels
+    tracker.update([hand_at(0.65, 0.5, "Left"), hand_at(0.25, 0.5, "Right")])
+    assert abs(tracker.right.center[0] - 0.66) < 0.02
+    assert abs(tracker.left.center[0] - 0.26) < 0.02
+    assert tracker.acquisitions == 2
+
+
+def test_lone_hand_uses_label_then_drops_after_misses():
+    tracker = make_tracker()
+    tracker.update([hand_at(0.5, 0.5, "Left")])
+    assert tracker.left is not None and tracker.right is None
+
+    for _ in range(tracker.max_misses):
+        tracker.update([])
+    assert tracker.left is not None
+    tracker.update([])
+    assert tracker.left is None
+
+
+def test_duplicate_detection_does_not_create_second_hand():
+    tracker = make_tracker()
+    tracker.update([hand_at(0.5, 0.5, "Right")])
+    tracker.update([hand_at(0.5, 0.5), hand_at(0.52, 0.5)])
+    assert tracker.left is None
+
+
+def test_snapshots_are_not_updated_by_later_frames():
+    tracker = make_tracker()
+    tracker.update([hand_at(0.5, 0.5, "Right")])
+    snapshot = tracker.hands()[0]
+    tracker.update([hand_at(0.6, 0.5)])
+    assert snapshot.center != tracker.right.center
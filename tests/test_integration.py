@@ -47,9 +47,39 @@ def test_modules():
         'core.face_detector',
         'core.head_pose',
         'core.cursor_controller',
+        'core.gaze_fusion',
+        'core.screen_geometry',
         'core.state',
         'core.state_manager',
+        'core.quality_controller',
+        'core.pipeline',
+        'core.stream_scheduler',
+        'core.motion_gate',
+        'core.presence_detector',
+        'core.activation',
+        'core.model_profiles',
+        'core.face_tracker',
+        'keyboard_control.word_completion',
+        'benchmarks.typing_simulator',
+        'benchmarks.pointing_benchmark',
+        'benchmarks.synthetic_landmarks',
+        'benchmarks.remote_input_benchmark',
+        'remote_input.protocol',
+        'remote_input.backend',
+        'remote_input.agent',
+        'hand_gestures.hand_tracker',
+        'hand_gestures.motion_gestures',
         'utils.fps',
+        'utils.profiler',
+        'utils.tuning',
+        'utils.input_backend',
+        'utils.landmarks',
+        'utils.landmark_history',
+        'utils.streaming_quantile',
+        'utils.host_cache',
+        'utils.resource_governor',
+        'batch_process',
+        'server',
     ]
     
     failed = []
@@ -162,6 +192,8 @@ def test_file_structure():
     
     expected_files = [
         'main.py',
+        'batch_process.py',
+        'server.py',
         'requirements.txt',
         'README.md',
         'core/__init__.py',
@@ -169,10 +201,42 @@ def test_file_structure():
         'core/face_detector.py',
         'core/head_pose.py',
         'core/cursor_controller.py',
+        'core/gaze_fusion.py',
+        'core/screen_geometry.py',
         'core/state.py',
         'core/state_manager.py',
+        'core/quality_controller.py',
+        'core/pipeline.py',
+        'core/stream_scheduler.py',
+        'core/motion_gate.py',
+        'core/presence_detector.py',
+        'core/activation.py',
+        'core/model_profiles.py',
         'utils/__init__.py',
+        'keyboard_control/word_completion.py',
+        'keyboard_control/words.txt',
+        'core/face_tracker.py',
         'utils/fps.py',
+        'utils/profiler.py',
+        'utils/tuning.py',
+        'utils/input_backend.py',
+        'utils/host_cache.py',
+        'utils/resource_governor.py',
+        'benchmarks/typing_simulator.py',
+        'benchmarks/pointing_benchmark.py',
+        'benchmarks/synthetic_landmarks.py',
+        'benchmarks/remote_input_benchmark.py',
+        'remote_input/__init__.py',
+        'remote_input/protocol.py',
+        'remote_input/backend.py',
+        'remote_input/agent.py',
+        'benchmarks/hand_tracking_benchmark.py',
+        'hand_gestures/hand_tracker.py',
+        'hand_gestures/motion_gestures.py',
+        'utils/landmarks.py',
+        'utils/landmark_history.py',
+        'utils/streaming_quantile.py',
+        'tuning.json',
     ]
     
     missing = []
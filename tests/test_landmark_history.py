@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from utils.landmark_history import LandmarkHistory
+
+
+def _fill(history, times, position):
+    for t in times:
+        history.append(np.full((history.points, history.dims), position(t)), t)
+
+
+def test_window_stays_contiguous_after_wrapping():
+    history = LandmarkHistory(2, seconds=1.0, rate=5)
+    _fill(history, np.arange(12) * 0.2, lambda t: t)
+    times, data = history.window()
+    assert len(history) == history.capacity == 5
+    assert np.allclose(times, np.arange(7, 12) * 0.2)
+    assert np.allclose(data[:, 0, 0], times)
+    assert history.latest_time() == pytest.approx(2.2)
+
+
+def test_window_selects_recent_seconds():
+    history = LandmarkHistory(1, rate=10)
+    _fill(history, np.arange(10) * 0.1, lambda t: t)
+    times, _ = history.window(0.25)
+    assert np.allclose(times, [0.7, 0.8, 0.9])
+    assert history.span(0.25) == pytest.approx(0.2)
+    assert history.displacement(0.25)[0, 0] == pytest.approx(0.2)
+
+
+def test_fits_match_polyfit_on_uneven_timestamps():
+    rng = np.random.default_rng(0)
+    times = 1.7e9 + np.cumsum(rng.uniform(0.01, 0.05, 20))
+    history = LandmarkHistory(3, rate=60)
+    _fill(history, times, lambda t: 0.5 * 4.0 * (t - times[0]) ** 2 + 2.0 * (t - times[0]))
+
+    velocity = history.velocity(seconds=None)
+    acceleration = history.acceleration(seconds=None)
+    t = times - times.mean()
+    y = history.window()[1][:, 0, 0]
+    assert velocity[0, 0] == pytest.approx(np.polyfit(t, y, 1)[0], rel=1e-3)
+    assert acceleration[0, 0] == pytest.approx(4.0, rel=1e-3)
+    assert np.allclose(acceleration, acceleration[0, 0], rtol=1e-5)
+
+
+def test_fits_need_enough_distinct_samples():
+    history = LandmarkHistory(1)
+    history.append(np.ones((1, 3)), 1.0)
+    assert not history.velocity().any()
+    history.append(np.full((1, 3), 2.0), 1.0)
+    history.append(np.full((1, 3), 3.0), 1.0)
+    assert not history.velocity().any()
+    assert not history.acceleration().any()
+
+
+def test_clear_forgets_samples():
+    history = LandmarkHistory(1)
+    history.append(np.ones((1, 3)), 1.0)
+    history.clear()
+    assert len(history) == 0
+    assert history.latest() is None
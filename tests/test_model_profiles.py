@@ -0,0 +1,68 @@
+import cv2
+import numpy as np
+import pytest
+
+import core.model_profiles as model_profiles
+from core.model_profiles import (
+    DEFAULT_PROFILE, PROFILES, capture_frames, ladder_for, select_profile,
+)
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("TOUCHLESS_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def fake_benchmark(p90_ms, face_frames=50, hand_frames=50):
+    def benchmark(profile, frames, warmup=10):
+        return {"mean_ms": p90_ms[profile.name], "p90_ms": p90_ms[profile.name],
+                "face_frames": face_frames, "hand_frames": hand_frames}
+    return benchmark
+
+
+def test_most_accurate_affordable_profile_is_chosen_and_cached(cache_dir, monkeypatch):
+    monkeypatch.setattr(model_profiles, "benchmark_profile",
+                        fake_benchmark({"accurate": 40.0, "balanced": 20.0, "fast": 10.0}))
+    frames = [np.zeros((48, 64, 3), np.uint8)]
+
+    profile, timings, cached = select_profile(target_fps=20, frames=frames, log=lambda *a: None)
+    assert profile.name == "balanced" and not cached
+    assert set(timings) == {"accurate", "balanced"}
+
+    profile, _, cached = select_profile(target_fps=20, frames=frames, log=lambda *a: None)
+    assert profile.name == "balanced" and cached
+
+
+def test_frames_without_a_face_fall_back_to_default_uncached(cache_dir, monkeypatch):
+    monkeypatch.setattr(model_profiles, "benchmark_profile",
+                        fake_benchmark({name: 1.0 for name in PROFILES}, face_frames=0))
+    messages = []
+    profile, _, cached = select_profile(frames=[np.zeros((48, 64, 3), np.uint8)],
+                                        log=messages.append)
+    assert profile.name == DEFAULT_PROFILE and not cached
+    assert any("no face found" in m for m in messages)
+    assert not list(cache_dir.iterdir())
+
+
+def test_capture_frames_reads_a_recorded_clip(tmp_path):
+    path = str(tmp_path / "clip.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 10, (64, 48))
+    if not writer.isOpened():
+        pytest.skip("no video writer available")
+    for i in range(5):
+        writer.write(np.full((48, 64, 3), i * 40, np.uint8))
+    writer.release()
+
+    frames = capture_frames(path, count=10, log=lambda *a: None)
+    assert len(frames) == 5
+    assert frames[0].shape == (48, 64, 3)
+
+    with pytest.raises(RuntimeError):
+        capture_frames(str(tmp_path / "missing.avi"), log=lambda *a: None)
+
+
+def test_ladder_never_exceeds_the_profile():
+    ladder = ladder_for(PROFILES["fast"])
+    assert ladder[0].name == "fast"
+    assert all(not level.refine_landmarks and level.model_complexity == 0 for level in ladder)
@@ -0,0 +1,85 @@
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+
+from core.blink_detector import BlinkDetector
+from core.motion_gate import EYE_CORNERS, MotionGate, eye_corners
+
+W, H = 640, 480
+FPS = 30
+EYES = ((0.42, 0.45), (0.58, 0.45))   # Normalized eye centres (left, right)
+EYE_WIDTH = 0.06
+FACE_BOX = (0.3, 0.25, 0.7, 0.8)
+
+
+def _frame(left_open, right_open):
+    """Still face with dark, high-contrast eyes; a closed eye is skin."""
+    frame = np.full((H, W, 3), 60, dtype=np.uint8)
+    cv2.ellipse(frame, (W // 2, int(0.52 * H)), (120, 150), 0, 0, 360, (150, 170, 200), -1)
+    for (cx, cy), is_open in zip(EYES, (left_open, right_open)):
+        if is_open:
+            center = (int(cx * W), int(cy * H))
+            cv2.ellipse(frame, center, (int(EYE_WIDTH * W / 2), 9), 0, 0, 360, (240, 240, 240), -1)
+            cv2.circle(frame, center, 8, (20, 20, 20), -1)
+    return frame
+
+
+def _landmarks(left_open, right_open):
+    """FaceMesh-like landmarks: eye corners plus the blink detector's eye points."""
+    points = [SimpleNamespace(x=0.5, y=0.5, z=0.0) for _ in range(468)]
+    for (cx, cy), eye, corners, is_open in zip(
+            EYES, (BlinkDetector.LEFT_EYE, BlinkDetector.RIGHT_EYE), EYE_CORNERS,
+            (left_open, right_open)):
+        half = (0.3 if is_open else 0.05) * EYE_WIDTH / 2
+        corner, up1, up2, corner2, low1, low2 = eye
+        for index, x in ((corner, cx - EYE_WIDTH / 2), (corner2, cx + EYE_WIDTH / 2)):
+            points[index] = SimpleNamespace(x=x, y=cy, z=0.0)
+        for index, x in zip(corners, (cx - EYE_WIDTH / 2, cx + EYE_WIDTH / 2)):
+            points[index] = SimpleNamespace(x=x, y=cy, z=0.0)
+        for up, low in ((up1, low2), (up2, low1)):
+            points[up] = SimpleNamespace(x=cx, y=cy - half, z=0.0)
+            points[low] = SimpleNamespace(x=cx, y=cy + half, z=0.0)
+    return points
+
+
+def test_eye_closing_is_motion_even_when_the_face_box_barely_changes():
+    gate = MotionGate()
+    eyes = eye_corners(_landmarks(True, True))
+    assert gate.should_infer(_frame(True, True), [FACE_BOX], eyes=eyes)
+    assert not gate.should_infer(_frame(True, True), [FACE_BOX], eyes=eyes)
+
+    assert not gate.should_infer(_frame(False, True), [FACE_BOX])   # thumbnail alone
+    assert gate.last_score < gate.threshold
+    assert gate.should_infer(_frame(False, True), [FACE_BOX], eyes=eyes)
+    assert gate.last_eye_score >= gate.eye_threshold
+
+
+def _run_wink(use_gate):
+    """Main-loop order: gate (forced while an eye is closed), then blink detector."""
+    gate = MotionGate()
+    detector = BlinkDetector(input_backend=SimpleNamespace(click=lambda button: None),
+                             adaptive=False)
+    states = [(True, True)] * 20 + [(False, True)] * 12 + [(True, True)] * 20
+    eyes = None
+    clicks = []
+    for i, state in enumerate(states):
+        now = i / FPS
+        if use_gate:
+            if detector.eye_closed:
+                gate.reset()
+            if not gate.should_infer(_frame(*state), [FACE_BOX], eyes=eyes):
+                continue
+        landmarks = _landmarks(*state)
+        eyes = eye_corners(landmarks)
+        if detector.process(landmarks, 1, 1, now):
+            clicks.append(round(now * FPS))
+    return clicks, gate
+
+
+def test_gated_wink_clicks_on_the_same_frame_as_ungated():
+    ungated, _ = _run_wink(use_gate=False)
+    gated, gate = _run_wink(use_gate=True)
+    assert ungated == [29]
+    assert gated == ungated
+    assert gate.gated > 0
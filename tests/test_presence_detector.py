@@ -0,0 +1,47 @@
+import core.presence_detector as presence_detector
+from core.presence_detector import LowPowerMode
+from core.state import SystemState
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_mode(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(presence_detector.time, "time", clock)
+    return LowPowerMode(None, off_idle_timeout=10.0), clock
+
+
+def test_off_with_gestures_on_sleeps_once_nobody_is_in_view(monkeypatch):
+    mode, clock = make_mode(monkeypatch)
+    for _ in range(3):
+        clock.now += 5.0
+        assert not mode.update(SystemState.OFF, hands_needed=True, face_detected=True)
+
+    assert not mode.update(SystemState.OFF, hands_needed=True, face_detected=False)
+    clock.now += 10.0
+    assert mode.update(SystemState.OFF, hands_needed=True, face_detected=False)
+
+    # Presence check sees the face again: hands come back
+    clock.now += 0.2
+    assert not mode.update(SystemState.OFF, hands_needed=True, face_detected=True)
+
+
+def test_off_without_hand_features_sleeps_even_with_a_face(monkeypatch):
+    mode, clock = make_mode(monkeypatch)
+    mode.update(SystemState.OFF, hands_needed=False, face_detected=True)
+    clock.now += 10.0
+    assert mode.update(SystemState.OFF, hands_needed=False, face_detected=True)
+    clock.now += 10.0
+    assert mode.update(SystemState.OFF, hands_needed=False, face_detected=True)
+
+
+def test_paused_engages_immediately_and_on_leaves(monkeypatch):
+    mode, _ = make_mode(monkeypatch)
+    assert mode.update(SystemState.PAUSED, hands_needed=True)
+    assert not mode.update(SystemState.ON, hands_needed=True, face_detected=True)
@@ -0,0 +1,52 @@
+from core.quality_controller import QualityController, DEFAULT_LADDER
+
+
+class FaceDetector:
+    def __init__(self):
+        self.refine_landmarks = None
+        self.input_scale = None
+
+    def configure(self, refine_landmarks=None, input_scale=None):
+        self.refine_landmarks = refine_landmarks
+        self.input_scale = input_scale
+
+
+def overload(controller, frames):
+    for _ in range(frames):
+        controller.record(controller.budget * 2)
+
+
+def test_steps_down_when_over_budget():
+    controller = QualityController(target_fps=20, window=10)
+    overload(controller, 10)
+    assert controller.level_index == 1
+    # Cooldown: no further step for a window
+    overload(controller, 10)
+    assert controller.level_index == 1
+    overload(controller, 10)
+    assert controller.level_index == 2
+
+
+def test_steps_up_only_after_sustained_headroom():
+    controller = QualityController(target_fps=20, window=10, start_level=2, upgrade_hold=20)
+    for _ in range(28):
+        controller.record(controller.budget * 0.3)
+    assert controller.level_index == 2
+    controller.record(controller.budget * 0.3)
+    assert controller.level_index == 1
+
+
+def test_pinned_iris_survives_degradation():
+    face = FaceDetector()
+    controller = QualityController(face_detector=face, target_fps=20, window=10)
+    assert face.refine_landmarks is True
+
+    controller.pin(refine_landmarks=True)
+    for _ in range(len(DEFAULT_LADDER) * 2):
+        overload(controller, 10)
+    assert controller.level.name == DEFAULT_LADDER[-1].name
+    assert face.refine_landmarks is True
+    assert face.input_scale == DEFAULT_LADDER[-1].input_scale
+
+    controller.pin(refine_landmarks=None)
+    assert face.refine_landmarks is False
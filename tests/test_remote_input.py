@@ -0,0 +1,119 @@
+import threading
+import time
+
+import pytest
+
+from core.screen_geometry import Monitor, VirtualDesktop
+from remote_input.agent import LoopbackAgent
+from remote_input.backend import RemoteInputBackend
+from remote_input.protocol import (
+    HEADER, SEQ_MODULO, MessageReader, MessageType, ProtocolError, encode,
+    parse_address, split_text,
+)
+
+
+@pytest.mark.parametrize("msg_type, args", [
+    (MessageType.AUTH, ("sécret",)),
+    (MessageType.MOVE, (-1920, 1080)),
+    (MessageType.CLICK, ("right",)),
+    (MessageType.SCROLL, (-3,)),
+    (MessageType.HOTKEY, ("ctrl", "shift", "t")),
+    (MessageType.PRESS, ("enter",)),
+    (MessageType.WRITE, ("héllo wörld",)),
+    (MessageType.PING, (12.5,)),
+    (MessageType.PONG, (12.5, 41)),
+])
+def test_messages_round_trip(msg_type, args):
+    assert MessageReader().feed(encode(msg_type, 7, *args)) == [(msg_type, 7, args)]
+
+
+def test_move_is_fifteen_bytes():
+    assert len(encode(MessageType.MOVE, 1, 10, 20)) == 15
+
+
+def test_hello_carries_monitor_layout():
+    desktop = VirtualDesktop([Monitor(0, 0, 3840, 2160, 2.0, primary=True),
+                              Monitor(3840, 0, 1920, 1080)])
+    [(msg_type, seq, (received,))] = MessageReader().feed(encode(MessageType.HELLO, 0, desktop))
+    assert msg_type == MessageType.HELLO
+    assert [(m.x, m.width, m.scale, m.primary) for m in received.monitors] == [
+        (0, 3840, 2.0, True), (3840, 1920, 1.0, False)]
+
+
+def test_reader_handles_partial_and_batched_input():
+    data = b"".join(encode(MessageType.MOVE, seq, seq, seq) for seq in range(1, 4))
+    reader = MessageReader()
+    messages = []
+    for i in range(0, len(data), 4):
+        messages += reader.feed(data[i:i + 4])
+    assert [seq for _, seq, _ in messages] == [1, 2, 3]
+    assert not reader.buffer
+
+
+def test_sequence_number_wraps():
+    [(_, seq, _)] = MessageReader().feed(encode(MessageType.CLICK, SEQ_MODULO + 5))
+    assert seq == 5
+
+
+def test_unknown_type_and_bad_payload_are_rejected():
+    with pytest.raises(ProtocolError, match="Unknown"):
+        MessageReader().feed(HEADER.pack(0, 200, 1))
+    with pytest.raises(ProtocolError, match="MOVE"):
+        MessageReader().feed(HEADER.pack(2, MessageType.MOVE, 1) + b"\0\0")
+
+
+def test_split_text_respects_utf8_size():
+    pieces = split_text("aé" * 5, limit=4)
+    assert "".join(pieces) == "aé" * 5
+    assert all(len(p.encode("utf-8")) <= 4 for p in pieces)
+
+
+def test_parse_address():
+    assert parse_address("tcp://kiosk:9000") == ("tcp", ("kiosk", 9000))
+    assert parse_address("kiosk") == ("tcp", ("kiosk", 7345))
+    assert parse_address("unix:///run/agent.sock") == ("unix", "/run/agent.sock")
+    with pytest.raises(ValueError):
+        parse_address("unix://")
+
+
+def _offline_backend():
+    # Queueing state only: no connection and no sender thread
+    backend = RemoteInputBackend.__new__(RemoteInputBackend)
+    backend._cond = threading.Condition()
+    backend._events = []
+    backend._pending_move = None
+    backend._last_move = None
+    backend.coalesced_moves = 0
+    return backend
+
+
+def test_moves_coalesce_and_flush_before_discrete_events():
+    backend = _offline_backend()
+    backend.move_to(1, 1)
+    backend.move_to(2, 2)
+    backend.move_to(2, 2)
+    backend.click()
+    backend.move_to(3, 3)
+
+    assert backend.coalesced_moves == 1
+    assert backend._events == [(MessageType.MOVE, (2, 2)), (MessageType.CLICK, ("left",))]
+    assert backend._pending_move == (3, 3)
+
+
+def test_loopback_applies_events_in_order_without_gaps():
+    with LoopbackAgent() as agent:
+        backend = RemoteInputBackend(agent.address)
+        backend.move_to(5, 5)
+        backend.click()
+        backend.hotkey("ctrl", "c")
+        backend.write("hi")
+        backend.close()
+
+        deadline = time.monotonic() + 2.0
+        while agent.applied < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    kinds = [kind for _, kind, _ in agent.backend.events]
+    assert kinds == ["move", "click", "hotkey", "write"]
+    assert agent.sequence_gaps == 0
+    assert backend.seq == agent.received
@@ -0,0 +1,44 @@
+import pytest
+
+from core.screen_geometry import Monitor, VirtualDesktop, os_scale_factor
+
+
+def test_parse_layout_with_offsets_and_scale():
+    desktop = VirtualDesktop.parse("3840x2160+0+0@2, 1920x1080+3840+540")
+    first, second = desktop.monitors
+    assert (first.width, first.height, first.scale, first.primary) == (3840, 2160, 2.0, True)
+    assert (second.x, second.y, second.scale, second.primary) == (3840, 540, 1.0, False)
+    assert desktop.primary is first
+    assert (desktop.left, desktop.top, desktop.width, desktop.height) == (0, 0, 5760, 2160)
+
+
+def test_parse_without_offset_defaults_to_origin():
+    desktop = VirtualDesktop.parse("1280x720")
+    assert (desktop.monitors[0].x, desktop.monitors[0].y) == (0, 0)
+
+
+@pytest.mark.parametrize("spec", ["1920", "axb+0+0", "1920x1080+0", "1920x1080+0+0@x"])
+def test_parse_rejects_malformed_entries(spec):
+    with pytest.raises(ValueError):
+        VirtualDesktop.parse(spec)
+
+
+def test_clamp_moves_dead_space_onto_nearest_monitor():
+    desktop = VirtualDesktop.parse("1920x1080+0+0,1280x1024+1920+0")
+    # Below the smaller right-hand monitor: not on any display
+    assert desktop.monitor_at(2500, 1060).name == "display2"
+    assert desktop.clamp(2500, 1060, margin=10) == (2500, 1013)
+    assert desktop.clamp(-50, 500) == (0, 500)
+
+
+def test_monitor_contains_is_half_open():
+    m = Monitor(0, 0, 100, 50)
+    assert m.contains(99, 49) and not m.contains(100, 0)
+
+
+def test_os_scale_factor_reads_desktop_setting(monkeypatch):
+    monkeypatch.delenv("QT_SCALE_FACTOR", raising=False)
+    monkeypatch.setenv("GDK_SCALE", "2")
+    assert os_scale_factor(0, 0) == 2.0
+    monkeypatch.setenv("GDK_SCALE", "bogus")
+    assert os_scale_factor(0, 0) == 1.0
@@ -0,0 +1,99 @@
+import asyncio
+
+from core.stream_scheduler import FairScheduler
+from utils.input_backend import RecordingBackend
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_saturated_pool_serves_streams_round_robin():
+    async def scenario():
+        scheduler = FairScheduler()
+        for name in "abc":
+            scheduler.add_stream(name)
+        served = []
+        for _ in range(6):
+            for name in "abc":
+                if scheduler.slots[name] is None:
+                    await scheduler.put(name, name)
+            stream, _ = await scheduler.get("w")
+            served.append(stream)
+            await scheduler.done("w", stream)
+        return served
+
+    served = run(scenario())
+    assert served == ["a", "b", "c", "a", "b", "c"]
+
+
+def test_newer_frame_replaces_pending_one():
+    async def scenario():
+        scheduler = FairScheduler()
+        scheduler.add_stream("a")
+        await scheduler.put("a", 1)
+        await scheduler.put("a", 2)
+        return scheduler, await scheduler.get("w")
+
+    scheduler, job = run(scenario())
+    assert job == ("a", 2)
+    assert scheduler.dropped["a"] == 1
+
+
+def test_stream_in_flight_is_not_dispatched_twice():
+    async def scenario():
+        scheduler = FairScheduler()
+        scheduler.add_stream("a")
+        await scheduler.put("a", 1)
+        first = await scheduler.get("w1")
+        await scheduler.put("a", 2)
+
+        second = asyncio.ensure_future(scheduler.get("w2"))
+        await asyncio.sleep(0.01)
+        blocked = not second.done()
+        await scheduler.done("w1", "a")
+        return first, blocked, await asyncio.wait_for(second, 1.0)
+
+    first, blocked, second = run(scenario())
+    assert first == ("a", 1)
+    assert blocked
+    assert second == ("a", 2)
+
+
+def test_any_free_worker_takes_any_stream():
+    async def scenario():
+        scheduler = FairScheduler()
+        for name in "ab":
+            scheduler.add_stream(name)
+        served = []
+        for worker in ("0", "0", "1", "1"):
+            for name in "ab":
+                if scheduler.slots[name] is None and name not in scheduler.in_flight:
+                    await scheduler.put(name, name)
+            stream, _ = await scheduler.get(worker)
+            served.append((worker, stream))
+            await scheduler.done(worker, stream)
+        return served
+
+    assert run(scenario()) == [("0", "a"), ("0", "b"), ("1", "a"), ("1", "b")]
+
+
+def test_close_drains_then_returns_none():
+    async def scenario():
+        scheduler = FairScheduler()
+        scheduler.add_stream("a")
+        await scheduler.put("a", 1)
+        await scheduler.close()
+        return await scheduler.get("w"), await scheduler.get("w")
+
+    assert run(scenario()) == (("a", 1), None)
+
+
+def test_bounded_recording_backend_keeps_counts():
+    backend = RecordingBackend(max_events=3)
+    for i in range(10):
+        backend.move_to(i, i)
+    backend.click()
+    assert len(backend.events) == 3
+    assert backend.counts["move"] == 10
+    assert backend.counts["click"] == 1
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from utils.streaming_quantile import StreamingQuantile
+
+
+def test_estimates_track_exact_quantiles():
+    rng = np.random.default_rng(0)
+    samples = np.column_stack([rng.normal(0.3, 0.02, 5000),
+                               rng.uniform(0.0, 1.0, 5000),
+                               rng.normal(0.3, 0.02, 5000)])
+    estimator = StreamingQuantile([0.5, 0.9, 0.05], streams=3)
+    for x in samples:
+        estimator.update(x)
+
+    exact = [np.quantile(samples[:, 0], 0.5), np.quantile(samples[:, 1], 0.9),
+             np.quantile(samples[:, 2], 0.05)]
+    assert estimator.value() == pytest.approx(exact, abs=0.01)
+
+
+def test_no_estimate_before_five_samples():
+    estimator = StreamingQuantile(0.5)
+    for x in range(4):
+        estimator.update(x)
+    assert not estimator.ready
+    assert estimator.value() is None
+    estimator.update(4)
+    assert estimator.value()[0] == 2
+
+
+def test_reset_forgets_samples():
+    estimator = StreamingQuantile(0.5)
+    for x in range(10):
+        estimator.update(x)
+    estimator.reset()
+    assert estimator.value() is None
+
+
+@pytest.mark.parametrize("p", [0.0, 1.0, [0.5, 1.2]])
+def test_quantile_must_be_inside_unit_interval(p):
+    with pytest.raises(ValueError):
+        StreamingQuantile(p, streams=2)
@@ -0,0 +1,56 @@
+import json
+
+import pytest
+
+from utils.tuning import TuningConfig, TuningWatcher
+
+
+def test_missing_keys_keep_defaults():
+    config = TuningConfig.from_dict({"cursor": {"sensitivity_x": 30}})
+    assert config.cursor.sensitivity_x == 30.0
+    assert config.cursor.sensitivity_y == TuningConfig().cursor.sensitivity_y
+    assert config.blink == TuningConfig().blink
+
+
+@pytest.mark.parametrize("data, message", [
+    ({"cursor": {"sensitivity_x": 0.5}}, "outside"),
+    ({"cursor": {"sensitivity_x": 91}}, "outside"),
+    ({"blink": {"eye_closed_threshold": 0.6}}, "outside"),
+    ({"cursor": {"filter_length": 2.5}}, "integer"),
+    ({"cursor": {"sensitivity_x": True}}, "number"),
+    ({"cursor": {"sensitivity_x": "20"}}, "number"),
+    ({"cursor": {"speed": 1}}, "unknown key"),
+    ({"mouse": {}}, "unknown section"),
+    ({"gestures": {"pinch_in_threshold": 0.1, "pinch_out_threshold": 0.05}},
+     "below"),
+])
+def test_invalid_values_are_rejected(data, message):
+    with pytest.raises(ValueError, match=message):
+        TuningConfig.from_dict(data)
+
+
+def test_range_bounds_are_inclusive():
+    config = TuningConfig.from_dict({"cursor": {"sensitivity_x": 1.0, "filter_length": 60}})
+    assert config.cursor.sensitivity_x == 1.0
+    assert config.cursor.filter_length == 60
+
+
+def test_rejected_reload_keeps_previous_values(tmp_path):
+    class Blink:
+        EYE_CLOSED_THRESHOLD = 0.2
+        BLINK_DURATION_THRESHOLD = 0.3
+
+    path = tmp_path / "tuning.json"
+    blink = Blink()
+    watcher = TuningWatcher(str(path), {"blink_detector": blink})
+
+    path.write_text(json.dumps({"blink": {"eye_closed_threshold": 0.25}}))
+    assert watcher.reload()
+    assert blink.EYE_CLOSED_THRESHOLD == 0.25
+
+    path.write_text(json.dumps({"blink": {"eye_closed_threshold": 0.25,
+                                          "blink_duration_threshold": 99}}))
+    assert not watcher.reload()
+    assert not watcher.status_ok
+    assert blink.EYE_CLOSED_THRESHOLD == 0.25
+    assert blink.BLINK_DURATION_THRESHOLD == 0.3
@@ -0,0 +1,17 @@
+import pytest
+
+from benchmarks.typing_simulator import TypingSimulator, main
+
+
+def test_mixed_phrase_uses_the_symbol_dial():
+    result = TypingSimulator(seed=1).run("Hi, you 2!")
+    assert result["completed"]
+    assert result["typed"] == "HI, YOU 2!"
+    assert result["unreachable"] is None
+
+
+def test_unsupported_characters_are_rejected_up_front():
+    with pytest.raises(ValueError, match=r"'\$'"):
+        TypingSimulator().run("COST $5")
+    with pytest.raises(SystemExit):
+        main(["--phrase", "COST $5", "--trials", "1"])
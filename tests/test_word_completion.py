@@ -0,0 +1,53 @@
+import os
+
+from keyboard_control.word_completion import CompletionTrie, WordTracker
+
+
+WORDS = ["the", "there", "then", "this", "that", "they", "them", "theme", "café"]
+
+
+def test_completions_are_ranked_by_frequency():
+    trie = CompletionTrie.build(WORDS)
+    assert trie.complete("th", k=3) == ["the", "there", "then"]
+    assert trie.complete("the", k=10) == ["there", "then", "they", "them", "theme"]
+    assert trie.complete("thi") == ["this"]
+
+
+def test_unknown_or_empty_prefix_has_no_completions():
+    trie = CompletionTrie.build(WORDS)
+    assert trie.complete("x") == []
+    assert trie.complete("thex") == []
+    assert trie.complete("") == []
+    assert trie.complete("this") == []
+
+
+def test_duplicates_keep_first_rank_and_utf8_words_round_trip():
+    trie = CompletionTrie.build(["b", "a", "b", "café", "cafe"])
+    assert len(trie) == 4
+    assert trie.complete("caf") == ["café", "cafe"]
+
+
+def test_cached_trie_matches_built_trie(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("rare\t1\ncommon\t100\n# comment\nreal\t50\n")
+
+    built = CompletionTrie.load(str(path))
+    assert os.path.exists(str(path) + ".trie")
+    cached = CompletionTrie.load(str(path))
+    assert built.complete("r") == cached.complete("r") == ["real", "rare"]
+    assert cached.complete("c") == ["common"]
+
+
+def test_word_tracker_accept_returns_remaining_suffix():
+    tracker = WordTracker(CompletionTrie.build(WORDS), k=2)
+    for ch in "The":
+        tracker.type_char(ch)
+    assert tracker.completions == ["there", "then"]
+
+    assert tracker.accept(1) == "n "
+    assert tracker.current_word == ""
+    assert tracker.accept(0) is None
+
+    tracker.type_char("t")
+    tracker.type_char(" ")
+    assert tracker.current_word == ""
@@ -0,0 +1,73 @@
+import json
+import os
+import platform
+import time
+
+
+def cache_dir():
+    """Per-user cache directory (override with TOUCHLESS_CACHE_DIR)."""
+    return os.environ.get("TOUCHLESS_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".touchless"
+    )
+
+
+def host_fingerprint(**extra):
+    """
+    Identify this machine and software stack, so cached measurements are
+    thrown away when either changes.
+
+    Args:
+        **extra: Additional key/values the cached result depends on
+    """
+    try:
+        import mediapipe
+        mp_version = getattr(mediapipe, "__version__", "unknown")
+    except ImportError:
+        mp_version = None
+    try:
+        import cv2
+        cv_version = cv2.__version__
+    except ImportError:
+        cv_version = None
+
+    fingerprint = {
+        "host": platform.node(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "system": platform.system(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "mediapipe": mp_version,
+        "opencv": cv_version,
+    }
+    fingerprint.update(extra)
+    return fingerprint
+
+
+def load(name, fingerprint):
+    """
+    Return the cached payload stored under `name`, or None if it is
+    missing, unreadable or was recorded for a different fingerprint.
+    """
+    path = os.path.join(cache_dir(), name + ".json")
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if entry.get("fingerprint") != fingerprint:
+        return None
+    return entry.get("data")
+
+
+def store(name, fingerprint, data):
+    """Cache a JSON-serialisable payload under `name` for this fingerprint."""
+    directory = cache_dir()
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, name + ".json")
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"fingerprint": fingerprint, "created": time.time(), "data": data},
+                  f, indent=2)
+    os.replace(tmp, path)
+    return path
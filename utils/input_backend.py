@@ -0,0 +1,98 @@
+import time
+from collections import deque
+
+
+class PyAutoGUIBackend:
+    """
+    Sends input events to the local desktop through PyAutoGUI.
+    pyautogui is imported on first use so headless tools can run without a display.
+    """
+
+    def __init__(self):
+        self._pyautogui = None
+
+    @property
+    def pyautogui(self):
+        if self._pyautogui is None:
+            import pyautogui
+            self._pyautogui = pyautogui
+        return self._pyautogui
+
+    def move_to(self, x, y):
+        self.pyautogui.moveTo(x, y)
+
+    def click(self, button="left"):
+        self.pyautogui.click(button=button)
+
+    def scroll(self, amount):
+        self.pyautogui.scroll(amount)
+
+    def hotkey(self, *keys):
+        self.pyautogui.hotkey(*keys)
+
+    def press(self, key):
+        self.pyautogui.press(key)
+
+    def write(self, text):
+        self.pyautogui.write(text)
+
+    def screen_size(self):
+        return tuple(self.pyautogui.size())
+
+
+class RecordingBackend:
+    """
+    Records input events instead of performing them.
+    Used by simulators, benchmarks and tests.
+
+    Long-running sinks pass max_events to keep only the newest events;
+    counts (events per kind) covers the whole run either way.
+    """
+
+    def __init__(self, clock=time.time, screen_size=(1920, 1080), max_events=None):
+        self.clock = clock
+        self.size = screen_size
+        # (timestamp, kind, args)
+        self.events = [] if max_events is None else deque(maxlen=max_events)
+        self.counts = {}
+
+    def _record(self, kind, *args):
+        self.events.append((self.clock(), kind, args))
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+
+    def move_to(self, x, y):
+        self._record("move", x, y)
+
+    def click(self, button="left"):
+        self._record("click", button)
+
+    def scroll(self, amount):
+        self._record("scroll", amount)
+
+    def hotkey(self, *keys):
+        self._record("hotkey", *keys)
+
+    def press(self, key):
+        self._record("press", key)
+
+    def write(self, text):
+        self._record("write", text)
+
+    def screen_size(self):
+        return self.size
+
+    def typed_text(self):
+        """Replay write/space/backspace events into the resulting text."""
+        text = []
+        for _, kind, args in self.events:
+            if kind == "write":
+                text.extend(args[0])
+            elif kind == "press" and args[0] == "space":
+                text.append(" ")
+            elif kind == "press" and args[0] == "backspace" and text:
+                text.pop()
+        return "".join(text)
+
+    def clear(self):
+        self.events.clear()
+        self.counts.clear()
@@ -0,0 +1,192 @@
+import math
+
+import numpy as np
+
+from utils.landmarks import landmarks_to_array
+
+
+class LandmarkHistory:
+    """
+    Fixed-size history of landmark arrays (hand: 21 points, face: 468)
+    with their capture timestamps.
+
+    Storage is preallocated and every sample is written twice, at i and
+    i + capacity, so the last n samples are always one contiguous slice:
+    append is O(1) and window queries are views, never copies. Velocity
+    and acceleration are least-squares fits over a time window, computed
+    as one weighted sum over the window (a matrix-vector product), so
+    they are robust to jitter and uneven frame intervals.
+
+    Query results are written into buffers owned by the history and are
+    overwritten by the next query of the same kind; copy them to keep
+    them.
+    """
+
+    def __init__(self, points, seconds=2.0, rate=60, dims=3):
+        """
+        Args:
+            points: Landmarks per sample
+            seconds: History length at the expected frame rate
+            rate: Highest expected frame rate (sizes the buffer)
+            dims: Coordinates per landmark
+        """
+        self.points = points
+        self.dims = dims
+        self.capacity = max(4, int(math.ceil(seconds * rate)))
+        self._data = np.zeros((2 * self.capacity, points, dims), dtype=np.float32)
+        self._times = np.zeros(2 * self.capacity, dtype=np.float64)
+        self._next = 0       # Slot the next sample goes to
+        self.count = 0
+
+        # Scratch space for the fits. Times stay float64 (epoch seconds);
+        # the weights match the landmarks' float32 so np.dot does not cast
+        self._centred = np.zeros(self.capacity, dtype=np.float64)
+        self._weights = np.zeros(self.capacity, dtype=np.float32)
+        self._design = np.zeros((self.capacity, 3), dtype=np.float64)
+        self._gram = np.zeros((3, 3), dtype=np.float64)
+        self._row = np.zeros(3, dtype=np.float64)
+        self._velocity = np.zeros((points, dims), dtype=np.float32)
+        self._acceleration = np.zeros((points, dims), dtype=np.float32)
+        self._displacement = np.zeros((points, dims), dtype=np.float32)
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        """Forget all samples (e.g. the hand was lost, so motion restarts)."""
+        self.count = 0
+
+    # -----------------------------------------------------
+    # Writing
+    # -----------------------------------------------------
+    def append(self, landmarks, timestamp):
+        """
+        Add one sample.
+
+        Args:
+            landmarks: (points, dims) array, or a sequence of objects with
+                x/y/z attributes (MediaPipe landmarks), copied in place
+            timestamp: Capture time in seconds; must not go backwards
+        """
+        i = self._next
+        slot = self._data[i]
+        if isinstance(landmarks, np.ndarray):
+            slot[...] = landmarks
+        else:
+            landmarks_to_array(landmarks, out=slot)
+        self._data[i + self.capacity] = slot
+        self._times[i] = self._times[i + self.capacity] = timestamp
+        self._next = (i + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    # -----------------------------------------------------
+    # Reading
+    # -----------------------------------------------------
+    def _range(self, n):
+        # The last n samples are contiguous in [end - n, end)
+        end = self._next + self.capacity
+        return end - n, end
+
+    def latest(self):
+        """(points, dims) view of the newest sample, or None when empty."""
+        if self.count == 0:
+            return None
+        return self._data[self._next + self.capacity - 1]
+
+    def latest_time(self):
+        if self.count == 0:
+            return None
+        return self._times[self._next + self.capacity - 1]
+
+    def window(self, seconds=None):
+        """
+        Samples from the last `seconds` before the newest one, oldest first.
+
+        Returns:
+            (times (n,), landmarks (n, points, dims)) views
+        """
+        start, end = self._range(self.count)
+        times = self._times[start:end]
+        if seconds is not None and self.count:
+            # Times are increasing within the window
+            start += int(np.searchsorted(times, times[-1] - seconds, side="left"))
+        return self._times[start:end], self._data[start:end]
+
+    def span(self, seconds=None):
+        """Time covered by the window (0 with fewer than two samples)."""
+        times, _ = self.window(seconds)
+        return float(times[-1] - times[0]) if len(times) > 1 else 0.0
+
+    def displacement(self, seconds=None):
+        """Newest minus oldest sample in the window, (points, dims)."""
+        _, data = self.window(seconds)
+        if len(data) < 2:
+            self._displacement.fill(0.0)
+        else:
+            np.subtract(data[-1], data[0], out=self._displacement)
+        return self._displacement
+
+    def velocity(self, seconds=0.2):
+        """
+        Average velocity over the window (units per second), the slope of
+        a least-squares line through each coordinate.
+
+        Returns:
+            (points, dims) array, zeros with fewer than two samples
+        """
+        times, data = self.window(seconds)
+        n = len(times)
+        out = self._velocity
+        if n < 2:
+            out.fill(0.0)
+            return out
+        centred = self._centred[:n]
+        np.subtract(times, times.mean(), out=centred)
+        denominator = float(np.dot(centred, centred))
+        if denominator <= 0.0:
+            out.fill(0.0)
+            return out
+        w = self._weights[:n]
+        np.divide(centred, denominator, out=w)
+        # Sum of weights is zero, so the mean position drops out
+        np.dot(w, data.reshape(n, -1), out=out.reshape(-1))
+        return out
+
+    def acceleration(self, seconds=0.3):
+        """
+        Acceleration over the window (units per second squared), twice the
+        quadratic coefficient of a least-squares parabola.
+
+        Returns:
+            (points, dims) array, zeros with fewer than three samples
+        """
+        times, data = self.window(seconds)
+        n = len(times)
+        out = self._acceleration
+        if n < 3:
+            out.fill(0.0)
+            return out
+        a = self._design[:n]
+        # Centre time for conditioning
+        np.subtract(times, times.mean(), out=a[:, 1])
+        a[:, 0] = 1.0
+        np.multiply(a[:, 1], a[:, 1], out=a[:, 2])
+        np.dot(a.T, a, out=self._gram)
+        # Last row of the inverse of the symmetric 3x3 normal matrix, by
+        # cofactors (np.linalg.inv would allocate on every call)
+        (g00, g01, g02), (_, g11, g12), (_, _, g22) = self._gram.tolist()
+        row = self._row
+        row[0] = g01 * g12 - g11 * g02
+        row[1] = g01 * g02 - g00 * g12
+        row[2] = g00 * g11 - g01 * g01
+        det = g02 * row[0] + g12 * row[1] + g22 * row[2]
+        if det <= 0.0:
+            # All samples at the same time
+            out.fill(0.0)
+            return out
+        row /= det
+        np.dot(a, row, out=self._centred[:n])
+        w = self._weights[:n]
+        np.multiply(self._centred[:n], 2.0, out=w)
+        np.dot(w, data.reshape(n, -1), out=out.reshape(-1))
+        return out
@@ -0,0 +1,55 @@
+import numpy as np
+
+
+class Point:
+    """
+    Lightweight landmark with the same x/y/z attributes as MediaPipe's
+    NormalizedLandmark, for landmarks we create or remap ourselves.
+    """
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x, y, z=0.0):
+        self.x = x
+        self.y = y
+        self.z = z
+
+    def __repr__(self):
+        return f"Point({self.x:.3f}, {self.y:.3f}, {self.z:.3f})"
+
+
+class LandmarkList:
+    """Stand-in for MediaPipe's NormalizedLandmarkList (exposes .landmark)."""
+    __slots__ = ("landmark",)
+
+    def __init__(self, points):
+        self.landmark = points
+
+    @classmethod
+    def from_array(cls, array):
+        return cls([Point(float(x), float(y), float(z)) for x, y, z in array])
+
+
+def landmarks_to_array(landmarks, out=None):
+    """
+    Copy landmark x/y/z into an (N, 3) float array.
+
+    Args:
+        landmarks: Sequence of objects with x, y, z attributes
+        out: Optional preallocated (N, 3) array to fill in place
+    """
+    n = len(landmarks)
+    if out is None:
+        out = np.empty((n, 3), dtype=np.float32)
+    for i in range(n):
+        lm = landmarks[i]
+        out[i, 0] = lm.x
+        out[i, 1] = lm.y
+        out[i, 2] = lm.z
+    return out
+
+
+def bounding_box(landmarks):
+    """Normalized (x_min, y_min, x_max, y_max) of a landmark sequence."""
+    xs = [lm.x for lm in landmarks]
+    ys = [lm.y for lm in landmarks]
+    return min(xs), min(ys), max(xs), max(ys)
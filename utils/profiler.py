@@ -0,0 +1,247 @@
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+
+
+class _NullSpan:
+    """Shared no-op context manager returned when tracing is off."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class NullTracer:
+    """Tracer used when profiling is off; every call is a no-op."""
+    enabled = False
+
+    def span(self, name, category="stage"):
+        return _NULL_SPAN
+
+    def save(self, path):
+        pass
+
+
+class _Span:
+    def __init__(self, tracer, name, category):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        self.tracer._record(self.name, self.category, self.start, end)
+        return False
+
+
+class SpanTracer:
+    """
+    Records per-stage spans as Chrome trace events.
+    Open the saved JSON in chrome://tracing or https://ui.perfetto.dev.
+    """
+    enabled = True
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.pid = os.getpid()
+        self.events = []
+        self.thread_names = {}
+
+    def span(self, name, category="stage"):
+        return _Span(self, name, category)
+
+    def _record(self, name, category, start, end):
+        thread = threading.current_thread()
+        tid = thread.native_id
+        self.thread_names.setdefault(tid, thread.name)
+        # list.append is atomic under the GIL
+        self.events.append({
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self.origin) * 1e6,
+            "dur": (end - start) * 1e6,
+            "pid": self.pid,
+            "tid": tid,
+        })
+
+    def save(self, path):
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid,
+             "args": {"name": name}}
+            for tid, name in self.thread_names.items()
+        ]
+        with open(path, "w") as f:
+            json.dump({"traceEvents": metadata + list(self.events)}, f)
+
+
+_tracer = NullTracer()
+
+
+def get_tracer():
+    """Process-wide tracer (a NullTracer unless profiling is on)."""
+    return _tracer
+
+
+def set_tracer(tracer):
+    global _tracer
+    _tracer = tracer
+
+
+class SamplingProfiler:
+    """
+    Low-overhead statistical profiler for all Python threads.
+
+    A background thread snapshots every thread's stack at a fixed
+    interval and counts identical stacks. The result is written in the
+    collapsed-stack format used by flamegraph.pl and speedscope.
+    """
+
+    def __init__(self, interval=0.005):
+        """
+        Args:
+            interval: Seconds between samples
+        """
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._sample_loop, name="sampling-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+
+    def _sample_loop(self):
+        own_id = threading.get_ident()
+        while self._running:
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(
+                        f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})"
+                    )
+                    frame = frame.f_back
+                stack.append(names.get(thread_id, str(thread_id)))
+                self.stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+            time.sleep(self.interval)
+
+    def save(self, path):
+        with open(path, "w") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class AllocationTracker:
+    """
+    Takes a tracemalloc snapshot every N frames and reports the
+    allocation sites that grew the most since the previous snapshot.
+    """
+
+    def __init__(self, interval=300, top=10, nframes=5):
+        """
+        Args:
+            interval: Frames between snapshots
+            top: Number of allocation sites reported per snapshot
+            nframes: Stack depth recorded by tracemalloc
+        """
+        self.interval = interval
+        self.top = top
+        self.nframes = nframes
+        self.frame_count = 0
+        self.previous = None
+        self.reports = []
+
+    def start(self):
+        tracemalloc.start(self.nframes)
+        self.previous = tracemalloc.take_snapshot()
+
+    def stop(self):
+        tracemalloc.stop()
+
+    def on_frame(self):
+        self.frame_count += 1
+        if self.frame_count % self.interval:
+            return
+
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+        stats = snapshot.compare_to(self.previous, "lineno")[:self.top]
+        self.previous = snapshot
+
+        lines = [f"--- frame {self.frame_count} ---"]
+        for stat in stats:
+            lines.append(str(stat))
+        self.reports.append("\n".join(lines))
+        print(f"[Profiler] Top allocator at frame {self.frame_count}: "
+              f"{stats[0] if stats else 'n/a'}")
+
+    def save(self, path):
+        with open(path, "w") as f:
+            f.write("\n\n".join(self.reports) + "\n")
+
+
+class Profiler:
+    """
+    Bundles the sampling profiler, allocation tracker and span tracer
+    behind the --profile switch of main.py.
+    """
+
+    def __init__(self, output_dir="profile_output", sample_interval=0.005,
+                 alloc_interval=300):
+        self.output_dir = output_dir
+        self.tracer = SpanTracer()
+        self.sampler = SamplingProfiler(interval=sample_interval)
+        self.allocations = AllocationTracker(interval=alloc_interval)
+
+    def start(self):
+        set_tracer(self.tracer)
+        self.allocations.start()
+        self.sampler.start()
+        print(f"[Profiler] Profiling enabled, writing to '{self.output_dir}'")
+
+    def on_frame(self):
+        self.allocations.on_frame()
+
+    def stop(self):
+        self.sampler.stop()
+        self.allocations.stop()
+        set_tracer(NullTracer())
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.sampler.save(os.path.join(self.output_dir, "stacks.collapsed"))
+        self.allocations.save(os.path.join(self.output_dir, "allocations.txt"))
+        self.tracer.save(os.path.join(self.output_dir, "trace.json"))
+        print(
+            f"[Profiler] {self.sampler.samples} samples, "
+            f"{len(self.tracer.events)} spans saved to '{self.output_dir}'"
+        )
@@ -0,0 +1,453 @@
+import os
+import threading
+import time
+from dataclasses import dataclass, asdict
+
+import numpy as np
+
+from utils import host_cache
+
+
+@dataclass(frozen=True)
+class ResourcePlan:
+    """How the process shares the CPU between OpenCV, MediaPipe and our threads."""
+    name: str
+    opencv_threads: int       # cv2.setNumThreads (None = OpenCV's default)
+    pipeline_workers: int     # Threads for blocking pipeline stages
+    pin_threads: bool         # Linux: pin threads to cores by role
+    description: str = ""
+
+
+PLANS = {
+    "stock": ResourcePlan(
+        "stock", None, 4, False,
+        "OpenCV's default thread pool, 4 pipeline workers, no pinning"),
+    "lean": ResourcePlan(
+        "lean", 1, 4, False,
+        "Single-threaded OpenCV; one worker per concurrent blocking stage "
+        "(source, face, hands, actuation)"),
+    "pinned": ResourcePlan(
+        "pinned", 1, 4, True,
+        "Like lean, with the event loop and cursor mover on their own core"),
+    "compact": ResourcePlan(
+        "compact", 2, 3, True,
+        "Two OpenCV threads, 3 workers (actuation may wait for inference), pinned"),
+}
+DEFAULT_PLAN = "stock"
+
+
+def get_plan(name):
+    try:
+        return PLANS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown resource plan '{name}' (choose from {', '.join(PLANS)})"
+        ) from None
+
+
+def can_pin():
+    """Thread pinning needs Linux and at least 3 usable cores."""
+    return hasattr(os, "sched_setaffinity") and len(os.sched_getaffinity(0)) >= 3
+
+
+# ---------------------------------------------------------
+# Per-thread CPU time (Linux /proc)
+# ---------------------------------------------------------
+_TASK_DIR = "/proc/self/task"
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+def _read_task(tid):
+    """(kernel thread name, CPU seconds) of one thread, or None if it exited."""
+    try:
+        with open(f"{_TASK_DIR}/{tid}/stat", "r") as f:
+            stat = f.read()
+    except OSError:
+        return None
+    # The name is in parentheses and may itself contain spaces or ')'
+    name = stat[stat.index("(") + 1:stat.rindex(")")]
+    fields = stat[stat.rindex(")") + 2:].split()
+    utime, stime = int(fields[11]), int(fields[12])
+    return name, (utime + stime) / _CLOCK_TICKS
+
+
+class ThreadCpuMonitor:
+    """
+    CPU time per thread of this process, read from /proc/self/task.
+
+    Python threads are reported under their threading name; threads
+    started by native code (MediaPipe graph executors, OpenCV's pool)
+    under the kernel name, e.g. 'native:mediapipe/...'. Unavailable
+    outside Linux (available is False and samples are empty).
+    """
+
+    def __init__(self):
+        self.available = os.path.isdir(_TASK_DIR)
+        self._last = {}           # tid -> CPU seconds
+        self._last_time = None
+        self.totals = {}          # name -> CPU seconds since start()
+        self.shares = {}          # name -> CPU share of one core in the last sample
+        self._started = None
+
+    @staticmethod
+    def python_threads():
+        """native thread id -> Python thread name."""
+        return {t.native_id: t.name for t in threading.enumerate() if t.native_id is not None}
+
+    def tasks(self):
+        """[(tid, name, is_python, CPU seconds)] for every live thread."""
+        if not self.available:
+            return []
+        named = self.python_threads()
+        result = []
+        for entry in os.listdir(_TASK_DIR):
+            tid = int(entry)
+            info = _read_task(tid)
+            if info is None:
+                continue
+            kernel_name, seconds = info
+            if tid in named:
+                result.append((tid, named[tid], True, seconds))
+            else:
+                result.append((tid, f"native:{kernel_name}", False, seconds))
+        return result
+
+    def start(self):
+        self._started = time.perf_counter()
+        self.totals = {}
+        self.sample()
+        self.shares = {}
+
+    def sample(self):
+        """
+        Update totals and per-thread shares since the previous sample.
+
+        Returns:
+            {thread name: share of one core} (threads with the same name
+            are summed, e.g. pool workers created and retired over time)
+        """
+        now = time.perf_counter()
+        elapsed = now - self._last_time if self._last_time is not None else None
+        current = {}
+        shares = {}
+        for tid, name, _, seconds in self.tasks():
+            current[tid] = seconds
+            if self._last_time is None:
+                used = 0.0
+            else:
+                # Threads started since the last sample count from zero
+                used = seconds - self._last.get(tid, 0.0)
+            self.totals[name] = self.totals.get(name, 0.0) + used
+            if elapsed:
+                shares[name] = shares.get(name, 0.0) + used / elapsed
+        self._last = current
+        self._last_time = now
+        self.shares = shares
+        return shares
+
+    def report(self, top=8):
+        """Threads with the most CPU time since start()."""
+        if not self.available:
+            return "Thread CPU: not available on this platform"
+        elapsed = max(time.perf_counter() - (self._started or time.perf_counter()), 1e-6)
+        ranked = sorted(self.totals.items(), key=lambda item: -item[1])
+        total = sum(self.totals.values())
+        lines = [f"Thread CPU: {total / elapsed:.0%} of one core over {elapsed:.0f}s"]
+        for name, seconds in ranked[:top]:
+            lines.append(f"  {name:<32} {seconds:7.2f}s  {seconds / elapsed:5.0%}")
+        return "\n".join(lines)
+
+
+# ---------------------------------------------------------
+# Governor
+# ---------------------------------------------------------
+class ResourceGovernor:
+    """
+    Applies a ResourcePlan to this process.
+
+    With pinning, the first usable core takes the "io" role: the main
+    thread (event loop, preview, keys), the cursor mover and other
+    light Python threads. The remaining cores take the "inference" role:
+    pipeline/server worker threads and every native thread (MediaPipe
+    graph executors, OpenCV's pool). A monitor thread samples per-thread
+    CPU time every `interval` seconds and pins threads that appeared
+    since the last sample, so graphs rebuilt by the quality controller
+    are covered as well.
+    """
+
+    # Python thread name prefixes that do heavy work
+    INFERENCE_THREADS = ("pipeline", "server")
+
+    def __init__(self, plan, interval=2.0):
+        self.plan = plan
+        self.interval = interval
+        self.monitor = ThreadCpuMonitor()
+        self.pinning = plan.pin_threads and can_pin()
+        self.cores = {}
+        if self.pinning:
+            allowed = sorted(os.sched_getaffinity(0))
+            self.cores = {"io": {allowed[0]}, "inference": set(allowed[1:])}
+        self._allowed = set(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else None
+        self._pinned = {}           # tid -> role
+        self._opencv_default = None
+        self._thread = None
+        self._stop = threading.Event()
+
+    def role_of(self, name, is_python):
+        if not is_python:
+            return "inference"
+        if name.startswith(self.INFERENCE_THREADS):
+            return "inference"
+        return "io"
+
+    def apply(self):
+        """Set OpenCV's thread count and pin the threads that exist now."""
+        import cv2
+        if self._opencv_default is None:
+            self._opencv_default = cv2.getNumThreads()
+        if self.plan.opencv_threads is not None:
+            cv2.setNumThreads(self.plan.opencv_threads)
+        self.rebalance()
+        return self
+
+    def rebalance(self):
+        """Pin threads that have not been pinned yet. Returns how many were pinned."""
+        if not self.pinning:
+            return 0
+        pinned = 0
+        live = set()
+        for tid, name, is_python, _ in self.monitor.tasks():
+            live.add(tid)
+            role = self.role_of(name, is_python)
+            if self._pinned.get(tid) == role:
+                continue
+            try:
+                os.sched_setaffinity(tid, self.cores[role])
+            except OSError:
+                continue   # Exited meanwhile
+            self._pinned[tid] = role
+            pinned += 1
+        # Thread ids are reused by the kernel
+        self._pinned = {tid: role for tid, role in self._pinned.items() if tid in live}
+        return pinned
+
+    def restore(self):
+        """Undo apply(): OpenCV's previous thread count, all cores for every thread."""
+        self.stop()
+        if self._opencv_default is not None:
+            import cv2
+            cv2.setNumThreads(self._opencv_default)
+        if self._pinned and self._allowed:
+            for tid in list(self._pinned):
+                try:
+                    os.sched_setaffinity(tid, self._allowed)
+                except OSError:
+                    pass
+        self._pinned = {}
+
+    # -----------------------------------------------------
+    # Monitor thread
+    # -----------------------------------------------------
+    def start(self):
+        """Start per-thread CPU sampling (and late pinning) in the background."""
+        self.monitor.start()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="resource-governor", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.rebalance()
+            self.monitor.sample()
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join(timeout=1.0)
+            self._thread = None
+            self.monitor.sample()
+
+    def describe(self):
+        threads = ("default" if self.plan.opencv_threads is None
+                   else str(self.plan.opencv_threads))
+        parts = [f"OpenCV threads {threads}", f"{self.plan.pipeline_workers} pipeline workers"]
+        if self.pinning:
+            parts.append(f"io cores {sorted(self.cores['io'])}, "
+                         f"inference cores {sorted(self.cores['inference'])}")
+        elif self.plan.pin_threads:
+            parts.append("pinning unavailable")
+        return ", ".join(parts)
+
+
+# ---------------------------------------------------------
+# Calibration
+# ---------------------------------------------------------
+def candidate_plans():
+    """Plans worth measuring on this machine."""
+    return [plan for plan in PLANS.values() if not plan.pin_threads or can_pin()]
+
+
+def calibration_run(governor, face, hands, frames, count=150, warmup=20):
+    """
+    Run the capture -> face | hands -> actuation -> preview shape of the live pipeline
+    on `frames` under a plan, with a cursor mover thread competing for
+    the CPU.
+
+    Returns:
+        dict with mean/p95 frame time (ms), fps, CPU share by role and the
+        number of frames where a face / a hand was found
+    """
+    import asyncio
+    import cv2
+    from core.cursor_controller import CursorController
+    from core.pipeline import ParallelStage, Pipeline, Stage
+    from utils.input_backend import RecordingBackend
+
+    cursor = CursorController(input_backend=RecordingBackend(), screen_size=(1920, 1080))
+    cursor.enable()
+    done_times = []
+    detections = {"face_frames": 0, "hand_frames": 0}
+
+    def source(ctx):
+        ctx.frame = frames[ctx.index % len(frames)].copy()
+        ctx.h, ctx.w = ctx.frame.shape[:2]
+
+    def face_stage(ctx):
+        ctx.face_result = face.process(ctx.frame)
+        detections["face_frames"] += ctx.face_result.multi_face_landmarks is not None
+
+    def hands_stage(ctx):
+        ctx.hand_result = hands.detect_hands(ctx.frame)
+        detections["hand_frames"] += ctx.hand_result.multi_hand_landmarks is not None
+
+    def actuation(ctx):
+        cursor.set_target(ctx.index % 1920, ctx.index % 1080)
+
+    def presentation(ctx):
+        cv2.resize(ctx.frame, (ctx.w // 2, ctx.h // 2), interpolation=cv2.INTER_AREA)
+        done_times.append(time.perf_counter())
+        if len(done_times) >= count + warmup:
+            ctx.stop = True
+
+    pipeline = Pipeline([
+        Stage("source", source, blocking=True),
+        ParallelStage("inference", [
+            Stage("face", face_stage, blocking=True),
+            Stage("hands", hands_stage, blocking=True),
+        ]),
+        Stage("actuation", actuation, blocking=True),
+        Stage("presentation", presentation),
+    ], max_workers=governor.plan.pipeline_workers)
+
+    governor.apply()
+    governor.start()
+    try:
+        asyncio.run(pipeline.run())
+    finally:
+        governor.stop()
+        cursor.cleanup()
+        roles = {}
+        for name, seconds in governor.monitor.totals.items():
+            role = governor.role_of(name, not name.startswith("native:"))
+            roles[role] = roles.get(role, 0.0) + seconds
+        governor.restore()
+
+    intervals = np.diff(done_times[warmup:]) * 1000.0
+    elapsed = (done_times[-1] - done_times[warmup]) if len(done_times) > warmup + 1 else 0.0
+    return {
+        "mean_ms": float(intervals.mean()) if len(intervals) else None,
+        "p95_ms": float(np.percentile(intervals, 95)) if len(intervals) else None,
+        "fps": len(intervals) / elapsed if elapsed else None,
+        "cpu_seconds": roles,
+        **detections,
+    }
+
+
+def select_plan(profile, frames=None, source=0, count=150, use_cache=True, log=print):
+    """
+    Measure every candidate plan with the profile's detectors and keep
+    the one with the lowest p95 frame time (spikes, not just the mean,
+    are what make the cursor stutter). The choice is cached per host.
+    If no face shows up in the frames the default plan is used and
+    nothing is cached.
+
+    Args:
+        profile: ModelProfile whose detectors are measured
+        frames: Calibration frames (default: read from `source`)
+        source: Camera index or video path for capture_frames()
+        count: Frames timed per plan (the frames are looped)
+        use_cache: Read a previous result for this host if there is one
+
+    Returns:
+        (ResourcePlan, {plan name: measurements}, from_cache)
+    """
+    candidates = candidate_plans()
+    fingerprint = host_cache.host_fingerprint(
+        profile=profile.name, plans=sorted(p.name for p in candidates), frames=count
+    )
+    if use_cache:
+        cached = host_cache.load("resource_plan", fingerprint)
+        if cached is not None and cached.get("plan") in PLANS:
+            return PLANS[cached["plan"]], cached.get("results", {}), True
+
+    # Imported here so that using the registry does not pull in MediaPipe
+    from core.face_detector import FaceDetector
+    from core.model_profiles import capture_frames, check_detections
+    from hand_gestures.hand_detector import HandDetector
+
+    if frames is None:
+        frames = capture_frames(source, width=profile.capture_width,
+                                height=profile.capture_height, log=log)
+    face = FaceDetector(refine_landmarks=profile.refine_landmarks,
+                        input_scale=profile.input_scale)
+    hands = HandDetector(model_complexity=profile.model_complexity,
+                         input_scale=profile.input_scale)
+
+    results = {}
+    try:
+        for plan in candidates:
+            results[plan.name] = calibration_run(ResourceGovernor(plan), face, hands, frames, count)
+            r = results[plan.name]
+            log(f"[Resource Plan] {plan.name:<7} mean={r['mean_ms']:.1f}ms "
+                f"p95={r['p95_ms']:.1f}ms ({r['fps']:.1f} fps)")
+            if not check_detections(r["face_frames"], r["hand_frames"], count,
+                                    log, tag="Resource Plan"):
+                log(f"[Resource Plan] Using '{DEFAULT_PLAN}' without caching the choice")
+                return PLANS[DEFAULT_PLAN], results, False
+    finally:
+        face.face_mesh.close()
+        hands.hands.close()
+
+    chosen = min(candidates, key=lambda p: (results[p.name]["p95_ms"], results[p.name]["mean_ms"]))
+    host_cache.store("resource_plan", fingerprint, {
+        "plan": chosen.name,
+        "results": results,
+        "options": asdict(chosen),
+    })
+    return chosen, results, False
+
+
+def main(argv=None):
+    """Calibrate and print the plan this machine would use."""
+    import argparse
+    from core.model_profiles import DEFAULT_PROFILE, PROFILES, get_profile
+
+    parser = argparse.ArgumentParser(description="Pick a CPU resource plan for this machine")
+    parser.add_argument("--model-profile", default=DEFAULT_PROFILE, choices=list(PROFILES))
+    parser.add_argument("--frames", type=int, default=150)
+    parser.add_argument("--rebenchmark", action="store_true", help="Ignore the cached choice")
+    parser.add_argument("--video", default=None,
+                        help="Recorded clip with a face to calibrate on (default: camera 0)")
+    args = parser.parse_args(argv)
+
+    plan, _, cached = select_plan(get_profile(args.model_profile), count=args.frames,
+                                  source=args.video if args.video else 0,
+                                  use_cache=not args.rebenchmark)
+    source = "cached" if cached else "measured"
+    print(f"Plan '{plan.name}' ({source}): {ResourceGovernor(plan).describe()}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,103 @@
+import numpy as np
+
+
+class StreamingQuantile:
+    """
+    P-square quantile estimates (Jain & Chlamtac) for several streams at once.
+
+    Each stream keeps five markers (minimum, p/2, p, (1+p)/2, maximum)
+    whose heights are nudged towards their ideal positions with a
+    piecewise-parabolic formula, so an estimate needs O(1) memory and
+    time per sample instead of a sorted history. The per-sample marker
+    bookkeeping of all streams is done with array operations; only the
+    few markers that drift a whole position off target are adjusted one
+    by one. A stream may track its own quantile (e.g. the median and the
+    5th percentile of the same signal).
+    """
+
+    def __init__(self, p, streams=1):
+        """
+        Args:
+            p: Quantile in (0, 1), or one per stream
+            streams: Number of independent streams
+        """
+        self.streams = streams
+        self.p = np.broadcast_to(np.asarray(p, dtype=np.float64), (streams,)).copy()
+        if np.any((self.p <= 0) | (self.p >= 1)):
+            raise ValueError(f"Quantiles must be in (0, 1), got {p}")
+        # Desired-position increments per sample
+        p_ = self.p[:, None]
+        self._step = np.concatenate(
+            [np.zeros_like(p_), p_ / 2, p_, (1 + p_) / 2, np.ones_like(p_)], axis=1
+        )
+        self._marker = np.arange(5)
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.heights = np.zeros((self.streams, 5))
+        self.positions = np.tile(np.arange(1.0, 6.0), (self.streams, 1))
+        self.desired = 1.0 + 4.0 * self._step
+
+    def update(self, x):
+        """
+        Add one sample per stream.
+
+        Args:
+            x: Scalar or (streams,) array
+        """
+        x = np.asarray(x, dtype=np.float64).reshape(-1)
+        q, n = self.heights, self.positions
+        if self.count < 5:
+            # Collect the first five samples as the initial markers
+            q[:, self.count] = x
+            self.count += 1
+            if self.count == 5:
+                q.sort(axis=1)
+            return
+
+        self.count += 1
+        # Cell of each sample, extending the extremes when it falls outside
+        np.minimum(q[:, 0], x, out=q[:, 0])
+        np.maximum(q[:, 4], x, out=q[:, 4])
+        cell = np.count_nonzero(q[:, 1:4] <= x[:, None], axis=1)
+        n += self._marker > cell[:, None]
+        self.desired += self._step
+
+        # Only markers at least one position off their target can move;
+        # those few are adjusted one by one, in marker order per stream
+        drift = self.desired[:, 1:4] - n[:, 1:4]
+        for s, i in zip(*np.nonzero(np.abs(drift) >= 1)):
+            self._adjust(q[s], n[s], i + 1, drift[s, i])
+
+    @staticmethod
+    def _adjust(q, n, i, d):
+        if d >= 1 and n[i + 1] - n[i] > 1:
+            d = 1.0
+        elif d <= -1 and n[i - 1] - n[i] < -1:
+            d = -1.0
+        else:
+            return
+        qi, ql, qr = q[i], q[i - 1], q[i + 1]
+        ni, nl, nr = n[i], n[i - 1], n[i + 1]
+        parabolic = qi + d / (nr - nl) * (
+            (ni - nl + d) * (qr - qi) / (nr - ni)
+            + (nr - ni - d) * (qi - ql) / (ni - nl)
+        )
+        if ql < parabolic < qr:
+            q[i] = parabolic
+        elif d > 0:
+            q[i] = qi + (qr - qi) / (nr - ni)
+        else:
+            q[i] = qi - (ql - qi) / (nl - ni)
+        n[i] += d
+
+    @property
+    def ready(self):
+        return self.count >= 5
+
+    def value(self):
+        """(streams,) estimates, or None before five samples."""
+        if not self.ready:
+            return None
+        return self.heights[:, 2]
@@ -0,0 +1,233 @@
+import json
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field, fields, asdict
+
+
+def _range(low, high):
+    """Field metadata for an inclusive numeric range."""
+    return {"range": (low, high)}
+
+
+@dataclass(frozen=True)
+class CursorTuning:
+    sensitivity_x: float = field(default=20.0, metadata=_range(1.0, 90.0))
+    sensitivity_y: float = field(default=10.0, metadata=_range(1.0, 90.0))
+    filter_length: int = field(default=8, metadata=_range(1, 60))
+
+
+@dataclass(frozen=True)
+class BlinkTuning:
+    eye_closed_threshold: float = field(default=0.20, metadata=_range(0.05, 0.5))
+    blink_duration_threshold: float = field(default=0.3, metadata=_range(0.05, 5.0))
+
+
+@dataclass(frozen=True)
+class GestureTuning:
+    pinch_in_threshold: float = field(default=0.03, metadata=_range(0.005, 0.3))
+    pinch_out_threshold: float = field(default=0.08, metadata=_range(0.005, 0.5))
+    action_delay: float = field(default=0.4, metadata=_range(0.0, 5.0))
+    swipe_speed: float = field(default=1.5, metadata=_range(0.2, 10.0))
+    flick_speed: float = field(default=2.0, metadata=_range(0.2, 10.0))
+    scroll_gain: float = field(default=300.0, metadata=_range(0.0, 5000.0))
+
+    def validate(self):
+        if self.pinch_in_threshold >= self.pinch_out_threshold:
+            raise ValueError("gestures.pinch_in_threshold must be below pinch_out_threshold")
+
+
+@dataclass(frozen=True)
+class KeyboardTuning:
+    pinch_threshold: float = field(default=0.06, metadata=_range(0.005, 0.3))
+    dial_smoothing: float = field(default=0.2, metadata=_range(0.01, 1.0))
+    action_delay: float = field(default=0.4, metadata=_range(0.0, 5.0))
+
+
+@dataclass(frozen=True)
+class TuningConfig:
+    """
+    All live-tunable values, grouped by component.
+    Mirrors the layout of tuning.json.
+    """
+    cursor: CursorTuning = field(default_factory=CursorTuning)
+    blink: BlinkTuning = field(default_factory=BlinkTuning)
+    gestures: GestureTuning = field(default_factory=GestureTuning)
+    keyboard: KeyboardTuning = field(default_factory=KeyboardTuning)
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Build and validate a config from parsed JSON.
+        Missing keys keep their defaults; unknown keys and wrong types
+        or out-of-range values raise ValueError.
+        """
+        if not isinstance(data, dict):
+            raise ValueError("top level must be an object")
+
+        sections = {f.name: f for f in fields(cls)}
+        unknown = set(data) - set(sections)
+        if unknown:
+            raise ValueError(f"unknown section(s): {', '.join(sorted(unknown))}")
+
+        values = {}
+        for name, section_field in sections.items():
+            section_type = section_field.default_factory
+            values[name] = _build_section(name, section_type, data.get(name, {}))
+        return cls(**values)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"invalid JSON: {e}") from None
+        return cls.from_dict(data)
+
+    def to_dict(self):
+        return asdict(self)
+
+
+def _build_section(section_name, section_type, data):
+    if not isinstance(data, dict):
+        raise ValueError(f"{section_name} must be an object")
+
+    known = {f.name: f for f in fields(section_type)}
+    unknown = set(data) - set(known)
+    if unknown:
+        raise ValueError(
+            f"unknown key(s) in {section_name}: {', '.join(sorted(unknown))}"
+        )
+
+    kwargs = {}
+    for key, value in data.items():
+        spec = known[key]
+        name = f"{section_name}.{key}"
+
+        # bool is a subclass of int, reject it explicitly
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"{name} must be a number")
+        if spec.type is int:
+            if isinstance(value, float) and not value.is_integer():
+                raise ValueError(f"{name} must be an integer")
+            value = int(value)
+        else:
+            value = float(value)
+
+        low, high = spec.metadata["range"]
+        if not low <= value <= high:
+            raise ValueError(f"{name}={value} outside [{low}, {high}]")
+        kwargs[key] = value
+
+    section = section_type(**kwargs)
+    if hasattr(section, "validate"):
+        section.validate()
+    return section
+
+
+def apply_tuning(config, cursor_controller=None, blink_detector=None,
+                 gesture_actions=None, air_keyboard=None):
+    """
+    Push a validated config into the live components.
+    Call between frames; the config is fully validated beforehand so
+    either every value is applied or none is.
+    """
+    if cursor_controller is not None:
+        c = config.cursor
+        cursor_controller.sensitivity_x = c.sensitivity_x
+        cursor_controller.sensitivity_y = c.sensitivity_y
+        if c.filter_length != cursor_controller.filter_length:
+            cursor_controller.filter_length = c.filter_length
+            cursor_controller.ray_directions = deque(
+                cursor_controller.ray_directions, maxlen=c.filter_length
+            )
+
+    if blink_detector is not None:
+        blink_detector.EYE_CLOSED_THRESHOLD = config.blink.eye_closed_threshold
+        blink_detector.BLINK_DURATION_THRESHOLD = config.blink.blink_duration_threshold
+
+    if gesture_actions is not None:
+        g = config.gestures
+        gesture_actions.pinch_in_threshold = g.pinch_in_threshold
+        gesture_actions.pinch_out_threshold = g.pinch_out_threshold
+        gesture_actions.action_delay = g.action_delay
+        if gesture_actions.motion is not None:
+            gesture_actions.motion.swipe_speed = g.swipe_speed
+            gesture_actions.motion.flick_speed = g.flick_speed
+            gesture_actions.motion.scroll_gain = g.scroll_gain
+
+    if air_keyboard is not None:
+        k = config.keyboard
+        air_keyboard.PINCH_T = k.pinch_threshold
+        air_keyboard.DIAL_SMOOTHING = k.dial_smoothing
+        air_keyboard.action_delay = k.action_delay
+
+
+class TuningWatcher:
+    """
+    Watches a tuning file and re-applies it when it changes.
+
+    poll() is cheap (one stat call at most every check_interval seconds)
+    and is meant to be called once per frame from the stage that owns
+    the tuned components.
+    """
+
+    def __init__(self, path, targets, check_interval=0.5, status_duration=5.0):
+        """
+        Args:
+            path: JSON tuning file
+            targets: Keyword arguments forwarded to apply_tuning()
+            check_interval: Seconds between modification-time checks
+            status_duration: Seconds the reload status stays on screen
+        """
+        self.path = path
+        self.targets = targets
+        self.check_interval = check_interval
+        self.status_duration = status_duration
+        self.config = None
+        self.last_mtime = None
+        self.last_check = 0.0
+        self.status = None
+        self.status_ok = True
+        self.status_time = 0.0
+
+    def poll(self):
+        """Reload if the file changed. Returns True when a new config was applied."""
+        now = time.time()
+        if now - self.last_check < self.check_interval:
+            return False
+        self.last_check = now
+
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError:
+            return False
+        if mtime == self.last_mtime:
+            return False
+        self.last_mtime = mtime
+        return self.reload()
+
+    def reload(self):
+        try:
+            config = TuningConfig.load(self.path)
+        except (OSError, ValueError) as e:
+            self._set_status(f"Tuning rejected: {e}", ok=False)
+            return False
+
+        apply_tuning(config, **self.targets)
+        self.config = config
+        self._set_status(f"Tuning applied: {os.path.basename(self.path)}", ok=True)
+        return True
+
+    def _set_status(self, text, ok):
+        self.status = text
+        self.status_ok = ok
+        self.status_time = time.time()
+        print(f"[Tuning] {text}")
+
+    def visible_status(self):
+        """(text, ok) for the on-screen overlay, or None once it has expired."""
+        if self.status is None or time.time() - self.status_time > self.status_duration:
+            return None
+        return self.status, self.status_ok